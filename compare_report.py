@@ -20,6 +20,28 @@ details.
 
 Creates a report in Excel Workbook format with all differences between two content samples
 
+Most of the content of two captures taken a day apart is identical, so when the projects are read, a hash is computed
+for each chassis, switch, and fabric object and for each subtree within them. The hash of each subtree is computed
+from the hash of each key/value pair, so the hashes form a Merkle tree. Key paths skipped in the control tables,
+_control_tables, and references back to other objects, such as _project_obj, are not included in the hash so that
+expected changes, such as time-awake, do not force a comparison. Only objects whose hashes differ are compared and,
+within those objects, subtrees whose hashes are the same in both projects are removed before the comparison.
+
+Chassis, switch, and fabric objects are independent of each other so objects that differ are compared in parallel using
+up to -workers processes.
+
+Use -series instead of -b and -c to compare all the projects in a folder. The projects are compared in order of the
+capture date stored in each project. The file modification time is only used for projects without a valid date. Each
+project is compared to the previous project and only the previous project is kept in memory. The report, -r, is a
+trend workbook with a sheet for each chassis, switch, and fabric that changed. Each row is a key that changed. The
+columns are the snapshot the key was first seen in, the snapshots it was first and last changed in, the number of
+changes, and the value of the key in each snapshot. The snapshots are identified by their capture date.
+
+Use -format jsonl to write the changes as JSON Lines instead of an Excel workbook. Each line is a change record with the
+base and compare file names, object type, object key, key path, base value, compare value, and type of change. Changes
+are written as each object is compared so that the changes can be processed while the comparison is still running. With
+-series, the changes for each pair of projects are written to the same file.
+
 **Version Control**
 
 +-----------+---------------+---------------------------------------------------------------------------------------+
@@ -41,17 +63,35 @@ Creates a report in Excel Workbook format with all differences between two conte
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.7     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 19 Oct 2026   | Adjacent control table entries with the same action are compiled into one alternation.|
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 19 Oct 2026   | Only compare chassis, switch, and fabric objects whose content hash is different.     |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.10    | 19 Oct 2026   | Added -workers. Chassis, switch, and fabric objects are compared in parallel.         |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.11    | 19 Oct 2026   | Added -series to create a trend report from all projects in a folder.                 |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.12    | 19 Oct 2026   | Added -format jsonl to stream changes to a JSON Lines file.                           |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.13    | 19 Oct 2026   | Added -xref_cache to cache cross-referenced projects. See xref_cache.py               |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '19 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.7'
+__version__ = '4.0.13'
 
 import os
+import re
+import copy
+import datetime
+import hashlib
+import json
+import concurrent.futures
 import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
 import brcdapi.file as brcdapi_file
@@ -61,10 +101,10 @@ import brcddb.brcddb_fabric as brcddb_fabric
 import brcddb.brcddb_switch as brcddb_switch
 import brcddb.brcddb_chassis as brcddb_chassis
 import brcddb.util.compare as brcddb_compare
-import brcddb.brcddb_project as brcddb_project
 import brcddb.brcddb_common as brcddb_common
 import brcddb.report.utils as report_utils
 import brcddb.app_data.report_tables as brcddb_rt
+import xref_cache
 
 _DOC_STRING = False  # Should always be False. Prohibits any code execution. Only useful for building documentation
 # _STAND_ALONE: True: Executes as a standalone module taking input from the command line. False: Does not automatically
@@ -73,12 +113,26 @@ _STAND_ALONE = True  # See note above
 
 # Input parameter definitions
 _input_d = dict(
-    b=dict(h='Required. Base project to compare against. Typically the older data. Name of input file generated by '
-             'capture.py or combine.py. ".json" is automatically appended.'),
-    c=dict(h='Required. Project to compare against. Typically the newer data. Name of input file generated by '
-             'capture.py or combine.py. ".json" is automatically appended.'),
-    r=dict(h='Required. Excel comparison report file name. ".xlsx" is automatically appended.')
+    b=dict(r=False,
+           h='Required unless -series is specified. Base project to compare against. Typically the older data. Name of '
+             'input file generated by capture.py or combine.py. ".json" is automatically appended.'),
+    c=dict(r=False,
+           h='Required unless -series is specified. Project to compare against. Typically the newer data. Name of '
+             'input file generated by capture.py or combine.py. ".json" is automatically appended.'),
+    series=dict(r=False,
+                h='Optional. Folder containing projects generated by capture.py or combine.py. Creates a trend report '
+                  'comparing each project to the previous project in order of the capture date in each project. '
+                  'Mutually exclusive with -b and -c.'),
+    r=dict(h='Required. Comparison report file name. ".xlsx", or ".jsonl" with -format jsonl, is automatically '
+             'appended.'),
+    format=dict(r=False, d='xlsx',
+                h='Optional. Report format. "xlsx": Excel workbook. "jsonl": JSON Lines. One change record per line '
+                  'written as the changes are found. The default is "xlsx".'),
+    workers=dict(r=False, d=0, t='int',
+                 h='Optional. Maximum number of processes used to compare chassis, switch, and fabric objects. The '
+                   'default, 0, uses one for each processor. 1 compares all objects in this process.'),
 )
+_input_d.update(xref_cache.parseargs_d.copy())
 _input_d.update(gen_util.parseargs_log_d.copy())
 
 _key_conv_tbl = dict()  # List of API keys converted to human-readable format for report display
@@ -215,6 +269,16 @@ _control_tables = dict(  # Keys are the objects defined in brcddb.classes
     },
     AlertObj={'/msg_tbl': dict(skip=True)},
 )
+# _compact_control_tables: Same as _control_tables except adjacent regex strings for each class with the same action are
+# combined into a single alternation. Built once in _compile_control_tables(). See _compile_control_tables()
+_compact_control_tables = dict()
+_action_d = dict()  # Memoized results from _control_action(). Key is the class name followed by the key path
+_scalar_types = (str, int, float, bool)
+_back_ref_re = re.compile(r'^_\w*_obj$')  # Attributes that refer back to other objects, such as _project_obj
+_worker_hash_d = dict()  # Key is 'b' or 'c'. Value is returned from _project_hash(). See _worker_init()
+_worker_proj_d = dict()  # Key is 'b' or 'c'. Value is the project object. Set in each worker. See _worker_init()
+_cache_folder = None  # Folder for cached projects, -xref_cache. None if projects are not cached. See _worker_init()
+_project_date_l = ('%d %b %Y %H:%M:%S', '%Y_%m_%d_%H_%M_%S')  # Formats of the date in project files
 
 _column_names = dict(
     _flags='Flag',
@@ -234,6 +298,362 @@ _column_names = dict(
 )
 
 
+def _compile_control_tables(control_tables):
+    """Combines adjacent regex strings in each control table with the same action into a single alternation.
+
+    brcddb.util.compare.compare() evaluates every regex in the control table for an object class against every key path
+    in every object of that class. Most of the entries are skip=True, so combining runs of entries with the same action
+    reduces the number of regex searches per key path. Each alternation is compiled here so that syntax errors in the
+    tables are reported before the comparison starts.
+
+    The first matching entry determines the action. Only adjacent entries are combined so the order of the entries, and
+    therefore which entry matches first, is the same as in control_tables.
+
+    :param control_tables: Control tables. See _control_tables
+    :type control_tables: dict
+    :return: Control tables in the same format as control_tables
+    :rtype: dict
+    """
+    rd = dict()
+    for class_key, control_d in control_tables.items():
+        run_l = list()  # Runs of adjacent entries with the same action. Each run is [action, regex list]
+        for regex, action in control_d.items():
+            if len(run_l) > 0 and run_l[-1][0] == action:
+                run_l[-1][1].append(regex)
+            else:
+                run_l.append([action, [regex]])
+        rd[class_key] = dict()
+        for action, regex_l in run_l:
+            regex = regex_l[0] if len(regex_l) == 1 else '|'.join(['(?:' + buf + ')' for buf in regex_l])
+            re.compile(regex)
+            rd[class_key][regex] = action
+
+    return rd
+
+
+def _control_action(class_name, path):
+    """Returns the action of the first control table entry that matches a key path. Results are memoized by key path.
+
+    :param class_name: Name of the brcddb class. See _control_tables
+    :type class_name: str
+    :param path: Key path relative to the brcddb object. For example: /brocade-fru/fan/speed
+    :type path: str
+    :return: Action from the first matching control table entry. An empty dict if no entry matches.
+    :rtype: dict
+    """
+    global _compact_control_tables, _action_d
+
+    key = class_name + path
+    r = _action_d.get(key)
+    if r is None:
+        r = dict()
+        for regex, action in _compact_control_tables.get(class_name, dict()).items():
+            if re.search(regex, path):
+                r = action
+                break
+        _action_d[key] = r
+
+    return r
+
+
+def _skip(class_name, path):
+    """Determines if a key path is skipped in the control tables
+
+    :param class_name: Name of the brcddb class. See _control_tables
+    :type class_name: str
+    :param path: Key path relative to the brcddb object. For example: /brocade-fru/fan/speed
+    :type path: str
+    :return: True if the first matching control table entry is skip=True
+    :rtype: bool
+    """
+    return bool(_control_action(class_name, path).get('skip', False))
+
+
+def _node_h(node):
+    """Returns the hash digest of a node returned from _hash_node()"""
+    return node[0] if isinstance(node, tuple) else node
+
+
+def _hash_node(obj, class_name, path, visited):
+    """Recursively hashes an object into a Merkle tree. The hash of a dict or brcddb object is the hash of its key/hash
+    pairs so the hash of each subtree only changes when something in that subtree changes.
+
+    Attributes that are back-references to other objects, such as _project_obj or _fabric_obj, are not followed so the
+    hash of an object only includes the objects it contains.
+
+    :param obj: The object to hash
+    :type obj: dict, list, tuple, str, int, float, bool, None, brcddb.classes.*Obj
+    :param class_name: Name of the brcddb class obj is in. Used with path to find the control table entry
+    :type class_name: str
+    :param path: Key path of obj relative to the brcddb object it is in
+    :type path: str
+    :param visited: IDs of brcddb objects already hashed. Prevents infinite recursion on circular references
+    :type visited: set
+    :return: For brcddb objects and dicts that contain brcddb objects, a tuple of the hash digest and a dict whose keys
+             are the attribute or dict keys and whose values are the nodes for each subtree. Otherwise, the hash digest.
+    :rtype: bytes, tuple
+    """
+    global _scalar_types, _back_ref_re
+
+    h, child_d = hashlib.blake2b(digest_size=16), None
+    if isinstance(obj, dict) or hasattr(obj, '__dict__'):
+        is_obj = not isinstance(obj, dict)
+        if is_obj:  # A brcddb object. Paths in the control tables are relative to the object.
+            if id(obj) in visited:
+                h.update(('ref:' + type(obj).__name__).encode())
+                return h.digest()
+            visited.add(id(obj))
+            class_name, path, obj = type(obj).__name__, '', vars(obj)
+            h.update(class_name.encode() + b'\0')
+        child_d = dict()
+        for k in sorted(obj.keys(), key=str):
+            k_path = path + '/' + str(k)
+            if (is_obj and _back_ref_re.match(str(k))) or _skip(class_name, k_path):
+                continue
+            child_d[k] = _hash_node(obj[k], class_name, k_path, visited)
+            h.update(str(k).encode('utf-8', errors='replace') + b'\0')
+            h.update(_node_h(child_d[k]))
+        if is_obj or any(isinstance(node, tuple) for node in child_d.values()):
+            return h.digest(), child_d
+    elif isinstance(obj, (list, tuple)):
+        h.update(b'[')
+        for v in obj:
+            h.update(_node_h(_hash_node(v, class_name, path, visited)))
+    elif obj is None or isinstance(obj, _scalar_types):
+        h.update((type(obj).__name__ + ':' + str(obj)).encode('utf-8', errors='replace'))
+    else:
+        h.update(str(obj).encode('utf-8', errors='replace'))
+
+    return h.digest()
+
+
+def _prune(b_val, c_val, b_node, c_node):
+    """Returns shallow copies of two brcddb objects, or dicts of brcddb objects, with every subtree whose hash is the
+    same in both removed. Subtrees that differ are pruned the same way so compare() only descends where hashes differ.
+
+    :param b_val: Base object or dict
+    :type b_val: dict, brcddb.classes.*Obj
+    :param c_val: Compare object or dict
+    :type c_val: dict, brcddb.classes.*Obj
+    :param b_node: Node returned from _hash_node() for b_val
+    :type b_node: bytes, tuple
+    :param c_node: Node returned from _hash_node() for c_val
+    :type c_node: bytes, tuple
+    :return b_val: Pruned copy of b_val. b_val if it can't be pruned
+    :rtype b_val: dict, brcddb.classes.*Obj
+    :return c_val: Pruned copy of c_val. c_val if it can't be pruned
+    :rtype c_val: dict, brcddb.classes.*Obj
+    """
+    if not isinstance(b_node, tuple) or not isinstance(c_node, tuple) or type(b_val) is not type(c_val):
+        return b_val, c_val
+    if isinstance(b_val, dict):
+        b_r, c_r = dict(b_val), dict(c_val)
+        b_d, c_d = b_r, c_r
+    else:
+        b_r, c_r = copy.copy(b_val), copy.copy(c_val)
+        b_d, c_d = vars(b_r), vars(c_r)
+    for k, b_child in b_node[1].items():
+        c_child = c_node[1].get(k)
+        if c_child is None or k not in b_d or k not in c_d:
+            continue
+        if _node_h(b_child) == _node_h(c_child):
+            b_d.pop(k)
+            c_d.pop(k)
+        else:
+            b_d[k], c_d[k] = _prune(b_d[k], c_d[k], b_child, c_child)
+
+    return b_r, c_r
+
+
+def _project_hash(proj_obj):
+    """Hashes each chassis, switch, and fabric object and each remaining key in the project object
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :return: Keys are the keys in _main_pages and _project_obj. Values are dictionaries whose keys are the object or
+             project keys. For _main_pages, the values are the nodes returned from _hash_node(). For _project_obj, the
+             values are the hash digests.
+    :rtype: dict
+    """
+    global _main_pages
+
+    rd = dict(_project_obj=dict())
+    for k, v in vars(proj_obj).items():
+        if k in _main_pages:
+            rd[k] = dict()
+            for obj_key, obj in v.items():
+                rd[k][obj_key] = _hash_node(obj, 'ProjectObj', '/' + k + '/' + str(obj_key), set())
+        elif not _skip('ProjectObj', '/' + k):
+            rd['_project_obj'][k] = _node_h(_hash_node(v, 'ProjectObj', '/' + k, set()))
+
+    return rd
+
+
+def _worker_init(bf, cf, cache_folder):
+    """Initializes a worker process started by _compare_projects(). Reads the projects if they were not inherited.
+
+    When worker processes are forked, _worker_proj_d, _worker_hash_d, and _compact_control_tables are inherited from the
+    main process so there is nothing to do. Otherwise, the projects are read, cross-referenced, and hashed again in each
+    worker.
+
+    :param bf: Base file
+    :type bf: str
+    :param cf: Compare file
+    :type cf: str
+    :param cache_folder: Folder for cached projects. None if projects are not cached. See xref_cache.read_project()
+    :type cache_folder: str, None
+    """
+    global _worker_proj_d, _worker_hash_d, _compact_control_tables, _control_tables, _cache_folder
+
+    _cache_folder = cache_folder
+    if len(_compact_control_tables) == 0:
+        _compact_control_tables.update(_compile_control_tables(_control_tables))
+    if len(_worker_proj_d) == 0:
+        for k, file in (('b', bf), ('c', cf)):
+            _worker_proj_d[k] = xref_cache.read_project(file, _cache_folder)
+            _worker_hash_d[k] = _project_hash(_worker_proj_d[k])
+
+
+def _compare_obj(task):
+    """Compares a chassis, switch, or fabric object in the projects in _worker_proj_d. Subtrees with the same hash in
+    both projects are removed first. See _prune()
+
+    :param task: Key in _main_pages and the key of the object to compare.
+    :type task: tuple
+    :return change_count: Number of changes
+    :rtype change_count: int
+    :return change_obj: Change object returned from brcddb.util.compare.compare()
+    :rtype change_obj: dict
+    """
+    global _worker_proj_d, _worker_hash_d, _compact_control_tables
+
+    page, key = task
+    b_obj, c_obj = _prune(vars(_worker_proj_d['b'])[page][key],
+                          vars(_worker_proj_d['c'])[page][key],
+                          _worker_hash_d['b'][page][key],
+                          _worker_hash_d['c'][page][key])
+    return brcddb_compare.compare(b_obj, c_obj, brcddb_control_tbl=_compact_control_tables)
+
+
+def _jsonl_write(stream_d, rec_l):
+    """Writes change records, one JSON object per line, for -format jsonl
+
+    :param stream_d: f: Open file handle. b: Base file name. c: Compare file name.
+    :type stream_d: dict
+    :param rec_l: Change records returned from _change_records()
+    :type rec_l: list
+    """
+    for rec in rec_l:
+        stream_d['f'].write(json.dumps(dict(base_file=stream_d['b'],
+                                            compare_file=stream_d['c'],
+                                            type=rec['type'],
+                                            key=rec['key'],
+                                            path=rec['path'],
+                                            base=rec['b'],
+                                            compare=rec['c'],
+                                            change=rec['r']),
+                                       default=str) + '\n')
+    stream_d['f'].flush()
+
+
+def _add_change(change_obj, page, key, obj, stream_d):
+    """Adds a change to the change object or, when streaming, writes the change records
+
+    :param change_obj: Change object being built in _compare_projects()
+    :type change_obj: dict
+    :param page: Key in _main_pages. None for changes to the project object
+    :type page: str, None
+    :param key: Object key for pages. Otherwise, the key in the project object
+    :type key: str
+    :param obj: Change object for key
+    :type obj: dict, list
+    :param stream_d: See _jsonl_write(). If None, the change is added to change_obj
+    :type stream_d: dict, None
+    """
+    if stream_d is None:
+        if page is None:
+            change_obj[key] = obj
+        else:
+            change_obj[page][key] = obj
+    else:
+        _jsonl_write(stream_d, _change_records({key: obj} if page is None else {page: {key: obj}}))
+
+
+def _compare_projects(b_d, c_d, workers, stream_d=None):
+    """Compares two projects. Only objects whose hashes are different are compared with brcddb.util.compare.compare()
+
+    :param b_d: Base project. file: Name of the file. obj: Project object. hash_d: Returned from _project_hash()
+    :type b_d: dict
+    :param c_d: Comparison project. Same as b_d
+    :type c_d: dict
+    :param workers: Maximum number of worker processes. None uses one for each processor.
+    :type workers: int, None
+    :param stream_d: If not None, changes are written as each object is compared and are not added to change_obj. See
+                     _jsonl_write()
+    :type stream_d: dict, None
+    :return change_count: Number of changes
+    :rtype change_count: int
+    :return change_obj: Change object in the same format as returned from brcddb.util.compare.compare()
+    :rtype change_obj: dict
+    """
+    global _main_pages, _scalar_types, _worker_proj_d, _worker_hash_d, _compact_control_tables
+
+    change_count, change_obj, task_l = 0, dict(), list()
+    b_hash_d, c_hash_d = b_d['hash_d'], c_d['hash_d']
+    b_vars_d, c_vars_d = vars(b_d['obj']), vars(c_d['obj'])
+
+    # Chassis, switches, and fabrics. Objects only in one project are added or removed.
+    for page in _main_pages:
+        b_key_d, c_key_d, change_obj[page] = b_hash_d.get(page, dict()), c_hash_d.get(page, dict()), dict()
+        for key in [k for k in b_key_d if k not in c_key_d]:
+            _add_change(change_obj, page, key, dict(b=key, c=None, r='Removed'), stream_d)
+            change_count += 1
+        for key in [k for k in c_key_d if k not in b_key_d]:
+            _add_change(change_obj, page, key, dict(b=None, c=key, r='Added'), stream_d)
+            change_count += 1
+        task_l.extend([(page, key) for key in b_key_d if key in c_key_d and
+                       _node_h(b_key_d[key]) != _node_h(c_key_d[key])])
+
+    # Compare the chassis, switches, and fabrics that are different. Results are processed as they are returned.
+    # The projects and hashes are cleared when done so that with -series only the previous project is kept in memory.
+    brcdapi_log.log('Comparing ' + str(len(task_l)) + ' chassis, switch, and fabric objects', echo=True)
+    executor = None
+    _worker_proj_d.update(b=b_d['obj'], c=c_d['obj'])  # Inherited by forked worker processes
+    _worker_hash_d.update(b=b_hash_d, c=c_hash_d)
+    try:
+        if workers != 1 and len(task_l) > 1:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                              initializer=_worker_init,
+                                                              initargs=(b_d['file'], c_d['file'], _cache_folder))
+        result_i = map(_compare_obj, task_l) if executor is None else executor.map(_compare_obj, task_l)
+        for (page, key), (c, obj) in zip(task_l, result_i):
+            if c > 0:
+                _add_change(change_obj, page, key, obj, stream_d)
+                change_count += c
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        _worker_proj_d.clear()
+        _worker_hash_d.clear()
+
+    # Everything else in the project object
+    b_key_d, c_key_d = b_hash_d['_project_obj'], c_hash_d['_project_obj']
+    key_l = [k for k in b_key_d if b_key_d[k] != c_key_d.get(k)] + [k for k in c_key_d if k not in b_key_d]
+    for key in key_l:
+        b_val, c_val = b_vars_d.get(key), c_vars_d.get(key)
+        r = 'Removed' if key not in c_key_d else 'Added' if key not in b_key_d else 'Changed'
+        if r != 'Changed' or isinstance(b_val, _scalar_types) or isinstance(c_val, _scalar_types):
+            _add_change(change_obj, None, key, dict(b=b_val, c=c_val, r=r), stream_d)
+            change_count += 1
+        else:
+            c, obj = brcddb_compare.compare(b_val, c_val, brcddb_control_tbl=_compact_control_tables)
+            if c > 0:
+                _add_change(change_obj, None, key, obj, stream_d)
+                change_count += c
+
+    return change_count, change_obj
+
+
 def _format_disp(fk, obj):
     """Converts API keys to human-readable format
 
@@ -652,9 +1072,10 @@ def _switch_ts(o, k):  # Similar to _fabric_ts()
 
 
 _main_pages = dict(  # Key is in _action_table. 's': sheet name. 't': sheet title. 'n': method to return object name
-    _fabric_objs=dict(s='F_', t='Fabric Comparisons: ', n=_fabric_name, sc=_sort_null, ts=_fabric_ts),
-    _switch_objs=dict(s='S_', t='Switch Comparisons: ', n=_switch_name, sc=_sort_switch, ts=_switch_ts),
-    _chassis_objs=dict(s='C_', t='Chassis Comparisons: ', n=_chassis_name, sc=_sort_null, ts=_chassis_ts),
+    # 'o': Object type used in -series reports
+    _fabric_objs=dict(s='F_', t='Fabric Comparisons: ', n=_fabric_name, sc=_sort_null, ts=_fabric_ts, o='Fabric'),
+    _switch_objs=dict(s='S_', t='Switch Comparisons: ', n=_switch_name, sc=_sort_switch, ts=_switch_ts, o='Switch'),
+    _chassis_objs=dict(s='C_', t='Chassis Comparisons: ', n=_chassis_name, sc=_sort_null, ts=_chassis_ts, o='Chassis'),
 )
 
 
@@ -751,40 +1172,324 @@ def _new_report(c, b_proj_obj, c_proj_obj, c_obj, r_name):
     excel_util.save_report(wb, r_name)
 
 
-def pseudo_main(bf, cf, rf):
+def _read_project(d):
+    """Reads a project, builds the cross-references, and computes the hashes
+
+    :param d: file: Name of the project file. t: Command line option for error messages. obj and hash_d are added
+    :type d: dict
+    :return: Error messages. Empty if no errors
+    :rtype: list
+    """
+    ml = list()
+    try:
+        d.update(obj=xref_cache.read_project(d['file'], _cache_folder))
+        if d['obj'] is None:
+            ml.append('Error reading ' + d['file'] + ', ' + d['t'] +
+                      '. Check previous messages in the log for details.')
+        else:
+            d.update(hash_d=_project_hash(d['obj']))
+    except FileNotFoundError:
+        ml.append('File ' + d['file'] + ' not found.')
+    except FileExistsError:
+        ml.append('A folder in the path ' + d['file'] + ' does not exist.')
+    except PermissionError:
+        ml.append('Permission error reading: ' + d['file'] + '.')
+    except BaseException as e:
+        ml.append('File ' + d['file'] + ' is not a valid JSON formatted file. Error messages is:')
+        ml.append(str(type(e)) + ': ' + str(e))
+
+    return ml
+
+
+def _change_leaves(obj, path_l, rl):
+    """Recursively finds all the changes in a change object returned from brcddb.util.compare.compare()
+
+    :param obj: Change object
+    :type obj: dict, list, tuple
+    :param path_l: Keys to obj
+    :type path_l: list
+    :param rl: Running list of changes. Each change is a list: the list of keys to the change and the change dictionary
+    :type rl: list
+    """
+    if isinstance(obj, dict):
+        if 'r' in obj and ('b' in obj or 'c' in obj) and not isinstance(obj['r'], (dict, list, tuple)):
+            if obj['r'] is not None:  # Some change objects include entries that did not change
+                rl.append([path_l, obj])
+        else:
+            for k, v in obj.items():
+                _change_leaves(v, path_l + [str(k)], rl)
+    elif isinstance(obj, (list, tuple)):
+        for i in range(0, len(obj)):
+            _change_leaves(obj[i], path_l + ['[' + str(i) + ']'], rl)
+
+
+def _change_records(change_obj):
+    """Converts a change object returned from _compare_projects() into a flat list of change records
+
+    :param change_obj: Change object returned from _compare_projects()
+    :type change_obj: dict
+    :return: List of change records. Keys are: page, type, key, path, b, c, and r. page is the key in _main_pages or
+             _project_obj. type is the object type, o, in _main_pages or Project. key is the object key. For changes
+             to the project object, key is None.
+    :rtype: list
+    """
+    global _main_pages
+
+    rl, leaf_l = list(), list()
+    for page, obj in change_obj.items():
+        if page in _main_pages:
+            for key, t_obj in obj.items():
+                leaf_l = list()
+                _change_leaves(t_obj, list(), leaf_l)
+                rl.extend([dict(page=page, type=_main_pages[page]['o'], key=key, path='/'.join(path_l),
+                                b=leaf_d.get('b'), c=leaf_d.get('c'), r=leaf_d.get('r')) for path_l, leaf_d in leaf_l])
+        else:
+            leaf_l = list()
+            _change_leaves(obj, [str(page)], leaf_l)
+            rl.extend([dict(page='_project_obj', type='Project', key=None, path='/'.join(path_l),
+                            b=leaf_d.get('b'), c=leaf_d.get('c'), r=leaf_d.get('r')) for path_l, leaf_d in leaf_l])
+
+    return rl
+
+
+def _capture_date(file):
+    """Returns the date the data in a project file was captured. Used to sort the projects for -series.
+
+    Only the project date is used so the project file is read as plain JSON. The project objects and cross-references
+    are not built.
+
+    :param file: Name of the project file
+    :type file: str
+    :return: Capture date. The file modification time if the project date is missing or not in a recognized format.
+    :rtype: datetime.datetime
+    """
+    global _project_date_l
+
+    buf = None
+    try:
+        obj = brcdapi_file.read_dump(file)
+        buf = obj.get('_date') if isinstance(obj, dict) else None
+    except (OSError, ValueError):
+        pass  # Reported when the project is read in _read_project()
+    for date_format in _project_date_l:
+        try:
+            return datetime.datetime.strptime(buf, date_format)
+        except (TypeError, ValueError):
+            pass
+
+    return datetime.datetime.fromtimestamp(os.path.getmtime(file))
+
+
+def _trend_report(trend_d, snapshot_l, rf):
+    """Creates the -series trend workbook
+
+    :param trend_d: Key is the page and object key. Value is a dictionary. title: Object title. sname: Sheet name.
+                    seen: Index into snapshot_l of the first snapshot with the object. leaf_d: Key is the path. Value
+                    is a dictionary. seen: Index into snapshot_l of the first snapshot with the key. first and last:
+                    Index into snapshot_l of the first and last change. count: Number of changes. base: Value before
+                    the first change. value_d: Key is the index into snapshot_l. Value is the value in that snapshot.
+    :type trend_d: dict
+    :param snapshot_l: One dictionary for each snapshot. file: Name of the file. date: Capture date. See _capture_date()
+    :type snapshot_l: list
+    :param rf: Name of the Excel workbook file
+    :type rf: str
+    """
+    sheet_index, wb = 1, excel_util.new_report()
+    date_l = [d['date'] for d in snapshot_l]
+    hdr_l = ['Key', 'First Seen', 'First Changed', 'Last Changed', 'Changes']
+    hdr = dict(font='hdr_2', align='wrap', disp=hdr_l + date_l)
+    col_width_l = [42, 20, 20, 20, 10] + [24 for _i in range(0, len(date_l))]
+    t_content = [
+        dict(font='std', align='wrap', disp=('Snapshots', len(snapshot_l))),
+        dict(font='std', align='wrap', disp=('Objects with changes', len(trend_d))),
+        dict(),
+        dict(font='hdr_2', align='wrap', disp=('Snapshot', 'Date')),
+    ]
+    t_content.extend([dict(font='std', align='wrap', disp=(os.path.basename(d['file']), d['date']))
+                      for d in snapshot_l])
+    t_content.extend([dict(), dict(font='hdr_2', merge=4, align='wrap', disp='Objects with changes')])
+
+    for obj_d in trend_d.values():
+        content = [hdr]
+        for path, leaf_d in obj_d['leaf_d'].items():
+            value, value_l = leaf_d['base'], list()
+            for i in range(0, len(snapshot_l)):
+                value = leaf_d['value_d'].get(i, value)
+                value_l.append(value if value is None or isinstance(value, _scalar_types) else str(value))
+            disp_l = [path, date_l[leaf_d['seen']], date_l[leaf_d['first']], date_l[leaf_d['last']], leaf_d['count']]
+            content.append(dict(font='std', align='wrap', disp=disp_l + value_l))
+        buf = '_' + str(sheet_index)
+        sname = obj_d['sname'][:31-len(buf)] + buf  # Excel sheet names are limited to 31 characters
+        report_utils.title_page(wb, None, sname, sheet_index, obj_d['title'], content, col_width_l)
+        t_content.append(dict(font='link', merge=4, align='wrap', disp=obj_d['title'], hyper='#' + sname + '!A1'))
+        sheet_index += 1
+
+    report_utils.title_page(wb, None, 'Trend_Summary', 0, 'Trend Summary', t_content, (42, 24, 24, 12))
+    excel_util.save_report(wb, rf)
+
+
+def _series(folder, rf, workers, stream_d):
+    """Compares each project in a folder to the previous project and creates a trend workbook
+
+    :param folder: Name of folder with the projects
+    :type folder: str
+    :param rf: Report file
+    :type rf: str
+    :param workers: Maximum number of worker processes used to compare objects. None uses one for each processor.
+    :type workers: int, None
+    :param stream_d: If not None, the changes are written to stream_d['f'] instead of creating a trend workbook. See
+                     _jsonl_write()
+    :type stream_d: dict, None
+    :return: Exit code. See exist codes in brcddb.brcddb_common
+    :rtype: int
+    """
+    global _main_pages
+
+    # Get the projects in date order
+    file_l = list()
+    try:
+        file_l = [folder + '/' + f for f in brcdapi_file.read_directory(folder) if f.lower().endswith('.json')]
+    except FileExistsError:
+        brcdapi_log.log('Folder ' + folder + ', specified with -series, does not exist.', echo=True)
+        return brcddb_common.EXIT_STATUS_INPUT_ERROR
+    except PermissionError:
+        brcdapi_log.log('You do not have access rights to read the folder ' + folder + ' specified with -series',
+                        echo=True)
+        return brcddb_common.EXIT_STATUS_INPUT_ERROR
+    if len(file_l) < 2:
+        brcdapi_log.log('At least 2 projects are required in ' + folder + ', specified with -series.', echo=True)
+        return brcddb_common.EXIT_STATUS_INPUT_ERROR
+    brcdapi_log.log('Reading the capture date of ' + str(len(file_l)) + ' projects', echo=True)
+    date_l = sorted([(_capture_date(file), file) for file in file_l])
+
+    # Compare each project to the previous project. Only the previous project is kept.
+    trend_d, snapshot_l, prev_d = dict(), list(), None
+    for i in range(0, len(date_l)):
+        d = dict(file=date_l[i][1], t='-series')
+        ml = _read_project(d)
+        if len(ml) > 0:
+            brcdapi_log.log(ml, echo=True)
+            return brcddb_common.EXIT_STATUS_ERROR
+        snapshot_l.append(dict(file=d['file'], date=date_l[i][0].strftime('%d %b %Y %H:%M:%S')))
+        if prev_d is not None:
+            brcdapi_log.log('Comparing ' + prev_d['file'] + ' to ' + d['file'], echo=True)
+            if stream_d is not None:
+                stream_d.update(b=prev_d['file'], c=d['file'])
+                _compare_projects(prev_d, d, workers, stream_d)
+            else:
+                change_count, change_obj = _compare_projects(prev_d, d, workers)
+                for rec in _change_records(change_obj):
+                    obj_d = trend_d.get((rec['page'], rec['key']))
+                    if obj_d is None:
+                        if rec['page'] in _main_pages:
+                            p_obj = d['obj'] if rec['r'] != 'Removed' else prev_d['obj']
+                            title, sname = _main_pages[rec['page']]['ts'](p_obj, rec['key'])
+                            sname = sname.replace(' ', '_').replace(':', '').replace('-', '_')
+                        else:
+                            title, sname = 'Project', 'Project'
+                        # An object not seen before was added in this snapshot or has been in every snapshot
+                        seen = i if rec['r'] == 'Added' and rec['b'] is None and rec['path'] == '' else 0
+                        obj_d = dict(title=title, sname=sname, seen=seen, leaf_d=dict())
+                        trend_d[(rec['page'], rec['key'])] = obj_d
+                    leaf_d = obj_d['leaf_d'].get(rec['path'])
+                    if leaf_d is None:
+                        seen = i if rec['r'] == 'Added' and rec['b'] is None else obj_d['seen']
+                        leaf_d = dict(seen=seen, first=i, last=i, count=0, base=rec['b'], value_d=dict())
+                        obj_d['leaf_d'][rec['path']] = leaf_d
+                    leaf_d['last'] = i
+                    leaf_d['count'] += 1
+                    leaf_d['value_d'][i] = rec['c']
+        prev_d = d
+
+    if stream_d is not None:
+        return brcddb_common.EXIT_STATUS_OK
+    brcdapi_log.log('Writing report: ' + rf, echo=True)
+    try:
+        _trend_report(trend_d, snapshot_l, rf)
+    except (FileExistsError, FileNotFoundError):
+        brcdapi_log.log('The path, folder, does not exist: ' + rf, echo=True)
+        return brcddb_common.EXIT_STATUS_ERROR
+    except PermissionError:
+        brcdapi_log.log('Permission error writing ' + rf + '. This usually happens when the file is open.', echo=True)
+        return brcddb_common.EXIT_STATUS_ERROR
+
+    return brcddb_common.EXIT_STATUS_OK
+
+
+def pseudo_main(bf, cf, rf, workers=None, series=None, r_format='xlsx', cache_folder=None):
     """Basically the main(). Did it this way, so it can easily be used as a standalone module or called from another.
 
-    :param bf: Base file
-    :type bf: str
-    :param cf: Compare file
-    :type cf: str
+    :param bf: Base file. Ignored if series is not None
+    :type bf: str, None
+    :param cf: Compare file. Ignored if series is not None
+    :type cf: str, None
     :param rf: Report file
     :type rf: str
+    :param workers: Maximum number of worker processes used to compare objects. None uses one for each processor.
+    :type workers: int, None
+    :param series: Name of folder with projects for a trend report. See _series()
+    :type series: str, None
+    :param r_format: Report format. 'xlsx' or 'jsonl'
+    :type r_format: str
+    :param cache_folder: Folder for cached projects, -xref_cache. None to not cache projects.
+    :type cache_folder: str, None
     :return: Exit code. See exist codes in brcddb.brcddb_common
     :rtype: int
     """
-    global _generic_table_add, _key_conv_tbl, _control_tables
+    global _generic_table_add, _key_conv_tbl, _control_tables, _compact_control_tables, _cache_folder
+
+    _cache_folder = cache_folder
 
-    # Read the projects to compare and build the cross-references
+    # Compile the control tables. They are needed to compute the hashes when the projects are read.
+    if len(_compact_control_tables) == 0:
+        try:
+            _compact_control_tables.update(_compile_control_tables(_control_tables))
+        except re.error as e:
+            brcdapi_log.exception('Invalid regex in _control_tables: ' + str(e), echo=True)
+            return brcddb_common.EXIT_STATUS_ERROR
+
+    # JSON Lines output. The changes are written as they are found. The projects to compare are read before the report
+    # is opened and, if there is an error, the report is removed so that it isn't mistaken for a report with no changes.
+    if r_format == 'jsonl':
+        ec, input_file_d = brcddb_common.EXIT_STATUS_OK, dict(b=dict(file=bf, t='-b'), c=dict(file=cf, t='-c'))
+        if series is None:
+            ml = list()
+            for d in input_file_d.values():
+                ml.extend(_read_project(d))
+            if len(ml) > 0:
+                brcdapi_log.log(ml, echo=True)
+                return brcddb_common.EXIT_STATUS_ERROR
+        try:
+            with open(rf, 'w', encoding='utf-8') as f:
+                stream_d = dict(f=f, b=bf, c=cf)
+                if series is not None:
+                    ec = _series(series, rf, workers, stream_d)
+                else:
+                    brcdapi_log.log('Writing changes to: ' + rf, echo=True)
+                    c, compare_obj = _compare_projects(input_file_d['b'], input_file_d['c'], workers, stream_d)
+                    brcdapi_log.log('Total changes: ' + str(c), echo=True)
+        except (FileExistsError, FileNotFoundError):
+            brcdapi_log.log('The path, folder, does not exist: ' + rf, echo=True)
+            return brcddb_common.EXIT_STATUS_ERROR
+        except PermissionError:
+            brcdapi_log.log('Permission error writing ' + rf + '. This usually happens when the file is open.',
+                            echo=True)
+            return brcddb_common.EXIT_STATUS_ERROR
+        if ec != brcddb_common.EXIT_STATUS_OK:
+            try:
+                os.remove(rf)
+            except OSError:
+                pass
+        return ec
+
+    if series is not None:
+        return _series(series, rf, workers, None)
+
+    # Read the projects to compare, build the cross-references, and compute the hashes
     ml = list()
     input_file_d = dict(b=dict(file=bf, t='-b'), c=dict(file=cf, t='-c'))
     for d in input_file_d.values():
-        try:
-            d.update(obj=brcddb_project.read_from(d['file']))
-            if d['obj'] is None:
-                ml.append('Error reading ' + d['file'] + ', ' + d['t'] +
-                          '. Check previous messages in the log for details.')
-            else:
-                brcddb_project.build_xref(d['obj'])
-        except FileNotFoundError:
-            ml.append('File ' + d['file'] + ' not found.')
-        except FileExistsError:
-            ml.append('A folder in the path ' + d['file'] + ' does not exist.')
-        except PermissionError:
-            ml.append('Permission error reading: ' + d['file'] + '.')
-        except BaseException as e:
-            ml.append('File ' + d['file'] + ' is not a valid JSON formatted file. Error messages is:')
-            ml.append(str(type(e)) + ': ' + str(e))
+        ml.extend(_read_project(d))
     if len(ml) > 0:
         brcdapi_log.log(ml, echo=True)
         return brcddb_common.EXIT_STATUS_ERROR
@@ -807,11 +1512,7 @@ def pseudo_main(bf, cf, rf):
 
     # Compare the two projects
     brcdapi_log.log('Please wait. The comparison may take several seconds', echo=True)
-    c, compare_obj = brcddb_compare.compare(
-        input_file_d['b']['obj'],
-        input_file_d['c']['obj'],
-        brcddb_control_tbl=_control_tables
-    )
+    c, compare_obj = _compare_projects(input_file_d['b'], input_file_d['c'], workers)
 
     brcdapi_log.log('Writing report: ' + rf, echo=True)
     try:
@@ -843,20 +1544,46 @@ def _get_input():
         version_d=brcdapi_util.get_import_modules()
     )
 
+    # Validate the input
+    ec, workers_help, series_help, format_help = brcddb_common.EXIT_STATUS_OK, '', '', ''
+    if args_d['workers'] < 0:
+        workers_help = ' **ERROR** Must be >= 0'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    if args_d['series'] is None:
+        if args_d['b'] is None or args_d['c'] is None:
+            series_help = ' **ERROR** -b and -c are required if -series is not specified'
+            ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    elif args_d['b'] is not None or args_d['c'] is not None:
+        series_help = ' **ERROR** -b and -c are not permitted with -series'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    if args_d['format'] not in ('xlsx', 'jsonl'):
+        format_help = ' **ERROR** Must be xlsx or jsonl'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+
     # Command line feedback
     ml = [os.path.basename(__file__) + ', ' + __version__,
-          'Base file, -b:       ' + args_d['b'],
-          'Compare file, -c:    ' + args_d['c'],
-          'Report name, -r:     ' + args_d['r'],
-          'Log, -log:           ' + str(args_d['log']),
-          'No log, -nl:         ' + str(args_d['nl']),
-          'Suppress, -sup:      ' + str(args_d['sup']),
+          'Base file, -b:           ' + str(args_d['b']),
+          'Compare file, -c:        ' + str(args_d['c']),
+          'Series, -series:         ' + str(args_d['series']) + series_help,
+          'Report name, -r:         ' + args_d['r'],
+          'Format, -format:         ' + args_d['format'] + format_help,
+          'Workers, -workers:       ' + str(args_d['workers']) + workers_help,
+          'Xref cache, -xref_cache: ' + str(args_d['xref_cache']),
+          'Log, -log:               ' + str(args_d['log']),
+          'No log, -nl:             ' + str(args_d['nl']),
+          'Suppress, -sup:          ' + str(args_d['sup']),
           '',]
     brcdapi_log.log(ml, echo=True)
+    if ec != brcddb_common.EXIT_STATUS_OK:
+        return ec
 
-    return pseudo_main(brcdapi_file.full_file_name(args_d['b'], '.json'),
-                       brcdapi_file.full_file_name(args_d['c'], '.json'),
-                       brcdapi_file.full_file_name(args_d['r'], '.xlsx'))
+    return pseudo_main(None if args_d['b'] is None else brcdapi_file.full_file_name(args_d['b'], '.json'),
+                       None if args_d['c'] is None else brcdapi_file.full_file_name(args_d['c'], '.json'),
+                       brcdapi_file.full_file_name(args_d['r'], '.' + args_d['format']),
+                       None if args_d['workers'] == 0 else args_d['workers'],
+                       args_d['series'],
+                       args_d['format'],
+                       args_d['xref_cache'])
 
 
 ##################################################################
@@ -868,7 +1595,8 @@ if _DOC_STRING:
     print('_DOC_STRING is True. No processing')
     exit(0)
 
-if _STAND_ALONE:
+# The __name__ test keeps the worker processes started by _compare_projects() from processing the command line.
+if _STAND_ALONE and __name__ == '__main__':
     _ec = _get_input()
     brcdapi_log.close_log(['', 'Processing Complete. Exit code: ' + str(_ec)], echo=True)
     exit(_ec)
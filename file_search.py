@@ -21,6 +21,35 @@ details.
 Search files using exact, wild card, or ReGex searching. Intended for Windows where searching tools are minimal. I'm
 sure someone has a tool like this somewhere, but I couldn't find one.
 
+The search term is compiled once in each process. Files are read a line at a time rather than read into memory so only
+one line of each file being searched is in memory at a time. With -sum, reading a file stops at the first match. Files
+are searched in parallel by up to -workers processes. The results are displayed in the same order as the files to
+search.
+
+With -idx, a SQLite database is used as an inverted index of the lower case words (letters, digits, and "_") in each
+file. Files are identified in the index by their full path so the same index can be used from any directory. Before
+searching, files that are new or whose modification time or size changed are added to the index. For exact and wild
+card searches, only files that contain the words in the search term are read. A word that must start a longer word is
+found with a range lookup in the index. A word that must end, or be part of, a longer word is first looked up in the
+table of distinct words, which is much smaller than the index of words in each file. Regex searches read all the
+files. With -sum and -ic, a wild card search for a single word surrounded by "*", such as "*error*", is answered
+from the index without reading any files.
+
+Extracting text from PDF files is much slower than reading a text file. With -pdf_cache, the text extracted from each
+PDF file is saved in a cache folder the first time the PDF file is read. The name of the cache file is derived from the
+full path, size, and modification time of the PDF file so a PDF file that changes is extracted again. Since extraction
+happens when the file is searched or indexed, extraction is done in parallel by the same processes that search files.
+
++-----------+----------------------------------------------------------------------------------------------------------+
+| Table     | Columns                                                                                                  |
++===========+==========================================================================================================+
+| file      | file_id, name, mtime, size                                                                               |
++-----------+----------------------------------------------------------------------------------------------------------+
+| posting   | token, file_id. The primary key is token, file_id.                                                       |
++-----------+----------------------------------------------------------------------------------------------------------+
+| token     | token. Each distinct token in posting. Used to find tokens that end with or contain a search word.       |
++-----------+----------------------------------------------------------------------------------------------------------+
+
 **Version Control**
 
 +-----------+---------------+---------------------------------------------------------------------------------------+
@@ -28,19 +57,29 @@ sure someone has a tool like this somewhere, but I couldn't find one.
 +===========+===============+=======================================================================================+
 | 1.0.0     | xx xxx 2025   | Initial Launch                                                                        |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 1.0.1     | 19 Oct 2026   | Files are searched in parallel and read a line at a time. Added -workers.             |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 1.0.2     | 19 Oct 2026   | Added -idx, a persistent full-text index.                                             |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 1.0.3     | 19 Oct 2026   | Added -pdf_cache to cache text extracted from PDF files.                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2026 Jack Consoli'
-__date__ = 'xx xxx 2026'
+__date__ = '19 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Development'
-__version__ = '1.0.0'
+__version__ = '1.0.3'
 
 import os
 import collections
 import re
+import hashlib
+import fnmatch
+import sqlite3
+import concurrent.futures
 
 from pypdf import PdfReader
 import brcdapi.log as brcdapi_log
@@ -79,13 +118,454 @@ _input_d.update(
               'default is "wild".'),
     sub=dict(r=False, d=False, t='bool', h='Optional. If specified, include sub-directories in search.'),
     sum=dict(r=False, d=False, t='bool', h='Optional. If specified, display the file names only in the results.'),
+    workers=dict(r=False, d=0, t='int',
+                 h='Optional. Maximum number of processes used to search files. The default, 0, uses one for each '
+                   'processor. 1 searches all files in this process.'),
+    idx=dict(r=False,
+             h='Optional. Name of a full-text index database file. ".db" is automatically appended. The index is '
+               'created if it does not exist and updated with new and modified files before each search. Only files '
+               'that contain the words in an exact or wild card search term are read.'),
+    pdf_cache=dict(r=False,
+                   h='Optional. Folder used to cache the text extracted from PDF files. The folder is created if it '
+                     'does not exist. Text is extracted from a PDF file again if the PDF file size or modification '
+                     'time changes.'),
 )
 _input_d.update(gen_util.parseargs_log_d.copy())
 
 _MAX_FINDS = 500
+_worker_d = dict()  # match_f: Compiled search term. rc: Ignore comments. summary: -sum. pdf_cache: -pdf_cache
+_token_re = re.compile(r'\w+')  # Words in the full-text index, -idx
+_INDEX_VERSION = 2  # Increment when the index schema, or what is stored in it, changes. The index is rebuilt.
+_index_schema_l = (
+    'CREATE TABLE IF NOT EXISTS file (file_id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, mtime REAL NOT NULL, '
+    'size INTEGER NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS posting (token TEXT NOT NULL, file_id INTEGER NOT NULL REFERENCES file(file_id), '
+    'PRIMARY KEY (token, file_id)) WITHOUT ROWID',
+    'CREATE INDEX IF NOT EXISTS posting_file ON posting (file_id)',
+    'CREATE TABLE IF NOT EXISTS token (token TEXT PRIMARY KEY) WITHOUT ROWID',
+)
+
+
+def _compile_term(search_term, search_type, ignore_case):
+    """Compiles a search term
+
+    :param search_term: What to search for
+    :type search_term: str
+    :param search_type: Search type. See _search_type_l for valid types. "regex-m" and "regex-s" are also accepted
+    :type search_type: str
+    :param ignore_case: If True, ignore case
+    :type ignore_case: bool
+    :return: Method that takes a line and returns a truthy value if the line matches
+    :rtype: method
+    """
+    stype = search_type.replace('_', '-')
+    flags = re.IGNORECASE if ignore_case else 0
+    if stype == 'exact':
+        if ignore_case:
+            search_term = search_term.lower()
+            return lambda buf: buf.lower() == search_term
+        return lambda buf: buf == search_term
+    if stype == 'wild':
+        return re.compile(fnmatch.translate(search_term), flags).match
+    if stype == 'regex-m':
+        return re.compile(search_term, flags).match
+    return re.compile(search_term, flags).search  # regex-s
+
+
+def _cache_init(pdf_cache):
+    """Initializes a process used to index files.
+
+    :param pdf_cache: Folder for cached PDF text. None if PDF text is not cached
+    :type pdf_cache: str, None
+    """
+    global _worker_d
+
+    _worker_d.update(pdf_cache=pdf_cache)
+
 
+def _worker_init(search_term, search_type, ignore_case, ignore_comments, summary, pdf_cache=None):
+    """Initializes a process used to search files. The search term is compiled once for each process.
+
+    :param search_term: What to search for
+    :type search_term: str
+    :param search_type: Search type. See _search_type_l for valid types.
+    :type search_type: str
+    :param ignore_case: If True, ignore case
+    :type ignore_case: bool
+    :param ignore_comments: If True, ignore comments
+    :type ignore_comments: bool
+    :param summary: If True, stop reading a file at the first match
+    :type summary: bool
+    :param pdf_cache: Folder for cached PDF text. None if PDF text is not cached
+    :type pdf_cache: str, None
+    """
+    global _worker_d
+
+    _worker_d.update(match_f=_compile_term(search_term, search_type, ignore_case),
+                     rc=ignore_comments,
+                     summary=summary,
+                     pdf_cache=pdf_cache)
+
+
+def _pdf_lines(file, pdf_cache):
+    """Returns the lines of text in a PDF file. The text is read from, or saved to, the cache if pdf_cache is not None
+
+    The cache file name is a hash of the full path followed by a hash of the size and modification time. When a PDF file
+    is extracted again because it changed, cache files for previous versions of the PDF file are removed.
+
+    :param file: Name of the PDF file
+    :type file: str
+    :param pdf_cache: Folder for cached PDF text. None if PDF text is not cached
+    :type pdf_cache: str, None
+    :return: Lines of text
+    :rtype: list
+    """
+    cache_file = None
+    if pdf_cache is not None:
+        full_file, stat = os.path.abspath(file), os.stat(file)
+        path_hash = hashlib.sha256(full_file.encode('utf-8', errors='replace')).hexdigest()[0:32]
+        version_hash = hashlib.sha256((str(stat.st_size) + ' ' + str(stat.st_mtime_ns)).encode()).hexdigest()[0:16]
+        cache_file = pdf_cache + '/' + path_hash + '_' + version_hash + '.txt'
+        try:
+            with open(cache_file, 'r', encoding='utf-8', newline='\n') as f:
+                return f.read().split('\n')
+        except FileNotFoundError:
+            pass
+
+    content_l = list()
+    for page in PdfReader(file).pages:
+        content_l.extend(page.extract_text().split('\n'))
+
+    # Save the text. Not being able to save it is not an error. The text just gets extracted again next time.
+    if cache_file is not None:
+        temp_file = cache_file + '.' + str(os.getpid()) + '.tmp'
+        try:
+            os.makedirs(pdf_cache, exist_ok=True)
+            for old_file in [f for f in os.listdir(pdf_cache) if f.startswith(path_hash) and f.endswith('.txt')]:
+                os.remove(pdf_cache + '/' + old_file)
+            with open(temp_file, 'w', encoding='utf-8', errors='replace', newline='\n') as f:
+                f.write('\n'.join(content_l))
+            os.replace(temp_file, cache_file)
+        except OSError:
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+
+    return content_l
+
+
+def _read_lines(file, ignore_comments):
+    """Generator that returns the lines of a file one at a time. Blank lines are skipped.
+
+    :param file: Name of the file to read
+    :type file: str
+    :param ignore_comments: If True, remove comments. Not applied to PDF files
+    :type ignore_comments: bool
+    :return: Line of the file
+    :rtype: str
+    """
+    global _worker_d
+
+    if file.split('.')[-1].lower() == 'pdf':
+        for buf in _pdf_lines(file, _worker_d.get('pdf_cache')):
+            yield buf
+        return
+    with open(file, 'r', encoding='utf-8', errors='replace') as f:
+        for buf in f:
+            if ignore_comments and '#' in buf:
+                buf = buf[0:buf.index('#')]
+            buf = buf.rstrip('\r\n')
+            if len(buf.strip()) > 0:
+                yield buf
+
+
+def _search_file(file):
+    """Searches a file using the search term set up in _worker_init()
+
+    :param file: Name of the file to search
+    :type file: str
+    :return count: Number of matching lines. With -sum, 0 or 1
+    :rtype count: int
+    :return finds_l: Up to _MAX_FINDS matching lines. Empty with -sum
+    :rtype finds_l: list
+    :return ml: Error messages for the log
+    :rtype ml: list
+    """
+    global _worker_d, _MAX_FINDS
+
+    match_f, summary, count, finds_l, ml = _worker_d['match_f'], _worker_d['summary'], 0, list(), list()
+    try:
+        for buf in _read_lines(file, _worker_d['rc']):
+            if match_f(buf):
+                count += 1
+                if summary:
+                    break
+                if len(finds_l) < _MAX_FINDS:
+                    finds_l.append(buf)
+    except (FileNotFoundError, FileExistsError, PermissionError):
+        pass
+    except PdfReadError:
+        ml.append('Error reading : ' + file + '. Skipped')
+    except Exception as e:
+        ml.extend(['Unknown error: ' + str(e), '  while processing ' + file])
+
+    return count, finds_l, ml
+
+
+def _map(func, item_l, workers, initializer=None, initargs=()):
+    """Generator that returns func(item) for each item in item_l, in order. A process pool is used when workers != 1.
+
+    :param func: Method to call for each item
+    :type func: method
+    :param item_l: Items to pass to func
+    :type item_l: list
+    :param workers: Maximum number of processes. None uses one for each processor.
+    :type workers: int, None
+    :param initializer: Method called once in each process, or in this process if a process pool is not used
+    :type initializer: method, None
+    :param initargs: Arguments passed to initializer
+    :type initargs: tuple
+    :return: Return value from func
+    :rtype: any
+    """
+    executor = None
+    if workers != 1 and len(item_l) > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                          initializer=initializer,
+                                                          initargs=initargs)
+    elif initializer is not None:
+        initializer(*initargs)
+    try:
+        for r in map(func, item_l) if executor is None else executor.map(func, item_l, chunksize=8):
+            yield r
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-def pseudo_main(file_l, search_term, search_type, ignore_comments, ignore_case, summary):
+
+def _tokenize_file(file):
+    """Returns the unique tokens in a file for the index. Comments are included.
+
+    :param file: Name of the file to tokenize
+    :type file: str
+    :return: List of unique lower case tokens. None if the file could not be read.
+    :rtype: list, None
+    """
+    global _token_re
+
+    token_d = dict()  # Used as a set
+    try:
+        for buf in _read_lines(file, False):
+            for token in _token_re.findall(buf.lower()):
+                token_d[token] = True
+    except Exception:
+        return None
+    return list(token_d.keys())
+
+
+def _index_open(index):
+    """Opens, and creates if necessary, the full-text index
+
+    :param index: Name of the index database file
+    :type index: str
+    :return: Database connection
+    :rtype: sqlite3.Connection
+    :raises sqlite3.Error: The index could not be opened or created. The connection is closed.
+    """
+    global _index_schema_l, _INDEX_VERSION
+
+    conn = sqlite3.connect(index)
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        with conn:
+            if conn.execute('PRAGMA user_version').fetchone()[0] != _INDEX_VERSION:
+                for table in ('posting', 'token', 'file'):
+                    conn.execute('DROP TABLE IF EXISTS ' + table)
+                conn.execute('PRAGMA user_version = ' + str(_INDEX_VERSION))
+            for sql in _index_schema_l:
+                conn.execute(sql)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+def _index_update(conn, file_l, workers, pdf_cache=None):
+    """Adds new and modified files in file_l to the index. Removes files from the index that no longer exist.
+
+    Files are stored in the index by their full path. Files in the index that are not in file_l are kept so that the
+    same index can be used for searches of different sub-directories and file name filters.
+
+    :param conn: Database connection returned from _index_open()
+    :type conn: sqlite3.Connection
+    :param file_l: Files to search
+    :type file_l: list
+    :param workers: Maximum number of processes used to tokenize files. None uses one for each processor.
+    :type workers: int, None
+    :param pdf_cache: Folder for cached PDF text. None if PDF text is not cached
+    :type pdf_cache: str, None
+    """
+    indexed_d, update_l = dict(), list()  # indexed_d key: full path of the file. Value is the file table row
+    for row in conn.execute('SELECT file_id, name, mtime, size FROM file'):
+        indexed_d[row[1]] = row
+    for file in file_l:
+        name = os.path.abspath(file)
+        try:
+            stat = os.stat(name)
+        except OSError:
+            continue
+        row = indexed_d.get(name)
+        if row is None or row[2] != stat.st_mtime or row[3] != stat.st_size:
+            update_l.append((name, row, stat))
+
+    # Remove files that no longer exist
+    remove = False
+    with conn:
+        for name, row in indexed_d.items():
+            if not os.path.exists(name):
+                _index_remove(conn, row[0])
+                remove = True
+
+    # Tokenize the new and modified files
+    if len(update_l) > 0:
+        brcdapi_log.log('Indexing ' + str(len(update_l)) + ' files', echo=True)
+    result_i = _map(_tokenize_file, [t[0] for t in update_l], workers, _cache_init, (pdf_cache,))
+    for (name, row, stat), token_l in zip(update_l, result_i):
+        with conn:
+            if row is not None:
+                _index_remove(conn, row[0])
+                remove = True
+            if token_l is None:
+                continue  # Not added so it's tried again next time
+            file_id = conn.execute('INSERT INTO file (name, mtime, size) VALUES (?, ?, ?)',
+                                   (name, stat.st_mtime, stat.st_size)).lastrowid
+            conn.executemany('INSERT INTO posting (token, file_id) VALUES (?, ?)',
+                             [(token, file_id) for token in token_l])
+            conn.executemany('INSERT OR IGNORE INTO token (token) VALUES (?)', [(token,) for token in token_l])
+
+    # Remove the distinct tokens that are no longer in any file
+    if remove:
+        with conn:
+            conn.execute('DELETE FROM token WHERE NOT EXISTS (SELECT 1 FROM posting WHERE posting.token = token.token)')
+
+
+def _index_remove(conn, file_id):
+    """Removes a file from the index. The caller is responsible for the transaction.
+
+    :param conn: Database connection returned from _index_open()
+    :type conn: sqlite3.Connection
+    :param file_id: file_id of the file to remove
+    :type file_id: int
+    """
+    conn.execute('DELETE FROM posting WHERE file_id = ?', (file_id,))
+    conn.execute('DELETE FROM file WHERE file_id = ?', (file_id,))
+
+
+def _index_terms(search_term, search_type):
+    """Determines the tokens a file must contain for a line to match an exact or wild card search term
+
+    The search term is split into literal segments at the wild card characters. A token bounded on both sides by a
+    non-word character, or the start or end of the line, must be in the index as is. A token next to a wild card can be
+    part of a longer token so it is matched as a prefix, suffix, or substring. LIKE can't use the primary key of the
+    posting table so a prefix is matched with a range of tokens. Suffixes and substrings are matched against the much
+    smaller token table first. CROSS JOIN makes SQLite scan the token table and look up each match in posting.
+
+    :param search_term: What to search for
+    :type search_term: str
+    :param search_type: Search type. Only exact and wild card searches can be resolved with the index.
+    :type search_type: str
+    :return: List of tuples, SQL query that returns the file_id of each file with the token and its parameters. None
+             if the index can't be used for this search type
+    :rtype: list, None
+    """
+    global _token_re
+
+    stype = search_type.replace('_', '-')
+    if stype == 'exact':
+        seg_l = [(search_term, False, False)]
+    elif stype == 'wild':
+        seg_l, buf_l = list(), re.split(r'\*|\?|\[[^\]]*\]', search_term)
+        for i in range(0, len(buf_l)):
+            seg_l.append((buf_l[i], i > 0, i < len(buf_l) - 1))
+    else:
+        return None
+
+    rl = list()
+    for seg, left_open, right_open in seg_l:
+        seg = seg.lower()
+        for m in _token_re.finditer(seg):
+            token = m.group(0)
+            left, right = m.start() > 0 or not left_open, m.end() < len(seg) or not right_open
+            like = token.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            if left and right:
+                rl.append(('SELECT DISTINCT file_id FROM posting WHERE token = ?', (token,)))
+            elif left:
+                rl.append(('SELECT DISTINCT file_id FROM posting WHERE token >= ? AND token < ?',
+                           (token, token[0:-1] + chr(ord(token[-1]) + 1))))
+            else:
+                rl.append(("SELECT DISTINCT posting.file_id FROM token CROSS JOIN posting "
+                           "ON posting.token = token.token WHERE token.token LIKE ? ESCAPE '\\'",
+                           ('%' + like if right else '%' + like + '%',)))
+
+    return rl
+
+
+def _index_search(conn, file_l, search_term, search_type, ignore_case, ignore_comments, summary):
+    """Finds the files that may contain a match using the index
+
+    :param conn: Database connection returned from _index_open()
+    :type conn: sqlite3.Connection
+    :param file_l: Files to search
+    :type file_l: list
+    :param search_term: What to search for
+    :type search_term: str
+    :param search_type: Search type. See _search_type_l for valid types.
+    :type search_type: str
+    :param ignore_case: If True, ignore case
+    :type ignore_case: bool
+    :param ignore_comments: If True, ignore comments
+    :type ignore_comments: bool
+    :param summary: If True, only the file names are displayed
+    :type summary: bool
+    :return candidate_l: Files in file_l, in the same order, that may contain a match
+    :rtype candidate_l: list
+    :return verify: If False, every file in candidate_l contains a match so the files do not need to be read.
+    :rtype verify: bool
+    """
+    term_l = _index_terms(search_term, search_type)
+    if term_l is None or len(term_l) == 0:
+        return file_l, True
+
+    # Each term narrows down the list of files
+    file_id_s = None
+    for sql, param_t in term_l:
+        id_s = set([row[0] for row in conn.execute(sql, param_t)])
+        file_id_s = id_s if file_id_s is None else file_id_s & id_s
+        if len(file_id_s) == 0:
+            break
+    name_s, indexed_s = set(), set()
+    for file_id, name in conn.execute('SELECT file_id, name FROM file'):
+        indexed_s.add(name)
+        if file_id in file_id_s:
+            name_s.add(name)
+    abs_d = dict()  # Key is the file name in file_l. Value is the full path used in the index
+    for file in file_l:
+        abs_d[file] = os.path.abspath(file)
+    candidate_l = [file for file in file_l if abs_d[file] in name_s or abs_d[file] not in indexed_s]
+
+    # The index is the answer if only file names are needed, the search term is a single word surrounded by "*", and
+    # all the candidate files are in the index.
+    verify = not (summary and ignore_case and not ignore_comments and search_type.replace('_', '-') == 'wild' and
+                  re.fullmatch(r'\*+\w+\*+', search_term) is not None and
+                  len([file for file in candidate_l if abs_d[file] not in indexed_s]) == 0)
+
+    return candidate_l, verify
+
+
+def pseudo_main(file_l, search_term, search_type, ignore_comments, ignore_case, summary, workers=None,
+                index=None, pdf_cache=None):
     """Basically the main(). Did it this way so that it can easily be used as a standalone module or called externally.
 
     :param file_l: List of files to search
@@ -100,6 +580,12 @@ def pseudo_main(file_l, search_term, search_type, ignore_comments, ignore_case,
     :type ignore_case: bool
     :param summary: If True, display the file names only in the output
     :type summary: bool
+    :param workers: Maximum number of processes used to search files. None uses one for each processor.
+    :type workers: int, None
+    :param index: Name of the full-text index database file. If None, the index is not used.
+    :type index: str, None
+    :param pdf_cache: Folder for cached PDF text. None if PDF text is not cached
+    :type pdf_cache: str, None
     :return: Exit code. See exist codes in brcddb.brcddb_common
     :rtype: int
     """
@@ -107,40 +593,55 @@ def pseudo_main(file_l, search_term, search_type, ignore_comments, ignore_case,
 
     ec, ml = brcddb_common.EXIT_STATUS_OK, list()
 
-    for file in file_l:
-        content_l = list()
+    # Validate the search term before starting any processes
+    try:
+        _compile_term(search_term, search_type, ignore_case)
+    except re.error:
+        if 'regex' in search_type and '*' in search_term:
+            buf_l = ['',
+                     'ReGex library error.',
+                     'Search term, -t: ' + search_term,
+                     'Search type, -s: ' + search_type,
+                     'An "*" was used in the search term, -t, but not followed with anything to repeat. This '
+                     'typically happens when "wild" was the intended search type. Keep in mind that the default '
+                     'serach type is "regex_s".']
+        else:
+            buf_l = ['Unknown ReGex library error.']
+        brcdapi_log.log(buf_l, echo=True)
+        return brcddb_common.EXIT_STATUS_INPUT_ERROR
+
+    # Use the index to find the files that need to be read
+    verify = True
+    if isinstance(index, str):
         try:
-            if file.split('.')[-1].lower() == 'pdf':
-                for page in PdfReader(file).pages:
-                    content_l.extend(page.extract_text().split('\n'))
-            else:
-                content_l = brcdapi_file.read_file(file, remove_blank=True, rc=ignore_comments)
-        except (FileNotFoundError, FileExistsError, PermissionError):
-            continue
-        except PdfReadError:
-            brcdapi_log.log('Error reading : ' + file + '. Skipped')
-        except Exception as e:
-            brcdapi_log.log(['Unknown error: ' + str(e), '  while processing ' + file])
+            conn = _index_open(index)
+        except sqlite3.Error as e:
+            brcdapi_log.log(['Could not open index ' + index + '. Error is:', str(e)], echo=True)
+            return brcddb_common.EXIT_STATUS_ERROR
         try:
-            temp_l = gen_util.match_str(content_l, search_term, ignore_case=ignore_case, stype=search_type)
-        except re.error:
-            if 'regex' in search_type and '*' in search_term:
-                buf_l = ['',
-                         'ReGex library error.',
-                         'Search term, -t: ' + search_term,
-                         'Search type, -s: ' + search_type,
-                         'An "*" was used in the search term, -t, but not followed with anything to repeat. This '
-                         'typically happens when "wild" was the intended search type. Keep in mind that the default '
-                         'serach type is "regex_s".']
-            else:
-                buf_l = ['Unknown ReGex library error.']
-            brcdapi_log.log(buf_l, echo=True)
-            return brcddb_common.EXIT_STATUS_INPUT_ERROR
-        if len(temp_l) > 0:
+            _index_update(conn, file_l, workers, pdf_cache)
+            file_l, verify = _index_search(conn, file_l, search_term, search_type, ignore_case, ignore_comments,
+                                           summary)
+        except sqlite3.Error as e:  # Typically the index is locked by another process or the disk is full
+            brcdapi_log.log(['Error updating or searching index ' + index + '. Error is:', str(e)], echo=True)
+            return brcddb_common.EXIT_STATUS_ERROR
+        finally:
+            conn.close()
+        brcdapi_log.log('Files to read after applying the index: ' + str(len(file_l) if verify else 0), echo=True)
+    if not verify:
+        ml.extend(file_l)
+        file_l = list()
+
+    # Search the files. Results are returned in the same order as file_l.
+    init_args = (search_term, search_type, ignore_case, ignore_comments, summary, pdf_cache)
+    for file, (count, finds_l, error_l) in zip(file_l, _map(_search_file, file_l, workers, _worker_init, init_args)):
+        if len(error_l) > 0:
+            brcdapi_log.log(error_l)
+        if count > 0:
             ml.append(file)
             if not summary:
-                ml.extend(['  ' + b for b in temp_l[0:_MAX_FINDS]])
-                x = len(temp_l) - _MAX_FINDS
+                ml.extend(['  ' + b for b in finds_l])
+                x = count - _MAX_FINDS
                 if x > 0:
                     ml.append('  + ' + str(x) + ' more.')
 
@@ -217,6 +718,12 @@ def _get_input():
                 ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
                 path_help = ' **ERROR** Permission denied.'
 
+    # Validate the number of workers
+    workers_help = ''
+    if args_d['workers'] < 0:
+        workers_help = ' **ERROR** Must be >= 0'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+
     # Command line feedback
     ml = [
         os.path.basename(__file__) + ', ' + __version__,
@@ -232,13 +739,24 @@ def _get_input():
         'No log, -nl:                   ' + str(args_d['nl']),
         'Suppress, -sup:                ' + str(args_d['sup']),
         'Summary, -sum:                 ' + str(args_d['sum']),
+        'Workers, -workers:             ' + str(args_d['workers']) + workers_help,
+        'Index, -idx:                   ' + str(args_d['idx']),
+        'PDF cache, -pdf_cache:         ' + str(args_d['pdf_cache']),
         'Matching files to search:      ' + str(len(file_l)),
         '',
         ]
     brcdapi_log.log(ml, echo=True)
 
     return ec if ec != brcddb_common.EXIT_STATUS_OK else \
-        pseudo_main(file_l, args_d['t'], args_d['s'], args_d['c'], args_d['ic'], args_d['sum'])
+        pseudo_main(file_l,
+                    args_d['t'],
+                    args_d['s'],
+                    args_d['c'],
+                    args_d['ic'],
+                    args_d['sum'],
+                    workers=None if args_d['workers'] == 0 else args_d['workers'],
+                    index=brcdapi_file.full_file_name(args_d['idx'], '.db'),
+                    pdf_cache=args_d['pdf_cache'])
 
 
 ##################################################################
@@ -250,7 +768,7 @@ if _DOC_STRING:
     print('_DOC_STRING is True. No processing')
     exit(brcddb_common.EXIT_STATUS_OK)
 
-if _STAND_ALONE:
+if _STAND_ALONE and __name__ == '__main__':
     _ec = _get_input()
     brcdapi_log.close_log(['', 'Processing Complete. Exit code: ' + str(_ec)], echo=True)
     exit(_ec)
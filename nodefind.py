@@ -20,6 +20,27 @@ details.
 
 Performs a node find in a project
 
+An inverted index of WWNs to logins, aliases to WWNs, zones to WWNs, and WWNs to zones is built once for each fabric.
+Exact searches are dictionary look ups so large lists of WWNs, typically read from a file with -wwn_f, are resolved in a
+single pass. Wild card and regex search terms are compiled once and applied to the keys of the index.
+
+With -history, -alias, -alias_f, -wwn, and -wwn_f are searched for in every project file in a folder. A SQLite index,
+nodefind_history.db, is kept in the folder. Only project files that are new or were modified since the last time the
+index was updated are read so adding a new capture to the folder only requires reading the new capture. Each login is
+recorded with the capture date (the date stored in the project file when the data was captured), fabric, switch, port,
+and alias. The modification time of the project file is only used for the capture date when the project file does not
+have a date in a recognized format.
+
++-----------+----------------------------------------------------------------------------------------------------------+
+| Table     | Columns                                                                                                  |
++===========+==========================================================================================================+
+| capture   | capture_id, file (name of the project file), mtime, size, date                                           |
++-----------+----------------------------------------------------------------------------------------------------------+
+| login     | capture_id, wwn, fabric, switch, port, alias. Indexed by wwn.                                            |
++-----------+----------------------------------------------------------------------------------------------------------+
+| alias     | capture_id, alias, wwn. Indexed by alias.                                                                |
++-----------+----------------------------------------------------------------------------------------------------------+
+
 **Version Control**
 
 +-----------+---------------+---------------------------------------------------------------------------------------+
@@ -41,17 +62,28 @@ Performs a node find in a project
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 1.0.7     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 1.0.8     | 19 Oct 2026   | Added -xref_cache to cache cross-referenced projects. See xref_cache.py               |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 1.0.9     | 19 Oct 2026   | Searches are resolved with an inverted index built once per fabric. Search terms are  |
+|           |               | compiled once. Fixed duplicate logins reported for zones. Zones added to the results. |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 1.0.10    | 19 Oct 2026   | Added -history to search a folder of project files with an incrementally built index. |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '19 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '1.0.7'
+__version__ = '1.0.10'
 
 import os
+import re
+import sqlite3
+import datetime
+import fnmatch
 import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
@@ -60,11 +92,11 @@ import brcdapi.file as brcdapi_file
 import brcddb.brcddb_common as brcddb_common
 import brcddb.brcddb_project as brcddb_project
 import brcddb.brcddb_switch as brcddb_switch
-import brcddb.util.search as brcddb_search
-import brcddb.report.login as report_login
 import brcddb.brcddb_fabric as brcddb_fabric
+import brcddb.report.login as report_login
 import brcddb.brcddb_login as brcddb_login
 import brcddb.brcddb_port as brcddb_port
+import xref_cache
 
 _DOC_STRING = False  # Should always be False. Prohibits any code execution. Only useful for building documentation
 # _STAND_ALONE: True: Executes as a standalone module taking input from the command line. False: Does not automatically
@@ -76,8 +108,14 @@ _search_type_l = [str(_b) for _b in _search_type_d.keys()]
 
 # Input parameter definitions
 _input_d = dict(
-    i=dict(h='Required. Name of input file generated by capture.py, combine.py, or multi_capture.py. ".json" is '
-             'automatically appended if not present.'),
+    i=dict(r=False,
+           h='Required unless -history is specified. Name of input file generated by capture.py, combine.py, or '
+             'multi_capture.py. ".json" is automatically appended if not present.'),
+    history=dict(r=False,
+                 h='Optional. Name of a folder of project files. Instead of searching -i, reports where each node '
+                   'specified with -alias, -alias_f, -wwn, or -wwn_f was logged in for each project file in the '
+                   'folder. An index, nodefind_history.db, is created in the folder and updated with new and modified '
+                   'project files each time this option is used. -zone, -zone_f, and -r are not supported.'),
     alias=dict(r=False, d=None,
                h='Optional. CSV list of nodes by alias to search for. Supports regex and wild card searching. '
                  'WARNING: Most regex searches must be encapsulated in quotes. Otherwise, the command line interpreter '
@@ -104,6 +142,7 @@ _input_d = dict(
            h='Optional. Search type. Options are: ' + ', '.join(_search_type_l) + ' The default is "exact".'),
     r=dict(r=False, h='Optional. Name of Excel report file. ".xlsx" is automatically appended.'),
 )
+_input_d.update(xref_cache.parseargs_d.copy())
 _input_d.update(gen_util.parseargs_log_d.copy())
 
 _wb = None  # Object for the Excel workbook used for output
@@ -114,14 +153,33 @@ _report_display = dict()
 _sheet_index = 0  # Most examples add a worksheet to the Excel workbook. This indicates where.
 _MAX_LINE_LEN = 72  # Used to control how long help messages can be.
 
+_history_db = 'nodefind_history.db'  # Name of the history index in the -history folder
+_HISTORY_VERSION = 2  # Increment when the content of the history index changes. The index is rebuilt.
+_project_date_l = ('%d %b %Y %H:%M:%S', '%Y_%m_%d_%H_%M_%S')  # Formats of the date in project files
+_history_schema_l = (
+    'CREATE TABLE IF NOT EXISTS capture (capture_id INTEGER PRIMARY KEY, file TEXT NOT NULL UNIQUE, '
+    'mtime REAL NOT NULL, size INTEGER NOT NULL, date TEXT NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS login (capture_id INTEGER NOT NULL REFERENCES capture(capture_id), '
+    'wwn TEXT NOT NULL, fabric TEXT, switch TEXT, port TEXT, alias TEXT)',
+    'CREATE INDEX IF NOT EXISTS login_wwn ON login (wwn)',
+    'CREATE INDEX IF NOT EXISTS login_capture ON login (capture_id)',
+    'CREATE TABLE IF NOT EXISTS alias (capture_id INTEGER NOT NULL REFERENCES capture(capture_id), '
+    'alias TEXT NOT NULL, wwn TEXT NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS alias_alias ON alias (alias)',
+    'CREATE INDEX IF NOT EXISTS alias_capture ON alias (capture_id)',
+)
+
 
-def _local_report(search_d):
+def _local_report(search_d, wwn_zone_d=None):
     """Create a text report for each search term
 
     :param search_d: Key is the search term and value is the list of login objects associated with that search term
     :type search_d: dict
+    :param wwn_zone_d: Key is a tuple of the fabric WWN and login WWN. Value is the list of zones the login is in.
+    :type wwn_zone_d: dict, None
     :rtype: None
     """
+    wwn_zone_d = dict() if wwn_zone_d is None else wwn_zone_d
     ml = ['', 'Node Find Results', '_________________']
     for k, login_obj_l in search_d.items():
         ml.extend(['', str(k)])
@@ -140,6 +198,8 @@ def _local_report(search_d):
                 '  Switch:      ' + switch_name,
                 '  Port:        ' + brcddb_port.best_port_name(port_obj, port_num=True),
                 '  Description: ' + brcddb_port.port_best_desc(port_obj),
+                '  Zones:       ' + ', '.join(wwn_zone_d.get((login_obj.r_fabric_obj().r_obj_key(),
+                                                               login_obj.r_obj_key()), list())),
                 '',
                 ])
     brcdapi_log.log(
@@ -174,6 +234,73 @@ def _excel_report(report, search_d):
         brcdapi_log.log(buf, echo=True)
 
 
+def _matcher(term, search_type, ignore_case):
+    """Compiles a wild card or regex search term
+
+    :param term: Search term
+    :type term: str
+    :param search_type: Type of search. Can be exact, regex-m, regex-s, or wild
+    :type search_type: str
+    :param ignore_case: If True, the search is not case-sensitive
+    :type ignore_case: bool
+    :return: Method that takes a string and returns a truthy value if it matches. None for exact searches.
+    :rtype: method, None
+    """
+    if search_type == 'exact':
+        return None
+    flags = re.IGNORECASE if ignore_case else 0
+    if search_type == 'wild':
+        return re.compile(fnmatch.translate(term), flags).match
+    if search_type == 'regex-m':
+        return re.compile(term, flags).match
+    return re.compile(term, flags).search  # regex-s
+
+
+def _fabric_index(fab_obj):
+    """Builds the inverted index for a fabric.
+
+    :param fab_obj: Fabric object
+    :type fab_obj: brcddb.classes.fabric.FabricObj
+    :return: login: WWN (lower case) to login object. alias: alias to member WWNs. zone: zone to the WWNs of all \
+        members with aliases resolved. wwn_zone: WWN to the list of zones the WWN is in.
+    :rtype: dict
+    """
+    login_d = dict()
+    for login_obj in fab_obj.r_login_objects():
+        login_d[login_obj.r_obj_key().lower()] = login_obj
+    alias_d = dict()
+    for alias_obj in fab_obj.r_alias_objects():
+        alias_d[alias_obj.r_obj_key()] = alias_obj.r_members()
+    zone_d, wwn_zone_d = dict(), dict()
+    for zone_obj in fab_obj.r_zone_objects():
+        zone, wwn_d = zone_obj.r_obj_key(), dict()  # wwn_d is used as an ordered set
+        for mem in zone_obj.r_members():
+            for wwn in alias_d.get(mem, [mem]):  # If not an alias, assume it's a WWN. d,i members are not logins
+                wwn_d[wwn.lower()] = True
+        zone_d[zone] = list(wwn_d.keys())
+        for wwn in zone_d[zone]:
+            wwn_zone_d.setdefault(wwn, list()).append(zone)
+
+    return dict(login=login_d, alias=alias_d, zone=zone_d, wwn_zone=wwn_zone_d)
+
+
+def _find_keys(term, match_f, d):
+    """Returns the keys in d that match a search term
+
+    :param term: Search term
+    :type term: str
+    :param match_f: Compiled search term returned from _matcher(). None for an exact match.
+    :type match_f: method, None
+    :param d: Dictionary to search
+    :type d: dict
+    :return: Matching keys
+    :rtype: list
+    """
+    if match_f is None:
+        return [term] if term in d else list()
+    return [k for k in d.keys() if match_f(k)]
+
+
 def psuedo_main(proj_obj, alias_l, wwn_l, zone_l, search_type, report):
     """Basically the main().
 
@@ -185,7 +312,7 @@ def psuedo_main(proj_obj, alias_l, wwn_l, zone_l, search_type, report):
     :type wwn_l: list
     :param zone_l: Nodes by zone to search for
     :type zone_l: list
-    :param search_type: Type of search. Can be exact, regex_m, regex_s, or wild
+    :param search_type: Type of search. Can be exact, regex-m, regex-s, or wild
     :type search_type: str
     :param report: Name of Excel report.
     :type report: None,str
@@ -193,52 +320,305 @@ def psuedo_main(proj_obj, alias_l, wwn_l, zone_l, search_type, report):
     :rtype: int
     """
 
-    # Initialize tracking data structures
-    search_d = dict()
-    for buf in alias_l + wwn_l + zone_l:
-        search_d.update({buf: list()})
+    # Initialize tracking data structures and compile the search terms. WWN searches are not case-sensitive.
+    search_d, wwn_zone_d, term_l = dict(), dict(), list()
+    try:
+        for key, l, ignore_case in (('alias', alias_l, False), ('wwn', wwn_l, True), ('zone', zone_l, False)):
+            for buf in l:
+                search_d.update({buf: list()})
+                term = buf.lower() if ignore_case and search_type == 'exact' else buf
+                term_l.append((key, buf, term, _matcher(buf, search_type, ignore_case)))
+    except re.error as e:
+        brcdapi_log.log('Invalid search term, ' + str(buf) + '. Error is: ' + str(e), echo=True)
+        return brcddb_common.EXIT_STATUS_INPUT_ERROR
 
     # Find each item - nodefind
     for fab_obj in proj_obj.r_fabric_objects():
-
-        # Find by alias. Doing this one alias at a time to keep track of what was found for each alias
-        for alias in alias_l:  # Keep in mind that aliases may be a regex or wild card
-            for alias_obj in [fab_obj.r_alias_obj(a) for a in
-                              brcddb_fabric.aliases_by_name(fab_obj, alias, s_type=search_type)]:
-                for wwn in alias_obj.r_members():
-                    login_obj = fab_obj.r_login_obj(wwn)
-                    if login_obj is not None:
-                        search_d[alias].append(login_obj)
-
-        # Find by WWN. Doing this one WWN at a time to keep track of what was found for each WWN. Keep in mind that
-        # WWNs may be a regex or wild card
-        for wwn in wwn_l:
-            search_d[wwn].extend(brcddb_search.match(fab_obj.r_login_objects(), '_obj_key', wwn, True, search_type))
-
-        # Find by zone - Similar to find by alias but keep in mind that the member may be a WWN.
-        # d,i zone members are not processed
-        for zone in zone_l:
-            for zone_obj in [fab_obj.r_zone_obj(z) for z in
-                             brcddb_fabric.zone_by_name(fab_obj, zone, s_type=search_type)]:
-                zone_wwn_l = list()
-                for mem in zone_obj.r_members():
-                    alias_obj = fab_obj.r_alias_obj(mem)
-                    if alias_obj is None:
-                        zone_wwn_l.append(mem)  # assume it's a WWN. If not, fab_obj.r_login_obj() returns None
-                    else:
-                        zone_wwn_l.extend([wwn for wwn in alias_obj.r_members()])
-                    for wwn in zone_wwn_l:
-                        login_obj = fab_obj.r_login_obj(wwn)
-                        if login_obj is not None:
-                            search_d[zone].append(login_obj)
+        index_d, fab_key = _fabric_index(fab_obj), fab_obj.r_obj_key()
+        login_d = index_d['login']
+        for wwn, z_l in index_d['wwn_zone'].items():
+            if wwn in login_d:
+                wwn_zone_d[(fab_key, login_d[wwn].r_obj_key())] = z_l
+
+        # Doing this one term at a time to keep track of what was found for each term. Aliases and zones are resolved
+        # to WWNs. d,i zone members are not processed
+        for key, buf, term, match_f in term_l:
+            if key == 'wwn':
+                search_d[buf].extend([login_d[k] for k in _find_keys(term, match_f, login_d)])
+            else:
+                for k in _find_keys(term, match_f, index_d[key]):
+                    search_d[buf].extend([login_d[wwn.lower()] for wwn in index_d[key][k] if wwn.lower() in login_d])
 
     # Create the reports
-    _local_report(search_d)
+    _local_report(search_d, wwn_zone_d)
     _excel_report(report, search_d)
 
     return brcddb_common.EXIT_STATUS_OK
 
 
+def _history_open(folder):
+    """Opens, and creates if necessary, the history index in a folder of project files
+
+    :param folder: Folder containing the project files
+    :type folder: str
+    :return: Database connection
+    :rtype: sqlite3.Connection
+    :raises sqlite3.Error: The history index could not be opened or created. The connection is closed.
+    """
+    global _history_db, _history_schema_l, _HISTORY_VERSION
+
+    conn = sqlite3.connect(folder + '/' + _history_db)
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        with conn:
+            if conn.execute('PRAGMA user_version').fetchone()[0] != _HISTORY_VERSION:
+                for table in ('login', 'alias', 'capture'):
+                    conn.execute('DROP TABLE IF EXISTS ' + table)
+                conn.execute('PRAGMA user_version = ' + str(_HISTORY_VERSION))
+            for sql in _history_schema_l:
+                conn.execute(sql)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+def _capture_date(proj_obj, mtime):
+    """Returns the date the data in a project was captured in a format that sorts in date order
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param mtime: Modification time of the project file. Only used if the project date is not in a recognized format.
+    :type mtime: float
+    :return: Capture date, YYYY-MM-DD HH:MM:SS
+    :rtype: str
+    """
+    global _project_date_l
+
+    buf = proj_obj.r_date()
+    for date_format in _project_date_l:
+        try:
+            return datetime.datetime.strptime(buf, date_format).strftime('%Y-%m-%d %H:%M:%S')
+        except (TypeError, ValueError):
+            pass
+
+    return datetime.datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _history_rows(proj_obj):
+    """Returns the rows to add to the login and alias tables for a project
+
+    :param proj_obj: Project object. Cross-references must already be built
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :return login_l: Login table rows: WWN, fabric, switch, port, alias
+    :rtype login_l: list
+    :return alias_l: Alias table rows: alias, WWN
+    :rtype alias_l: list
+    """
+    login_l, alias_l = list(), list()
+    for fab_obj in proj_obj.r_fabric_objects():
+        fab_name = brcddb_fabric.best_fab_name(fab_obj, wwn=True, fid=True)
+        for login_obj in fab_obj.r_login_objects():
+            wwn, port_obj = login_obj.r_obj_key(), login_obj.r_port_obj()
+            a_l = gen_util.convert_to_list(fab_obj.r_alias_for_wwn(wwn))
+            alias_l.extend([(alias, wwn.lower()) for alias in a_l])
+            login_l.append((
+                wwn.lower(),
+                fab_name,
+                '' if port_obj is None else
+                brcddb_switch.best_switch_name(port_obj.r_switch_obj(), wwn=True, fid=True, did=True),
+                '' if port_obj is None else brcddb_port.best_port_name(port_obj, port_num=True),
+                ', '.join(a_l),
+            ))
+    return login_l, alias_l
+
+
+def _history_update(conn, folder):
+    """Adds new and changed project files in folder to the history index. Removes project files no longer in folder.
+
+    Project files already in the index, with the same modification time and size, are not read again.
+
+    :param conn: Database connection returned from _history_open()
+    :type conn: sqlite3.Connection
+    :param folder: Folder containing the project files
+    :type folder: str
+    :return: Status code.
+    :rtype: int
+    """
+    ec, add_count = brcddb_common.EXIT_STATUS_OK, 0
+    capture_d = dict()  # Key is the file name. Value is the capture table row
+    for row in conn.execute('SELECT capture_id, file, mtime, size FROM capture'):
+        capture_d[row[1]] = row
+
+    for file in [f for f in brcdapi_file.read_directory(folder) if f.lower().endswith('.json')]:
+        full_file, row = folder + '/' + file, capture_d.pop(file, None)
+        stat = os.stat(full_file)
+        if row is not None and row[2] == stat.st_mtime and row[3] == stat.st_size:
+            continue
+        brcdapi_log.log('Indexing ' + full_file, echo=True)
+        try:
+            proj_obj = brcddb_project.read_from(full_file)
+        except BaseException as e:
+            brcdapi_log.log(['Skipping ' + full_file + '. Exception is:', str(type(e)) + ': ' + str(e)], echo=True)
+            proj_obj = None
+        if proj_obj is None:  # Not added to the capture table so it's tried again next time.
+            ec = brcddb_common.EXIT_STATUS_ERROR
+            continue
+        brcddb_project.build_xref(proj_obj)
+        login_l, alias_l = _history_rows(proj_obj)
+        with conn:
+            if row is not None:
+                _history_remove(conn, row[0])
+            capture_id = conn.execute(
+                'INSERT INTO capture (file, mtime, size, date) VALUES (?, ?, ?, ?)',
+                (file, stat.st_mtime, stat.st_size, _capture_date(proj_obj, stat.st_mtime))
+            ).lastrowid
+            conn.executemany('INSERT INTO login (capture_id, wwn, fabric, switch, port, alias) '
+                             'VALUES (?, ?, ?, ?, ?, ?)',
+                             [(capture_id,) + r for r in login_l])
+            conn.executemany('INSERT INTO alias (capture_id, alias, wwn) VALUES (?, ?, ?)',
+                             [(capture_id,) + r for r in alias_l])
+        add_count += 1
+
+    # Anything left in capture_d is no longer in the folder
+    with conn:
+        for row in capture_d.values():
+            _history_remove(conn, row[0])
+    brcdapi_log.log('Indexed ' + str(add_count) + ' project files. Removed ' + str(len(capture_d)) + ' project files.',
+                    echo=True)
+
+    return ec
+
+
+def _history_remove(conn, capture_id):
+    """Removes a project file from the history index. The caller is responsible for the transaction.
+
+    :param conn: Database connection returned from _history_open()
+    :type conn: sqlite3.Connection
+    :param capture_id: capture_id of the project file to remove
+    :type capture_id: int
+    """
+    for table in ('login', 'alias', 'capture'):
+        conn.execute('DELETE FROM ' + table + ' WHERE capture_id = ?', (capture_id,))
+
+
+def _history_find(conn, alias_l, wwn_l, search_type):
+    """Finds all logins in the history index for each search term
+
+    :param conn: Database connection returned from _history_open()
+    :type conn: sqlite3.Connection
+    :param alias_l: Nodes by alias to search for. Aliases are resolved to every WWN they contained in any capture
+    :type alias_l: list
+    :param wwn_l: Nodes by WWN to search for
+    :type wwn_l: list
+    :param search_type: Type of search. Can be exact, regex-m, regex-s, or wild
+    :type search_type: str
+    :return: Key is the search term. Value is a dictionary whose key is the WWN and value is the list of login rows, \
+        date, file, fabric, switch, port, alias, sorted by date
+    :rtype: dict
+    """
+    search_d, key_d = dict(), dict()
+    sql = 'SELECT capture.date, capture.file, login.fabric, login.switch, login.port, login.alias FROM login ' \
+          'JOIN capture USING (capture_id) WHERE login.wwn = ? ORDER BY capture.date, capture.file'
+
+    # Wild card and regex terms are matched against the distinct keys so the keys are only read once
+    for key, l, ignore_case, key_sql in (
+            ('alias', alias_l, False, 'SELECT DISTINCT alias FROM alias'),
+            ('wwn', wwn_l, True, 'SELECT DISTINCT wwn FROM login')):
+        for buf in l:
+            match_f = _matcher(buf, search_type, ignore_case)
+            if match_f is None:
+                match_l = [buf.lower() if ignore_case else buf]
+            else:
+                if key not in key_d:
+                    key_d[key] = [row[0] for row in conn.execute(key_sql)]
+                match_l = [k for k in key_d[key] if match_f(k)]
+            if key == 'alias':
+                temp_l = list()
+                for alias in match_l:
+                    temp_l.extend([row[0] for row in
+                                   conn.execute('SELECT DISTINCT wwn FROM alias WHERE alias = ?', (alias,))])
+                match_l = gen_util.remove_duplicates(temp_l)
+            search_d[buf] = dict()
+            for wwn in match_l:
+                row_l = conn.execute(sql, (wwn,)).fetchall()
+                if len(row_l) > 0:
+                    search_d[buf][wwn] = row_l
+
+    return search_d
+
+
+def _history_report(search_d):
+    """Create a text report of where each WWN was logged in. Consecutive captures with the same location are combined.
+
+    :param search_d: Output of _history_find()
+    :type search_d: dict
+    :rtype: None
+    """
+    ml = ['', 'Node Find History', '_________________']
+    for k, wwn_d in search_d.items():
+        ml.extend(['', str(k)])
+        if len(wwn_d) == 0:
+            ml.append('  Not found.')
+        for wwn, row_l in wwn_d.items():
+            ml.append('  ' + wwn)
+            loc_l = list()  # Each entry is a list: first row, last row, number of captures
+            for row in row_l:
+                if len(loc_l) > 0 and loc_l[-1][0][2:] == row[2:]:
+                    loc_l[-1][1] = row
+                    loc_l[-1][2] += 1
+                else:
+                    loc_l.append([row, row, 1])
+            for first_row, last_row, count in loc_l:
+                ml.extend([
+                    '    First seen:  ' + first_row[0] + ' (' + first_row[1] + ')',
+                    '    Last seen:   ' + last_row[0] + ' (' + last_row[1] + ')',
+                    '    Captures:    ' + str(count),
+                    '    Fabric:      ' + str(first_row[2]),
+                    '    Switch:      ' + str(first_row[3]),
+                    '    Port:        ' + str(first_row[4]),
+                    '    Alias:       ' + str(first_row[5]),
+                    '',
+                ])
+    brcdapi_log.log(ml, echo=True)
+
+
+def history_main(folder, alias_l, wwn_l, search_type):
+    """Updates the history index in a folder of project files and reports where each search term was logged in
+
+    :param folder: Folder containing the project files
+    :type folder: str
+    :param alias_l: Nodes by alias to search for
+    :type alias_l: list
+    :param wwn_l: Nodes by WWN to search for
+    :type wwn_l: list
+    :param search_type: Type of search. Can be exact, regex-m, regex-s, or wild
+    :type search_type: str
+    :return: Status code.
+    :rtype: int
+    """
+    global _history_db
+
+    conn = None
+    try:
+        conn = _history_open(folder)
+        ec = _history_update(conn, folder)
+        _history_report(_history_find(conn, alias_l, wwn_l, search_type))
+    except re.error as e:
+        brcdapi_log.log('Invalid search term. Error is: ' + str(e), echo=True)
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    except (sqlite3.Error, OSError) as e:  # Typically a read-only folder or the index is locked by another process
+        brcdapi_log.log(['Error accessing the history index, ' + folder + '/' + _history_db + '. Error is:',
+                         str(type(e)) + ': ' + str(e)], echo=True)
+        ec = brcddb_common.EXIT_STATUS_ERROR
+    finally:
+        if conn is not None:
+            conn.close()
+
+    return ec
+
+
 def _get_input():
     """Parses the module load command line
 
@@ -268,36 +648,49 @@ def _get_input():
         version_d=brcdapi_util.get_import_modules()
     )
 
-    # Read in the project file
-    proj_obj, args_i_help = None, ''
-    try:
-        proj_obj = brcddb_project.read_from(brcdapi_file.full_file_name(args_d['i'], '.json'))
-        if proj_obj is None:  # Error messages are sent to the log in brcddb_project.read_from() if proj_obj is None
-            return brcddb_common.EXIT_STATUS_INPUT_ERROR
-        brcddb_project.build_xref(proj_obj)
-    except FileNotFoundError:
-        args_i_help = ' not found'
-        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
-    except FileExistsError:
-        args_i_help = ' folder does not exist.'
+    # Read in the project file. With -history, the project files are read from the -history folder.
+    proj_obj, args_i_help, args_history_help = None, '', ''
+    if isinstance(args_d['history'], str):
+        if not os.path.isdir(args_d['history']):
+            args_history_help = ' **ERROR** Folder does not exist.'
+            ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+        if isinstance(args_d['zone'], str) or isinstance(args_d['zone_f'], str) or isinstance(args_d['r'], str):
+            args_history_help += ' **ERROR** -zone, -zone_f, and -r are not supported with -history.'
+            ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    elif not isinstance(args_d['i'], str):
+        args_i_help = ' **ERROR** -i or -history is required.'
         ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    else:
+        try:
+            proj_obj = xref_cache.read_project(brcdapi_file.full_file_name(args_d['i'], '.json'), args_d['xref_cache'])
+            if proj_obj is None:  # Error messages are sent to the log in brcddb_project.read_from() if None
+                return brcddb_common.EXIT_STATUS_INPUT_ERROR
+        except FileNotFoundError:
+            args_i_help = ' not found'
+            ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+        except FileExistsError:
+            args_i_help = ' folder does not exist.'
+            ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
 
     # Command line feedback
     ml = ['',
           os.path.basename(__file__) + ', ' + __version__,
-          'Project, -i:          ' + args_d['i'] + args_i_help,
-          'Alias, -alias:        ' + str(args_d['alias']),
-          'Alias file, -alias_f: ' + str(args_d['alias_f']),
-          'WWN, -wwn:            ' + str(args_d['wwn']),
-          'WWN file, -wwn_f:     ' + str(args_d['wwn_f']),
-          'Zone, -zone:          ' + str(args_d['zone']),
-          'Zone file, -zone_f:   ' + str(args_d['zone_f']),
-          'Search type, -s:      ' + str(args_d['s']),
-          'Report, -r:           ' + str(args_d['r']),
-          'Log, -log:            ' + str(args_d['log']),
-          'No log, -nl:          ' + str(args_d['nl']),
-          'Suppress, -sup:       ' + str(args_d['sup']),]
-    proj_obj.s_description('\n'.join(ml))
+          'Project, -i:             ' + str(args_d['i']) + args_i_help,
+          'History, -history:       ' + str(args_d['history']) + args_history_help,
+          'Alias, -alias:           ' + str(args_d['alias']),
+          'Alias file, -alias_f:    ' + str(args_d['alias_f']),
+          'WWN, -wwn:               ' + str(args_d['wwn']),
+          'WWN file, -wwn_f:        ' + str(args_d['wwn_f']),
+          'Zone, -zone:             ' + str(args_d['zone']),
+          'Zone file, -zone_f:      ' + str(args_d['zone_f']),
+          'Search type, -s:         ' + str(args_d['s']),
+          'Report, -r:              ' + str(args_d['r']),
+          'Xref cache, -xref_cache: ' + str(args_d['xref_cache']),
+          'Log, -log:               ' + str(args_d['log']),
+          'No log, -nl:             ' + str(args_d['nl']),
+          'Suppress, -sup:          ' + str(args_d['sup']),]
+    if proj_obj is not None:
+        proj_obj.s_description('\n'.join(ml))
     ml.append('')
 
     # Get the lists of aliases and WWNs to work on.
@@ -338,6 +731,11 @@ def _get_input():
     brcdapi_log.log(ml, echo=True)
 
     # Command line feedback and process
+    if ec == brcddb_common.EXIT_STATUS_OK and isinstance(args_d['history'], str):
+        return history_main(args_d['history'],
+                            gen_util.remove_duplicates(gen_util.remove_none(alias_l)),
+                            gen_util.remove_duplicates(gen_util.remove_none(wwn_l)),
+                            _search_type_d[args_d['s']])
     return ec if ec != brcddb_common.EXIT_STATUS_OK else \
         psuedo_main(proj_obj,
                     gen_util.remove_duplicates(gen_util.remove_none(alias_l)),
@@ -41,15 +41,17 @@ Creates a port count & type report in Excel Workbook format from a brcddb projec
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.7     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 19 Oct 2026   | Added -xref_cache to cache cross-referenced projects. See xref_cache.py               |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '19 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.7'
+__version__ = '4.0.8'
 
 import os
 import copy
@@ -62,11 +64,11 @@ import brcdapi.util as brcdapi_util
 import brcdapi.excel_fonts as excel_fonts
 import brcdapi.excel_util as excel_util
 import brcdapi.file as brcdapi_file
-import brcddb.brcddb_project as brcddb_project
 import brcddb.util.search as brcddb_search
 import brcddb.brcddb_common as brcddb_common
 import brcddb.brcddb_fabric as brcddb_fabric
 import brcddb.brcddb_switch as brcddb_switch
+import xref_cache
 
 _DOC_STRING = False  # Should always be False. Prohibits any code execution. Only useful for building documentation
 # _STAND_ALONE: True: Executes as a standalone module taking input from the command line. False: Does not automatically
@@ -77,6 +79,7 @@ _input_d = dict(
     i=dict(h='Required. Name of input file generated by capture.py, combine.py, or multi_capture.py'),
     o=dict(h='Required. Name of output file. ".xlsx" is automatically appended.')
 )
+_input_d.update(xref_cache.parseargs_d.copy())
 _input_d.update(gen_util.parseargs_log_d.copy())
 
 # _switch_d is a template copied for each switch to track the number of login types, speed, and SFP type. _speed and
@@ -519,13 +522,15 @@ def _create_report(proj_obj, file_name):
     return ec
 
 
-def psuedo_main(inf, outf):
+def psuedo_main(inf, outf, cache_folder=None):
     """Basically the main(). Did it this way so that it can easily be used as a standalone module or called externally.
 
     :param inf: Input file name
     :type inf: str
     :param outf: Output file name
     :type outf: str
+    :param cache_folder: Folder for cached projects, -xref_cache. None to not cache projects.
+    :type cache_folder: str, None
     :return: Exit code. See exist codes in brcddb.brcddb_common
     :rtype: int
     """
@@ -533,15 +538,13 @@ def psuedo_main(inf, outf):
 
     # Get a project object
     try:
-        proj_obj = brcddb_project.read_from(inf)
+        proj_obj = xref_cache.read_project(inf, cache_folder, cs=True)
     except FileNotFoundError:
         brcdapi_log.log(['', inf + ' not found.'], echo=True)
         return brcddb_common.EXIT_STATUS_USER_ERROR
     if proj_obj is None:
         brcdapi_log.log(['', 'Unknown error reading: ' + inf], echo=True)
         return brcddb_common.EXIT_STATUS_ERROR
-    brcddb_project.build_xref(proj_obj)
-    brcddb_project.add_custom_search_terms(proj_obj)
 
     # Determine the number of logins for each media type and speed
     for fab_obj in proj_obj.r_fabric_objects():
@@ -625,17 +628,19 @@ def _get_input():
     # Command line feedback
     ml = [
         os.path.basename(__file__) + ', ' + __version__,
-        'In file:        ' + args_d['i'],
-        'Out file:       ' + args_d['o'],
-        'Log, -log:      ' + str(args_d['log']),
-        'No log, -nl:    ' + str(args_d['nl']),
-        'Suppress, -sup: ' + str(args_d['sup']),
+        'In file:                 ' + args_d['i'],
+        'Out file:                ' + args_d['o'],
+        'Xref cache, -xref_cache: ' + str(args_d['xref_cache']),
+        'Log, -log:               ' + str(args_d['log']),
+        'No log, -nl:             ' + str(args_d['nl']),
+        'Suppress, -sup:          ' + str(args_d['sup']),
         '',
         ]
     brcdapi_log.log(ml, echo=True)
 
     return psuedo_main(brcdapi_file.full_file_name(args_d['i'], '.json'),
-                       brcdapi_file.full_file_name(args_d['o'], '.xlsx'))
+                       brcdapi_file.full_file_name(args_d['o'], '.xlsx'),
+                       args_d['xref_cache'])
 
 
 ##################################################################
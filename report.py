@@ -20,6 +20,56 @@ details.
 
 Creates a report in Excel Workbook format from a brcddb project
 
+IOCP Parsing
+
+Each IOCP file in the -iocp folder is parsed in a separate process, up to -workers processes, into an empty project.
+The IOCP objects are returned as a plain copy and added to the project in the same order as the files in the -iocp
+folder. With -iocp_cache, the plain copy for each IOCP file is cached in the -iocp_cache folder. The cache file name is
+the hash of the IOCP file name and content so an IOCP file is only parsed again if it changes or is renamed. The CEC
+serial number is taken from the file name so renaming an IOCP file can change the parsed objects.
+
+Profiling
+
+With -prof, the elapsed time and peak memory of each stage (reading the project or the -xref_cache file, building the
+cross-references, custom search terms, writing the -xref_cache file, IOCP parsing, RNID table, groups, best practices,
+report, and the custom report) are displayed when the report is complete. Peak memory is the peak memory allocated by
+Python as reported by tracemalloc, so processing runs slower while profiling. With -cprof, cProfile is also run for each
+stage. The cProfile statistics for each stage, nn_stage.pstats, and a summary, summary.json, are written to the -cprof
+folder. Use pstats.Stats() or a tool such as snakeviz to view the .pstats files.
+
+tracemalloc and cProfile only see this process. With -workers, IOCP parsing and the -split report are done in worker
+processes so the peak memory and the .pstats file for those stages are for this process waiting on the workers. Where
+the resource module is available (not on Windows), the CPU time used by worker processes in each stage, and the
+largest peak memory (maximum resident set size) of any worker process that ended in the stage, are also displayed.
+
+Streaming
+
+With -stream, the report is written in openpyxl write-only mode. Instead of the full report, the workbook contains a
+summary sheet and the row-heavy sheets: ports, logins, zones, and port statistics. Rows are written sequentially as
+they are read from the project, using styles built once, so memory does not grow with the number of rows. This is
+intended for very large projects where the full report takes too much memory or time to save.
+
+The content of the streaming workbook is different from the full report. There are no best practice, mainframe (IOCP
+and RNID), or group sheets so IOCP parsing, the RNID table, groups, and best practices are not processed. -bp, -sfp,
+-group, and -iocp are ignored.
+
+Split Reports
+
+With -split fabric or -split chassis, a workbook is created for each fabric or chassis in parallel, up to -workers at
+a time. The fabric or chassis number and name are appended to the report name, -o, for each workbook. Each workbook
+contains the streaming sheets described above for the switches in that fabric or chassis. The zone sheet of a chassis
+workbook contains the zones of all fabrics the chassis belongs to. As with -stream, IOCP parsing, the RNID table,
+groups, and best practices are not processed so -bp, -sfp, -group, and -iocp are ignored. The project, with the
+cross-references already built, is written to a temporary file once and read once by each worker process. The report,
+-o, is a dashboard with a summary of each fabric or chassis and a hyperlink to its workbook.
+
+Workbooks created with -split are cached in a folder with the same name as the report, -o, with "_cache" appended. The
+cache is keyed by a hash of the fabric or chassis, the fabrics and switches, including the ports, in each workbook,
+and the version of this module. Nothing is rendered to compute the hash. The number of rows in each sheet is saved
+with the cached workbook for the dashboard. Only the workbooks for a fabric or chassis that changed are created again.
+The others are copied from the cache. The dashboard shows which workbooks were created and which were copied from the
+cache.
+
 **Version Control**
 
 +-----------+---------------+---------------------------------------------------------------------------------------+
@@ -47,35 +97,103 @@ Creates a report in Excel Workbook format from a brcddb project
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.1.0     | 20 Feb 2026   | Moved reading and parsing of the groups file to brcddb.report.utils.groups()          |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 19 Oct 2026   | Added -xref_cache to cache cross-referenced projects. See xref_cache.py               |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 19 Oct 2026   | Added -prof and -cprof to time and profile each stage of the report.                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 19 Oct 2026   | IOCP files are parsed in parallel. Added -workers and -iocp_cache.                    |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 19 Oct 2026   | Added -stream to write the port, login, zone, and statistics sheets in write-only mode|
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 19 Oct 2026   | Added -split to create a workbook per fabric or chassis in parallel and a dashboard.  |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.6     | 19 Oct 2026   | Only workbooks for a fabric or chassis whose content changed are rebuilt with -split. |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '19 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.1.0'
+__version__ = '4.1.6'
 
 import os
+import re
+import json
+import datetime
+import concurrent.futures
+import functools
+import time
+import hashlib
+import pickle
+import shutil
+import sys
+import cProfile
+import tracemalloc
+try:
+    import resource  # Not available on Windows. Only used to profile worker processes.
+except ImportError:
+    resource = None
+import openpyxl as xl
+import openpyxl.utils.cell as xl_util
+from openpyxl.cell import WriteOnlyCell
 import brcdapi.log as brcdapi_log
 import brcdapi.file as brcdapi_file
 import brcdapi.excel_util as excel_util
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
+import brcdapi.excel_fonts as excel_fonts
 import brcddb.util.util as brcddb_util
+import brcddb.util.copy as brcddb_copy
 import brcddb.brcddb_project as brcddb_project
+import brcddb.brcddb_fabric as brcddb_fabric
+import brcddb.brcddb_switch as brcddb_switch
+import brcddb.brcddb_port as brcddb_port
+import brcddb.brcddb_chassis as brcddb_chassis
 import brcddb.apps.report as brcddb_report
 import brcddb.report.utils as report_utils
 import brcddb.brcddb_common as brcddb_common
 import brcddb.brcddb_bp as brcddb_bp
 import brcddb.app_data.alert_tables as al
 import brcddb.util.iocp as brcddb_iocp
+import xref_cache
 
 _DOC_STRING = False  # Should always be False. Prohibits any code execution. Only useful for building documentation
 # _STAND_ALONE: True: Executes as a standalone module taking input from the command line. False: Does not automatically
 # execute. This is useful when importing this module into another module that calls psuedo_main().
 _STAND_ALONE = True  # See note above
+_IOCP_KEY = '_iocp_objs'  # Key for the IOCP objects in the plain copy of a project. See _parse_iocp()
+
+# Styles used in streaming mode, -stream. Built once and shared by every cell.
+_stream_hdr_font = excel_fonts.font_type('bold')
+_stream_std_font = excel_fonts.font_type('std')
+_stream_border = excel_fonts.border_type('thin')
+_stream_wrap = excel_fonts.align_type('wrap')
+_stream_align = None  # Default alignment for data cells. Wrapping text slows Excel down on very large sheets.
+_stream_title_font = excel_fonts.font_type('hdr_1')
+_stream_link_font = excel_fonts.font_type('link')
+_split_proj_obj = None  # Project object used by _split_workbook() in worker processes. Set in _split_init()
+_back_ref_re = re.compile(r'^_\w*_obj$')  # Attributes that refer back to other objects, such as _project_obj
+
+# Port statistics columns in the streaming statistics sheet. Key is the column header. Value is the port object key
+_stream_stats_d = {
+    'Transmit': brcdapi_util.stats_out_frames,
+    'Receive': brcdapi_util.stats_in_frames,
+    'Enc In': brcdapi_util.stats_enc_disp,
+    'CRC': brcdapi_util.stats_crc,
+    'Short': brcdapi_util.stats_tunc,
+    'Long': brcdapi_util.stats_long,
+    'EndFrame': brcdapi_util.stats_bad_eof,
+    'Enc Out': brcdapi_util.stats_enc,
+    'Class3D': brcdapi_util.stats_c3,
+    'Link Fail': brcdapi_util.stats_link_fail,
+    'losSync': brcdapi_util.stats_loss_sync,
+    'losSig': brcdapi_util.stats_loss_sig,
+    'Reject': brcdapi_util.stats_p_rjt,
+    'Busy': brcdapi_util.stats_p_busy,
+}
 
 # Input parameter definitions
 _input_d = dict(
@@ -94,10 +212,35 @@ _input_d = dict(
               h='Optional. Name of folder with IOCP files. All files in this folder must be IOCP files (build I/O '
                 'configuration statements from HCD) and must begin with the CEC serial number followed by \'_\'. '
                 'Leading 0s are not required. Example, for a CPC with serial number 12345: 12345_M90_iocp.txt'),
+    iocp_cache=dict(r=False,
+                    h='Optional. Name of a folder for parsed IOCP files. Each IOCP file in -iocp is only parsed again '
+                      'if it changed or was renamed. The folder is created if it does not exist. By default, IOCP '
+                      'files are parsed every time.'),
     c=dict(r=False,
            h='"options" parameter passed to _custom_report(). This is only useful for developers who have modified '
              '_custom_report().'),
+    prof=dict(r=False, d=False, t='bool',
+              h='Optional. Display the time and peak memory of each stage of the report when processing completes. '
+                'Memory and cProfile statistics are for this process only. The CPU time and peak memory of worker '
+                'processes, see -workers, are displayed separately where supported by the operating system.'),
+    cprof=dict(r=False,
+               h='Optional. Name of folder for profiling data. Implies -prof. cProfile is run for each stage and the '
+                 'statistics are written to a .pstats file for each stage. A summary is written to summary.json.'),
+    workers=dict(r=False, d=0, t='int',
+                 h='Optional. Maximum number of processes used to parse IOCP files and, with -split, to create '
+                   'workbooks. The default, 0, uses one for each processor. 1 does all processing in this process.'),
+    stream=dict(r=False, d=False, t='bool',
+                h='Optional. Instead of the full report, write a summary and the port, login, zone, and statistics '
+                  'sheets in write-only (streaming) mode. Use for very large projects. The content is different from '
+                  'the full report. There are no best practice, IOCP, RNID, or group sheets so -bp, -sfp, -group, and '
+                  '-iocp are ignored.'),
+    split=dict(r=False,
+               h='Optional. "fabric" or "chassis". Creates a workbook, as with -stream, for each fabric or chassis in '
+                 'parallel. The number and name of the fabric or chassis are appended to the report name, -o, for '
+                 'each workbook. The report, -o, is a dashboard with hyperlinks to each workbook. As with -stream, '
+                 '-bp, -sfp, -group, and -iocp are ignored.'),
 )
+_input_d.update(xref_cache.parseargs_d.copy())
 _input_d.update(gen_util.parseargs_log_d.copy())
 
 
@@ -155,7 +298,762 @@ def _rnid_summary(proj_obj):
     return
 
 
-def pseudo_main(proj_obj, outf, bp_rules, sfp_rules, group_file, iocp, custom_parms):
+def _prof_init(prof, cprof):
+    """Sets up profiling
+
+    :param prof: If True, time each stage and record peak memory
+    :type prof: bool
+    :param cprof: Name of folder for cProfile statistics and the summary. If not None, prof is assumed True
+    :type cprof: str, None
+    :return: Profiling data passed to _run_stage() and _prof_report(). None if profiling is not enabled
+    :rtype: dict, None
+    """
+    if not prof and cprof is None:
+        return None
+    if cprof is not None:
+        os.makedirs(cprof, exist_ok=True)
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    return dict(folder=cprof, stage_l=list(), started=started, start=time.perf_counter())
+
+
+def _child_usage():
+    """Returns the resource usage of terminated worker processes. Not available on Windows.
+
+    :return cpu: User and system CPU seconds of all terminated child processes. None if not available.
+    :rtype cpu: float, None
+    :return peak_mb: Largest maximum resident set size, in MB, of any terminated child process. None if not available.
+    :rtype peak_mb: float, None
+    """
+    if resource is None:
+        return None, None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime, usage.ru_maxrss / (1048576 if sys.platform == 'darwin' else 1024)
+
+
+def _run_stage(prof_d, stage, func, *args):
+    """Runs a stage of the report. If profiling, the time and peak memory are recorded and cProfile is run if requested
+
+    :param prof_d: Returned from _prof_init()
+    :type prof_d: dict, None
+    :param stage: Name of the stage. Used in the summary and the cProfile statistics file name
+    :type stage: str
+    :param func: Method to call
+    :type func: method
+    :param args: Arguments passed to func
+    :type args: any
+    :return: The return value from func
+    :rtype: any
+    """
+    if prof_d is None:
+        return func(*args)
+
+    profiler = None if prof_d['folder'] is None else cProfile.Profile()
+    tracemalloc.reset_peak()
+    child_cpu, child_peak_mb = _child_usage()
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        return func(*args)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        stage_d = dict(stage=stage,
+                       seconds=round(time.perf_counter() - start, 3),
+                       peak_mb=round(tracemalloc.get_traced_memory()[1] / 1048576, 1),
+                       child_cpu=None,
+                       child_peak_mb=None)
+        if child_cpu is not None:
+            cpu, peak_mb = _child_usage()
+            stage_d['child_cpu'] = round(cpu - child_cpu, 3)
+            if peak_mb > child_peak_mb:  # RUSAGE_CHILDREN only reports the largest so far
+                stage_d['child_peak_mb'] = round(peak_mb, 1)
+        prof_d['stage_l'].append(stage_d)
+        if profiler is not None:
+            stage_d['pstats'] = prof_d['folder'] + '/' + str(len(prof_d['stage_l'])).zfill(2) + '_' + stage + '.pstats'
+            profiler.dump_stats(stage_d['pstats'])
+
+
+def _prof_report(prof_d):
+    """Displays the profiling summary. If a cProfile folder was specified, the summary is also written to summary.json
+
+    :param prof_d: Returned from _prof_init()
+    :type prof_d: dict, None
+    """
+    if prof_d is None:
+        return
+    total = round(time.perf_counter() - prof_d['start'], 3)
+    peak_mb = round(tracemalloc.get_traced_memory()[1] / 1048576, 1)
+    peak_mb = max([peak_mb] + [d['peak_mb'] for d in prof_d['stage_l']])
+    if prof_d['started']:
+        tracemalloc.stop()
+
+    ml = ['',
+          'Profile Summary',
+          '_______________',
+          '',
+          'Stage'.ljust(24) + 'Seconds'.rjust(12) + 'Peak MB'.rjust(12) + 'Worker CPU'.rjust(12) +
+          'Worker MB'.rjust(12)]
+    for d in prof_d['stage_l']:
+        ml.append(d['stage'].ljust(24) + str(d['seconds']).rjust(12) + str(d['peak_mb']).rjust(12) +
+                  ('' if d['child_cpu'] is None else str(d['child_cpu'])).rjust(12) +
+                  ('' if d['child_peak_mb'] is None else str(d['child_peak_mb'])).rjust(12))
+    ml.extend(['Total'.ljust(24) + str(total).rjust(12) + str(peak_mb).rjust(12), ''])
+    if prof_d['folder'] is not None:
+        file = prof_d['folder'] + '/summary.json'
+        try:
+            with open(file, 'w') as f:
+                json.dump(dict(stages=prof_d['stage_l'], seconds=total, peak_mb=peak_mb), f, indent=2)
+            ml.extend(['Summary and cProfile statistics (.pstats) written to: ' + prof_d['folder'], ''])
+        except OSError as e:
+            ml.extend(['Could not write ' + file + '. Error is: ' + str(e), ''])
+    brcdapi_log.log(ml, echo=True)
+
+
+def _parse_iocp(task):
+    """Parses an IOCP file into an empty project and returns a plain copy of the IOCP objects. Runs in a worker process
+
+    :param task: Name of the IOCP file and the name of the cache folder. The cache folder is None to not cache.
+    :type task: tuple
+    :return: Plain copy of the project with just the IOCP objects, _IOCP_KEY. None if _IOCP_KEY is not in the plain copy
+    :rtype: dict, None
+    """
+    global _IOCP_KEY
+
+    file, cache_folder = task
+
+    # Use the cached copy if this IOCP file was already parsed. The CEC serial number is taken from the file name so the
+    # file name is part of the hash.
+    cache_file = None
+    if cache_folder is not None:
+        h = hashlib.sha256(str(getattr(brcddb_iocp, '__version__', '')).encode())
+        h.update(os.path.basename(file).encode())
+        with open(file, 'rb') as f:
+            for buf in iter(lambda: f.read(1048576), b''):
+                h.update(buf)
+        cache_file = cache_folder + '/' + h.hexdigest() + '.json'
+        try:
+            with open(cache_file, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            pass
+
+    # Parse the IOCP and keep just the IOCP objects
+    temp_proj_obj = brcddb_project.new('iocp', datetime.datetime.now().strftime('%d %b %Y %H:%M:%S'))
+    brcddb_iocp.parse_iocp(temp_proj_obj, file)
+    plain_copy = dict()
+    brcddb_copy.brcddb_to_plain_copy(temp_proj_obj, plain_copy)
+    if _IOCP_KEY not in plain_copy:
+        return None
+    iocp_d = {_IOCP_KEY: plain_copy[_IOCP_KEY]}
+    if cache_file is None:
+        return iocp_d
+
+    # Save it in the cache. Not being able to save it is not an error. It just gets parsed again next time.
+    temp_file = cache_file + '.' + str(os.getpid()) + '.tmp'
+    try:
+        os.makedirs(cache_folder, exist_ok=True)
+        with open(temp_file, 'w') as f:
+            json.dump(iocp_d, f)
+        os.replace(temp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
+    return iocp_d
+
+
+def _parse_iocps(proj_obj, iocp, workers=None, cache_folder=None):
+    """Parses all the IOCP files in a folder in parallel and adds the IOCP objects to the project in file order
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param iocp: Name of folder containing IOCP files, -iocp
+    :type iocp: str, None
+    :param workers: Maximum number of worker processes. None uses one for each processor.
+    :type workers: int, None
+    :param cache_folder: Name of folder for parsed IOCP files, -iocp_cache. None to not cache. See _parse_iocp()
+    :type cache_folder: str, None
+    :return: Exit code. See exist codes in brcddb.brcddb_common
+    :rtype: int
+    """
+    global _IOCP_KEY
+
+    ec, file_l = brcddb_common.EXIT_STATUS_OK, [iocp + '/' + file for file in brcdapi_file.read_directory(iocp)]
+    task_l = [(file, cache_folder) for file in file_l]
+
+    executor = None
+    if workers != 1 and len(task_l) > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    try:
+        result_i = map(_parse_iocp, task_l) if executor is None else executor.map(_parse_iocp, task_l)
+        for file, iocp_d in zip(file_l, result_i):
+            if iocp_d is None:
+                brcdapi_log.log('**ERROR** ' + _IOCP_KEY + ' not found in the parsed project for ' + file +
+                                '. The IOCP objects for this file were not added.', echo=True)
+                ec = brcddb_common.EXIT_STATUS_ERROR
+            else:
+                brcddb_copy.plain_copy_to_brcddb(iocp_d, proj_obj)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return ec
+
+
+def _stream_names(port_obj):
+    """Returns the fabric, switch, and port names used in the first columns of the streaming sheets
+
+    :param port_obj: Port object
+    :type port_obj: brcddb.classes.port.PortObj
+    :return: Fabric name, switch name, port name
+    :rtype: list
+    """
+    fab_obj = port_obj.r_fabric_obj()
+    return ['' if fab_obj is None else brcddb_fabric.best_fab_name(fab_obj, wwn=True),
+            brcddb_switch.best_switch_name(port_obj.r_switch_obj(), did=True),
+            port_obj.r_obj_key()]
+
+
+def _stream_port_rows(fab_obj_l, switch_obj_l):
+    """Generator for the rows of the streaming port sheet
+
+    :param fab_obj_l: Fabric objects in the report. Not used. Present so all row generators have the same parameters
+    :type fab_obj_l: list
+    :param switch_obj_l: Switch objects in the report
+    :type switch_obj_l: list
+    :return: Row values
+    :rtype: list
+    """
+    for switch_obj in switch_obj_l:
+        for port_obj in brcddb_util.sort_ports(switch_obj.r_port_objects()):
+            speed = port_obj.r_get(brcdapi_util.fc_speed)
+            yield _stream_names(port_obj) + [
+                port_obj.r_index(),
+                port_obj.r_get(brcdapi_util.fc_user_name),
+                brcddb_port.port_best_desc(port_obj),
+                'Online' if port_obj.r_is_online() else 'Offline',
+                port_obj.c_login_type(),
+                int(speed / 1000000000) if isinstance(speed, int) else None,
+                len(port_obj.r_login_objects()),
+            ]
+
+
+def _stream_login_rows(fab_obj_l, switch_obj_l):
+    """Generator for the rows of the streaming login sheet. See _stream_port_rows() for parameter definitions."""
+    for switch_obj in switch_obj_l:
+        for port_obj in brcddb_util.sort_ports(switch_obj.r_port_objects()):
+            name_l = None
+            for login_obj in port_obj.r_login_objects():
+                if name_l is None:
+                    name_l = _stream_names(port_obj)
+                wwn, fab_obj = login_obj.r_obj_key(), login_obj.r_fabric_obj()
+                fc4 = login_obj.r_get(brcdapi_util.bns_fc4_features)
+                yield name_l + [
+                    wwn,
+                    None if fab_obj is None else ', '.join(fab_obj.r_alias_for_wwn(wwn)),
+                    ', '.join(fc4) if isinstance(fc4, list) else fc4,
+                    login_obj.r_get(brcdapi_util.bns_node_symbol),
+                ]
+
+
+def _stream_zone_rows(fab_obj_l, switch_obj_l):
+    """Generator for the rows of the streaming zone sheet. See _stream_port_rows() for parameter definitions."""
+    for fab_obj in fab_obj_l:
+        fab_name = brcddb_fabric.best_fab_name(fab_obj, wwn=True)
+        eff_d = {zone_obj.r_obj_key(): True for zone_obj in fab_obj.r_eff_zone_objects()}
+        for zone_obj in fab_obj.r_zone_objects():
+            zone = zone_obj.r_obj_key()
+            zone_l = [fab_name, zone, 'Peer' if zone_obj.r_is_peer() else 'Standard', eff_d.get(zone, False)]
+            for principal, mem_l in ((True, zone_obj.r_pmembers()), (False, zone_obj.r_members())):
+                for mem in mem_l:
+                    alias_obj = fab_obj.r_alias_obj(mem)
+                    yield zone_l + [principal, mem, None if alias_obj is None else ', '.join(alias_obj.r_members())]
+
+
+def _stream_stats_rows(fab_obj_l, switch_obj_l):
+    """Generator for the rows of the streaming statistics sheet. See _stream_port_rows() for parameter definitions."""
+    global _stream_stats_d
+
+    for switch_obj in switch_obj_l:
+        for port_obj in brcddb_util.sort_ports(switch_obj.r_port_objects()):
+            if isinstance(port_obj.r_get(brcdapi_util.stats_uri), dict):
+                yield _stream_names(port_obj) + [port_obj.r_get(k) for k in _stream_stats_d.values()]
+
+
+# Sheets written in streaming mode:
+#   s   Sheet name
+#   a   Row generator. Called with the list of fabric objects and the list of switch objects in the report
+#   c   Columns. Tuple of (header, column width)
+_stream_name_c = (('Fabric', 30), ('Switch', 30), ('Port', 8))
+_stream_sheet_l = (
+    dict(s='Ports', a=_stream_port_rows,
+         c=_stream_name_c + (('Index', 7), ('Port Name', 22), ('Description', 40), ('State', 9), ('Type', 12),
+                             ('Speed Gbps', 8), ('Logins', 8))),
+    dict(s='Logins', a=_stream_login_rows,
+         c=_stream_name_c + (('Login WWN', 24), ('Alias', 30), ('FC4 Features', 16), ('Node Symbol', 50))),
+    dict(s='Zones', a=_stream_zone_rows,
+         c=(('Fabric', 30), ('Zone', 30), ('Type', 10), ('Effective', 10), ('Principal', 10), ('Member', 30),
+            ('Alias Members', 50))),
+    dict(s='Statistics', a=_stream_stats_rows,
+         c=_stream_name_c + tuple((k, 12) for k in _stream_stats_d.keys())),
+)
+
+
+def _stream_cell(sheet, val, font, align):
+    """Returns a write-only cell using the pre-built styles
+
+    :param sheet: Worksheet the cell is written to
+    :type sheet: openpyxl.worksheet._write_only.WriteOnlyWorksheet
+    :param val: Cell value
+    :type val: str, int, float, bool, None
+    :param font: Font
+    :type font: openpyxl.styles.fonts.Font
+    :param align: Alignment
+    :type align: openpyxl.styles.alignment.Alignment, None
+    :rtype: openpyxl.cell.cell.WriteOnlyCell
+    """
+    global _stream_border
+
+    cell = WriteOnlyCell(sheet, value=val)
+    cell.font, cell.border = font, _stream_border
+    if align is not None:
+        cell.alignment = align
+    return cell
+
+
+def _stream_sheet(wb, sheet_d, fab_obj_l, switch_obj_l):
+    """Adds a sheet to a write-only workbook. Rows are written as they are generated so they are not kept in memory.
+
+    :param wb: Write-only workbook
+    :type wb: openpyxl.workbook.workbook.Workbook
+    :param sheet_d: Sheet definition from _stream_sheet_l
+    :type sheet_d: dict
+    :param fab_obj_l: Fabric objects in the report
+    :type fab_obj_l: list
+    :param switch_obj_l: Switch objects in the report
+    :type switch_obj_l: list
+    :return: Number of rows written, not including the header
+    :rtype: int
+    """
+    global _stream_hdr_font, _stream_std_font, _stream_wrap, _stream_align
+
+    sheet = wb.create_sheet(title=sheet_d['s'])
+    col = 0
+    for col in range(1, len(sheet_d['c']) + 1):
+        sheet.column_dimensions[xl_util.get_column_letter(col)].width = sheet_d['c'][col - 1][1]
+    sheet.freeze_panes = 'A2'
+    sheet.append([_stream_cell(sheet, t[0], _stream_hdr_font, _stream_wrap) for t in sheet_d['c']])
+    row = 0
+    for row_l in sheet_d['a'](fab_obj_l, switch_obj_l):
+        sheet.append([_stream_cell(sheet, val, _stream_std_font, _stream_align) for val in row_l])
+        row += 1
+    sheet.auto_filter.ref = 'A1:' + xl_util.get_column_letter(col) + str(row + 1)
+
+    return row
+
+
+def _stream_workbook(title, outf, fab_obj_l, switch_obj_l):
+    """Writes a summary and the sheets in _stream_sheet_l in write-only mode.
+
+    Nothing is logged from here because this is also called from worker processes. Messages are returned instead.
+
+    :param title: Title for the summary sheet
+    :type title: str
+    :param outf: Output file name
+    :type outf: str
+    :param fab_obj_l: Fabric objects in the report
+    :type fab_obj_l: list
+    :param switch_obj_l: Switch objects in the report
+    :type switch_obj_l: list
+    :return ec: Exit code. See exit codes in brcddb.brcddb_common
+    :rtype ec: int
+    :return msg: Error message. Empty if no errors.
+    :rtype msg: str
+    :return row_d: Key is the sheet name. Value is the number of rows written to the sheet
+    :rtype row_d: dict
+    """
+    global _stream_sheet_l, _stream_hdr_font, _stream_std_font
+
+    wb, row_d = xl.Workbook(write_only=True), dict()
+
+    # The summary sheet is created first so it's the first sheet. Write-only sheets can be appended to in any order.
+    summary_sheet = wb.create_sheet(title='Summary')
+    summary_sheet.column_dimensions['A'].width = 30
+    summary_sheet.column_dimensions['B'].width = 12
+    summary_sheet.append([_stream_cell(summary_sheet, title, _stream_hdr_font, None)])
+    summary_sheet.append([])
+    summary_sheet.append([_stream_cell(summary_sheet, buf, _stream_hdr_font, None) for buf in ('Sheet', 'Rows')])
+    for sheet_d in _stream_sheet_l:
+        row_d[sheet_d['s']] = _stream_sheet(wb, sheet_d, fab_obj_l, switch_obj_l)
+        summary_sheet.append([_stream_cell(summary_sheet, sheet_d['s'], _stream_std_font, None),
+                              _stream_cell(summary_sheet, row_d[sheet_d['s']], _stream_std_font, None)])
+
+    try:
+        wb.save(outf)
+    except PermissionError:
+        buf = 'Write access permission for ' + outf + ' denied. This typically occurs when the file is open'
+        return brcddb_common.EXIT_STATUS_USER_ERROR, buf, row_d
+    except (FileExistsError, FileNotFoundError):
+        return brcddb_common.EXIT_STATUS_USER_ERROR, 'The folder in the path for ' + outf + ' does not exist.', row_d
+
+    return brcddb_common.EXIT_STATUS_OK, '', row_d
+
+
+def _stream_report(proj_obj, outf):
+    """Writes the summary, port, login, zone, and statistics sheets in write-only mode. Used with -stream.
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param outf: Output file name, -o
+    :type outf: str
+    :return: Exit code. See exist codes in brcddb.brcddb_common
+    :rtype: int
+    """
+    brcdapi_log.log('Writing ' + outf, echo=True)
+    ec, msg, row_d = _stream_workbook(proj_obj.r_obj_key(),
+                                      outf,
+                                      proj_obj.r_fabric_objects(),
+                                      proj_obj.r_switch_objects())
+    if ec != brcddb_common.EXIT_STATUS_OK:
+        brcdapi_log.log(['', msg], echo=True)
+
+    return ec
+
+
+def _split_scope(proj_obj, split, key):
+    """Returns the name, fabric objects, and switch objects for the workbook of a fabric or chassis
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param split: "fabric" or "chassis", -split
+    :type split: str
+    :param key: Fabric or chassis object key
+    :type key: str
+    :return name: Fabric or chassis name
+    :rtype name: str
+    :return fab_obj_l: Fabric objects. For a chassis, all fabrics the chassis belongs to
+    :rtype fab_obj_l: list
+    :return switch_obj_l: Switch objects in the fabric or chassis
+    :rtype switch_obj_l: list
+    """
+    if split == 'fabric':
+        fab_obj = proj_obj.r_fabric_obj(key)
+        return brcddb_fabric.best_fab_name(fab_obj, wwn=True), [fab_obj], fab_obj.r_switch_objects()
+
+    chassis_obj = proj_obj.r_chassis_obj(key)
+    switch_obj_l, fab_obj_d = chassis_obj.r_switch_objects(), dict()
+    for switch_obj in switch_obj_l:
+        fab_obj = switch_obj.r_fabric_obj()
+        if fab_obj is not None:
+            fab_obj_d[fab_obj.r_obj_key()] = fab_obj
+    return brcddb_chassis.best_chassis_name(chassis_obj, wwn=True), list(fab_obj_d.values()), switch_obj_l
+
+
+def _split_init(proj_file, proj_obj=None):
+    """Makes the project available to _split_workbook(). Called once in each worker process.
+
+    :param proj_file: Name of the file with the pickled project. Only used if proj_obj is None
+    :type proj_file: str, None
+    :param proj_obj: Project object. Used when the workbooks are created in this process.
+    :type proj_obj: brcddb.classes.project.ProjectObj, None
+    """
+    global _split_proj_obj
+
+    if proj_obj is None:
+        with open(proj_file, 'rb') as f:
+            proj_obj = pickle.load(f)
+    _split_proj_obj = proj_obj
+
+
+def _hash_obj(h, obj, visited):
+    """Adds an object, and everything it contains, to a hash. Dictionary keys and object attributes are added in sorted
+    order so the hash only depends on the content. Back references to containing objects, see _back_ref_re, are not
+    followed.
+
+    :param h: Hash object the content is added to
+    :type h: hashlib._Hash
+    :param obj: Object to add to the hash
+    :type obj: any
+    :param visited: id() of the objects already added. Keeps objects referenced more than once from being added again.
+    :type visited: set
+    :rtype: None
+    """
+    global _back_ref_re
+
+    if hasattr(obj, '__dict__') and not isinstance(obj, type):
+        if id(obj) in visited:
+            h.update(b'ref\0')
+            return
+        visited.add(id(obj))
+        h.update(type(obj).__name__.encode() + b'\0')
+        obj = {k: v for k, v in vars(obj).items() if not _back_ref_re.match(k)}
+    if isinstance(obj, dict):
+        h.update(b'{')
+        for k in sorted(obj, key=str):
+            h.update(str(k).encode('utf-8', errors='replace') + b'\0')
+            _hash_obj(h, obj[k], visited)
+        h.update(b'}')
+    elif isinstance(obj, (list, tuple)):
+        h.update(b'[')
+        for v in obj:
+            _hash_obj(h, v, visited)
+        h.update(b']')
+    else:
+        h.update((type(obj).__name__ + ':' + str(obj) + '\0').encode('utf-8', errors='replace'))
+
+
+def _split_hash(name, obj, fab_obj_l, switch_obj_l):
+    """Returns the content hash of a fabric or chassis workbook.
+
+    The hash is computed from the fabric or chassis object, the fabrics, and the switches, including the ports, in the
+    workbook. Nothing is rendered so this is much faster than creating the workbook. The version of this module is
+    included so that all workbooks are created again when it changes.
+
+    :param name: Fabric or chassis name
+    :type name: str
+    :param obj: Fabric or chassis object
+    :type obj: brcddb.classes.fabric.FabricObj, brcddb.classes.chassis.ChassisObj
+    :param fab_obj_l: Fabric objects in the workbook
+    :type fab_obj_l: list
+    :param switch_obj_l: Switch objects in the workbook
+    :type switch_obj_l: list
+    :return: Hex digest
+    :rtype: str
+    """
+    global __version__
+
+    h = hashlib.sha256(json.dumps([__version__, name]).encode())
+    _hash_obj(h, [obj, fab_obj_l, switch_obj_l], set())
+
+    return h.hexdigest()
+
+
+def _split_row_file(cache_file):
+    """Returns the name of the file with the number of rows in each sheet of a cached workbook
+
+    :param cache_file: Name of the cached workbook
+    :type cache_file: str
+    :return: Name of the JSON file next to the cached workbook
+    :rtype: str
+    """
+    return cache_file[0:len(cache_file)-len('.xlsx')] + '.json'
+
+
+def _read_split_rows(cache_file):
+    """Reads the number of rows in each sheet of a cached workbook. See _split_row_file()
+
+    :param cache_file: Name of the cached workbook
+    :type cache_file: str
+    :return: Key is the sheet name. Value is the number of rows in the sheet. None if the file is missing or not valid.
+    :rtype: dict, None
+    """
+    try:
+        with open(_split_row_file(cache_file), 'r') as f:
+            row_d = json.load(f)
+        return row_d if isinstance(row_d, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _split_workbook(task):
+    """Creates the workbook for a single fabric or chassis and adds it to the cache. Called from a process pool by
+    _split_report()
+
+    The number of rows in each sheet, used in the dashboard, is saved next to the cached workbook in a JSON file. See
+    _split_row_file().
+
+    :param task: -split, the fabric or chassis key, the name of the workbook, and the name of the cache file
+    :type task: tuple
+    :return: Return from _stream_workbook()
+    :rtype: tuple
+    """
+    global _split_proj_obj
+
+    split, key, file, cache_file = task
+    name, fab_obj_l, switch_obj_l = _split_scope(_split_proj_obj, split, key)
+    r = _stream_workbook(name, file, fab_obj_l, switch_obj_l)
+
+    # Save it in the cache. Not being able to save it is not an error. It just gets created again next time. The row
+    # counts are written last because a cached workbook without them is not used.
+    if r[0] == brcddb_common.EXIT_STATUS_OK:
+        temp_file = cache_file + '.' + str(os.getpid()) + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            shutil.copyfile(file, temp_file)
+            os.replace(temp_file, cache_file)
+            with open(temp_file, 'w') as f:
+                json.dump(r[2], f)
+            os.replace(temp_file, _split_row_file(cache_file))
+        except OSError:
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+
+    return r
+
+
+def _split_report(proj_obj, outf, split, workers=None):
+    """Creates a workbook for each fabric or chassis in parallel and a dashboard, -o, with hyperlinks to each.
+
+    Workbooks are cached in a folder with the same name as the report, -o, with "_cache" appended. The cache file name
+    is the content hash returned from _split_hash(). Only workbooks whose content hash is not in the cache are created.
+    The others are copied from the cache. A cached workbook without its row counts, see _split_row_file(), is created
+    again. Cache files not used by this report are removed.
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param outf: Output file name, -o
+    :type outf: str
+    :param split: "fabric" or "chassis", -split
+    :type split: str
+    :param workers: Maximum number of worker processes. None uses one for each processor.
+    :type workers: int, None
+    :return: Exit code. See exist codes in brcddb.brcddb_common
+    :rtype: int
+    """
+    global _stream_sheet_l, _stream_title_font, _stream_hdr_font, _stream_std_font, _stream_link_font, _stream_wrap
+    global _stream_border
+
+    ec, task_l, section_l = brcddb_common.EXIT_STATUS_OK, list(), list()
+    base_name = outf[0:len(outf)-len('.xlsx')] if outf.lower().endswith('.xlsx') else outf
+    cache_folder = base_name + '_cache'
+
+    # Use the cached workbook for each fabric or chassis that hasn't changed. Build a task for the others.
+    brcdapi_log.log('Checking for changes in each ' + split, echo=True)
+    obj_l = proj_obj.r_fabric_objects() if split == 'fabric' else proj_obj.r_chassis_objects()
+    for i, obj in enumerate(obj_l):
+        name, fab_obj_l, switch_obj_l = _split_scope(proj_obj, split, obj.r_obj_key())
+        content_hash = _split_hash(name, obj, fab_obj_l, switch_obj_l)
+        section_d = dict(key=obj.r_obj_key(),
+                         name=name,
+                         switches=len(switch_obj_l),
+                         file=base_name + '_' + str(i) + '_' + re.sub(r'[^\w\-]', '_', name) + '.xlsx',
+                         cache_file=cache_folder + '/' + split + '_' + content_hash + '.xlsx',
+                         row_d=None,
+                         status='Cached')
+        section_l.append(section_d)
+        if os.path.isfile(section_d['cache_file']):
+            section_d['row_d'] = _read_split_rows(section_d['cache_file'])
+        if section_d['row_d'] is not None:
+            try:
+                shutil.copyfile(section_d['cache_file'], section_d['file'])
+                brcdapi_log.log('Copied ' + section_d['cache_file'] + ' to ' + section_d['file'])
+                continue
+            except PermissionError:
+                brcdapi_log.log('Permission error writing ' + section_d['file'] + '. This typically occurs when the '
+                                'file is open in Excel.', echo=True)
+                section_d.update(row_d=None, status='Failed')
+                ec = brcddb_common.EXIT_STATUS_USER_ERROR
+                continue
+            except OSError:
+                pass  # Create it again
+        section_d['status'] = 'Created'
+        task_l.append(section_d)
+    brcdapi_log.log(str(len(section_l) - len(task_l)) + ' of ' + str(len(section_l)) + ' ' + split +
+                    ' workbooks are unchanged.', echo=True)
+
+    # Create the fabric or chassis workbooks that changed. The worker processes read the project from a temporary file
+    # so the cross-references are not rebuilt in each process.
+    if len(task_l) > 0:
+        brcdapi_log.log('Creating ' + str(len(task_l)) + ' ' + split + ' workbooks', echo=True)
+    executor, proj_file = None, None
+    if workers != 1 and len(task_l) > 1:
+        proj_file = base_name + '_split.pkl.tmp'
+        try:
+            with open(proj_file, 'wb') as f:
+                pickle.dump(proj_obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                              initializer=_split_init,
+                                                              initargs=(proj_file,))
+        except (OSError, AttributeError, TypeError, RecursionError, pickle.PicklingError) as e:
+            brcdapi_log.log(['Could not write ' + proj_file + '. Creating workbooks in this process. Exception is:',
+                             str(type(e)) + ': ' + str(e)], echo=True)
+    if executor is None:
+        _split_init(None, proj_obj)
+    try:
+        worker_task_l = [(split, d['key'], d['file'], d['cache_file']) for d in task_l]
+        result_i = map(_split_workbook, worker_task_l) if executor is None else \
+            executor.map(_split_workbook, worker_task_l)
+        for section_d, (task_ec, msg, row_d) in zip(task_l, result_i):
+            if task_ec == brcddb_common.EXIT_STATUS_OK:
+                brcdapi_log.log('Wrote ' + section_d['file'])
+                section_d['row_d'] = row_d
+            else:
+                brcdapi_log.log(msg, echo=True)
+                section_d.update(row_d=None, status='Failed')
+                ec = task_ec
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if proj_file is not None:
+            try:
+                os.remove(proj_file)
+            except OSError:
+                pass
+
+    # Remove cache files for this type of split that are no longer used
+    if os.path.isdir(cache_folder):
+        used_d = dict()
+        for section_d in section_l:
+            used_d[os.path.basename(section_d['cache_file'])] = True
+            used_d[os.path.basename(_split_row_file(section_d['cache_file']))] = True
+        for file in brcdapi_file.read_directory(cache_folder):
+            if file.startswith(split + '_') and file.endswith(('.xlsx', '.json')) and file not in used_d:
+                try:
+                    os.remove(cache_folder + '/' + file)
+                except OSError:
+                    pass
+
+    # Create the dashboard
+    wb = excel_util.new_report()
+    sheet = wb.create_sheet(index=0, title='Dashboard')
+    hdr_l = [split.capitalize(), 'Status', 'Switches'] + [sheet_d['s'] for sheet_d in _stream_sheet_l]
+    sheet.column_dimensions['A'].width = 50
+    for col in range(2, len(hdr_l) + 1):
+        sheet.column_dimensions[xl_util.get_column_letter(col)].width = 12
+    row, col = 1, 1
+    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(hdr_l))
+    excel_util.cell_update(sheet, row, col, proj_obj.r_obj_key(), font=_stream_title_font, align=_stream_wrap)
+    row += 2
+    for buf in hdr_l:
+        excel_util.cell_update(sheet, row, col, buf, font=_stream_hdr_font, align=_stream_wrap, border=_stream_border)
+        col += 1
+    sheet.freeze_panes = 'A' + str(row + 1)
+    for section_d in section_l:
+        row, col = row + 1, 1
+        row_d = section_d['row_d']
+        if row_d is None:
+            excel_util.cell_update(sheet, row, col, section_d['name'], font=_stream_std_font, border=_stream_border)
+            row_d = dict()
+        else:
+            excel_util.cell_update(sheet, row, col, section_d['name'], font=_stream_link_font, border=_stream_border,
+                                   link=os.path.basename(section_d['file']))
+        for val in [section_d['status'], section_d['switches']] + [row_d.get(d['s']) for d in _stream_sheet_l]:
+            col += 1
+            excel_util.cell_update(sheet, row, col, val, font=_stream_std_font, border=_stream_border)
+
+    brcdapi_log.log('Writing ' + outf, echo=True)
+    try:
+        excel_util.save_report(wb, outf)
+    except FileExistsError:
+        brcdapi_log.log('Folder in ' + outf + ' does not exist', echo=True)
+        ec = brcddb_common.EXIT_STATUS_USER_ERROR
+    except PermissionError:
+        buf = 'Permission error writing ' + outf + '. This typically occurs when the file is open in Excel.'
+        brcdapi_log.log(buf, echo=True)
+        ec = brcddb_common.EXIT_STATUS_USER_ERROR
+
+    return ec
+
+
+def pseudo_main(proj_obj, outf, bp_rules, sfp_rules, group_file, iocp, custom_parms, xref=True, prof_d=None,
+                workers=None, stream=False, split=None, iocp_cache=None):
     """Basically the main(). Did it this way so that it can easily be used as a standalone module or called externally.
 
     :param proj_obj: Project object
@@ -172,36 +1070,64 @@ def pseudo_main(proj_obj, outf, bp_rules, sfp_rules, group_file, iocp, custom_pa
     :type iocp: str, None
     :param custom_parms: Custom report parameters passed to _custom_report(), -c. Typically not used.
     :type custom_parms: str, None
+    :param xref: If True, build the cross-references and add the custom search terms. False if already done.
+    :type xref: bool
+    :param prof_d: Profiling data returned from _prof_init(). None if not profiling
+    :type prof_d: dict, None
+    :param workers: Maximum number of worker processes. None uses one for each processor.
+    :type workers: int, None
+    :param stream: If True, write the port, login, zone, and statistics sheets in write-only mode instead of the report
+    :type stream: bool
+    :param split: "fabric" or "chassis" to create a workbook for each fabric or chassis and a dashboard. See -split
+    :type split: str, None
+    :param iocp_cache: Name of folder for parsed IOCP files, -iocp_cache. None to not cache parsed IOCP files.
+    :type iocp_cache: str, None
     :return: Exit code. See exist codes in brcddb.brcddb_common
     :rtype: int
     """
     # Perform all pre-processing (parse IOCPs, build references, ...)
-    brcdapi_log.log('Building cross-references', echo=True)
-    brcddb_project.build_xref(proj_obj)
-    brcddb_project.add_custom_search_terms(proj_obj)
-    brcdapi_log.log('Performing mainframe checks', echo=True)
-    for file in brcdapi_file.read_directory(iocp):
-        brcddb_iocp.parse_iocp(proj_obj, iocp + '/' + file)
-    brcdapi_log.log('Building mainframe device groups', echo=True)
-    brcddb_iocp.build_rnid_table(proj_obj)
-    brcdapi_log.log('Analyzing project for best practices', echo=True)
-
-    # Get the groups, -group.
-    group_d, el = report_utils.groups(proj_obj, group_file)
-    if len(el) > 0:
-        brcdapi_log.log(el, echo=True)
-        proj_obj.s_user_error_flag()
-    brcddb_util.add_to_obj(proj_obj, 'report_app/group_d', group_d)
-
-    # Add best practice alerts to the appropriate objects
-    brcddb_bp.best_practice(bp_rules, sfp_rules, al.AlertTable.alertTbl, proj_obj)
+    if xref:
+        brcdapi_log.log('Building cross-references', echo=True)
+        _run_stage(prof_d, 'build_xref', brcddb_project.build_xref, proj_obj)
+        _run_stage(prof_d, 'custom_search_terms', brcddb_project.add_custom_search_terms, proj_obj)
+    # The streaming and split workbooks don't have mainframe, group, or best practice sheets so there is no need to
+    # process them
+    group_d = dict()
+    if not stream and split is None:
+        brcdapi_log.log('Performing mainframe checks', echo=True)
+        if _run_stage(prof_d, 'iocp', _parse_iocps, proj_obj, iocp, workers, iocp_cache) != \
+                brcddb_common.EXIT_STATUS_OK:
+            proj_obj.s_user_error_flag()
+        brcdapi_log.log('Building mainframe device groups', echo=True)
+        _run_stage(prof_d, 'rnid_table', brcddb_iocp.build_rnid_table, proj_obj)
+        brcdapi_log.log('Analyzing project for best practices', echo=True)
+
+        # Get the groups, -group.
+        group_d, el = _run_stage(prof_d, 'groups', report_utils.groups, proj_obj, group_file)
+        if len(el) > 0:
+            brcdapi_log.log(el, echo=True)
+            proj_obj.s_user_error_flag()
+        brcddb_util.add_to_obj(proj_obj, 'report_app/group_d', group_d)
+
+        # Add best practice alerts to the appropriate objects
+        _run_stage(prof_d, 'best_practice', brcddb_bp.best_practice, bp_rules, sfp_rules, al.AlertTable.alertTbl,
+                   proj_obj)
 
     # Generate the report
-    brcddb_report.report(proj_obj, outf, group_d)
-    _custom_report(proj_obj, custom_parms)
+    if split is not None:
+        if _run_stage(prof_d, 'report', _split_report, proj_obj, outf, split, workers) != \
+                brcddb_common.EXIT_STATUS_OK:
+            proj_obj.s_user_error_flag()
+    elif stream:
+        if _run_stage(prof_d, 'report', _stream_report, proj_obj, outf) != brcddb_common.EXIT_STATUS_OK:
+            proj_obj.s_user_error_flag()
+    else:
+        _run_stage(prof_d, 'report', brcddb_report.report, proj_obj, outf, group_d)
+    _run_stage(prof_d, 'custom_report', _custom_report, proj_obj, custom_parms)
 
     # Display a summary of RNID data
     _rnid_summary(proj_obj)
+    _prof_report(prof_d)
 
     return brcddb_common.EXIT_STATUS_ERROR if proj_obj.r_is_any_error() else brcddb_common.EXIT_STATUS_OK
 
@@ -225,6 +1151,12 @@ def _get_input():
         version_d=brcdapi_util.get_import_modules()
     )
 
+    # Validate the input
+    ec, split_help = brcddb_common.EXIT_STATUS_OK, ''
+    if args_d['split'] not in (None, 'fabric', 'chassis'):
+        split_help = ' **ERROR** Must be fabric or chassis'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+
     # Command line feedback
     ml = [os.path.basename(__file__) + ', ' + __version__,
           'In file, -i:                 ' + args_d['i'],
@@ -234,12 +1166,21 @@ def _get_input():
           'Best practice sheet, -sheet: ' + str(args_d['sheet']),
           'Zone groups, -group:         ' + str(args_d['group']),
           'IOCP, -iocp:                 ' + str(args_d['iocp']),
+          'IOCP cache, -iocp_cache:     ' + str(args_d['iocp_cache']),
           'Custom, -c:                  ' + str(args_d['c']),
+          'Profile, -prof:              ' + str(args_d['prof']),
+          'cProfile folder, -cprof:     ' + str(args_d['cprof']),
+          'Workers, -workers:           ' + str(args_d['workers']),
+          'Stream, -stream:             ' + str(args_d['stream']),
+          'Split, -split:               ' + str(args_d['split']) + split_help,
+          'Xref cache, -xref_cache:     ' + str(args_d['xref_cache']),
           'Log, -log:                   ' + str(args_d['log']),
           'No log, -nl:                 ' + str(args_d['nl']),
           'Suppress, -sup:              ' + str(args_d['sup']),
           '',]
     brcdapi_log.log(ml, echo=True)
+    if ec != brcddb_common.EXIT_STATUS_OK:
+        return ec
 
     # Get full file names
     in_file = brcdapi_file.full_file_name(args_d['i'], '.json')
@@ -249,8 +1190,9 @@ def _get_input():
     group_file = brcdapi_file.full_file_name(args_d['group'], '.xlsx')
 
     # Read the project file, -i
+    prof_d = _prof_init(args_d['prof'], args_d['cprof'])
     try:
-        proj_obj = brcddb_project.read_from(in_file)
+        proj_obj = xref_cache.read_project(in_file, args_d['xref_cache'], True, functools.partial(_run_stage, prof_d))
         if proj_obj is None:  # Error messages are sent to the log in brcddb_project.read_from() if proj_obj is None
             return brcddb_common.EXIT_STATUS_INPUT_ERROR
     except FileNotFoundError:
@@ -261,7 +1203,19 @@ def _get_input():
         return brcddb_common.EXIT_STATUS_INPUT_ERROR
     proj_obj.s_description('\n'.join(ml))
 
-    return pseudo_main(proj_obj, out_file, bp_file, sfp_file, group_file, args_d['iocp'], args_d['c'])
+    return pseudo_main(proj_obj,
+                       out_file,
+                       bp_file,
+                       sfp_file,
+                       group_file,
+                       args_d['iocp'],
+                       args_d['c'],
+                       xref=False,
+                       prof_d=prof_d,
+                       workers=None if args_d['workers'] <= 0 else args_d['workers'],
+                       stream=args_d['stream'],
+                       split=args_d['split'],
+                       iocp_cache=args_d['iocp_cache'])
 
 
 ##################################################################
@@ -273,7 +1227,7 @@ if _DOC_STRING:
     print('_DOC_STRING is True. No processing')
     exit(0)
 
-if _STAND_ALONE:
+if _STAND_ALONE and __name__ == '__main__':
     _ec = _get_input()
     brcdapi_log.close_log(['', 'Processing Complete. Exit code: ' + str(_ec)], echo=True)
     exit(_ec)
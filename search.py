@@ -25,6 +25,17 @@ examples are practical but the primary intent is to illustrate how to use the to
 pick examples of interest either to simply look at the output or to set break points to examine the code and data.
 Unless edited for a specific function, as a stand-alone utility this module serves no useful purpose.
 
+Tests are the most time-consuming part of processing a filter file. When all the objects in the working object list are
+the same type and the test is a single equality ("exact" or "==") or prefix ("wild" with a single trailing "*") test,
+the test is resolved with an index. The index for a key is built the first time it is used by reading the key once from
+every object of that type in the project. All other tests, including tests on keys with list or dict values, are passed
+to brcddb.util.search.match_test().
+
+Several filter files can be processed against the same project in a single invocation. See -f. The project is read,
+cross-referenced, and indexed once. The working object list, report, and report display formats are reset before each
+filter file is processed so each filter file writes its own workbook, as defined with "def_report", just as it would if
+search.py were invoked once for each filter file.
+
 **Version Control**
 
 +-----------+---------------+---------------------------------------------------------------------------------------+
@@ -44,18 +55,27 @@ Unless edited for a specific function, as a stand-alone utility this module serv
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.6     | xx xxx 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 19 Oct 2026   | Use indexes for equality and prefix tests.                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 19 Oct 2026   | Added -xref_cache to cache cross-referenced projects. See xref_cache.py               |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 19 Oct 2026   | -f accepts a list or folder of filter files, or "-" to read filter file names from    |
+|           |               | stdin. The project is read once and each filter is processed in turn.                 |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = 'xx xxx 2026'
+__date__ = '19 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Development'
-__version__ = '4.0.6'
+__version__ = '4.0.9'
 
 import os
+import sys
 import json
+import bisect
 import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
@@ -74,6 +94,7 @@ import brcddb.report.login as report_login
 import brcddb.report.port as report_port
 import brcddb.report.switch as report_switch
 import brcddb.report.zone as report_zone
+import xref_cache
 
 _DOC_STRING = False  # Should always be False. Prohibits any code execution. Only useful for building documentation
 # _STAND_ALONE: True: Executes as a standalone module taking input from the command line. False: Does not automatically
@@ -86,8 +107,12 @@ _input_d = dict(
              'multi_capture.py'),
     f=dict(r=False,
            h='Required unless using the -eh option. Name of filter file. If the file extension is not ".json", a file '
-             'extension of ".txt" is assumed. Invoke with the -eh option for additional help'),
+             'extension of ".txt" is assumed. Multiple filter files may be specified as a comma separated list. If a '
+             'folder is specified, all ".txt" and ".json" files in the folder are processed in alphabetical order. '
+             'If "-", filter file names are read from stdin, one per line, until end of file. Invoke with the -eh '
+             'option for additional help'),
 )
+_input_d.update(xref_cache.parseargs_d.copy())
 _input_d.update(gen_util.parseargs_eh_d.copy())
 _input_d.update(gen_util.parseargs_log_d.copy())
 
@@ -97,6 +122,7 @@ _report_name = None  # Name of report
 _working_obj_l = list()
 _report_display = dict()
 _sheet_index = 0  # Most examples add a worksheet to the Excel workbook. This indicates where.
+_index_d = dict()  # Key is the simple class type and the test key. Value is returned from _build_index()
 _MAX_LINE_LEN = 72  # Used to control how long help messages can be.
 
 _eh = (
@@ -472,10 +498,98 @@ def _report_act(obj):
             brcdapi_log.log('Invalid "type", "' + str(obj.get('type')) + '" in "report" action', echo=True)
 
 
+def _build_index(class_type, key):
+    """Builds an index of the values for a key in all objects of a class type in the project
+
+    :param class_type: Simple class type. See brcddb.classes.util.get_simple_class_type()
+    :type class_type: str
+    :param key: The key to index
+    :type key: str
+    :return: None if the key can't be indexed because some values are not str, int, or float. Otherwise, a dictionary:
+             str_d: Key is the value. Value is the list of objects. lower_d: Same as str_d but the keys are lower case.
+             num_d: Same as str_d for int and float values. str_l and lower_l: Sorted keys of str_d and lower_d.
+    :rtype: dict, None
+    """
+    global _proj_obj
+
+    str_d, lower_d, num_d = dict(), dict(), dict()
+    for obj in brcddb_conv.obj_extract([_proj_obj], class_type):
+        val = obj.r_get(key)
+        if val is None:
+            continue  # Objects without the key never match
+        if isinstance(val, bool) or not isinstance(val, (str, int, float)):
+            return None  # bool is a subtype of int so it has to be checked first
+        if isinstance(val, str):
+            str_d.setdefault(val, list()).append(obj)
+            lower_d.setdefault(val.lower(), list()).append(obj)
+        else:
+            num_d.setdefault(val, list()).append(obj)
+
+    return dict(str_d=str_d, lower_d=lower_d, num_d=num_d, str_l=sorted(str_d.keys()), lower_l=sorted(lower_d.keys()))
+
+
+def _index_test(obj_l, test_d):
+    """Resolves a test with an index if possible.
+
+    :param obj_l: Working object list
+    :type obj_l: list
+    :param test_d: Test from the filter file. See brcddb.util.search.match_test()
+    :type test_d: dict, list
+    :return: Objects in obj_l that match test_d in the same order as obj_l. None if the test can't be indexed.
+    :rtype: list, None
+    """
+    global _index_d
+
+    # Can this test be resolved with an index?
+    if not isinstance(test_d, dict) or len([k for k in test_d if k not in ('k', 'v', 't', 'i')]) > 0:
+        return None
+    key, val, test, ignore_case = test_d.get('k'), test_d.get('v'), test_d.get('t'), bool(test_d.get('i', False))
+    if not isinstance(key, str) or len(obj_l) == 0:
+        return None
+    if test == 'exact' and isinstance(val, str):
+        pass
+    elif test == '==' and isinstance(val, (int, float)) and not isinstance(val, bool):
+        pass
+    elif test == 'wild' and isinstance(val, str) and val.endswith('*') and \
+            len([c for c in val[:len(val)-1] if c in '*?[]']) == 0:
+        pass
+    else:
+        return None
+    class_type_l = gen_util.remove_duplicates([brcddb_class_util.get_simple_class_type(obj) for obj in obj_l])
+    if len(class_type_l) != 1:
+        return None
+
+    # Get the index
+    index_key = class_type_l[0] + ',' + key
+    if index_key not in _index_d:
+        _index_d[index_key] = _build_index(class_type_l[0], key)
+    index_d = _index_d[index_key]
+    if index_d is None:
+        return None
+
+    # Find the matching objects
+    match_l = list()
+    if test == '==':
+        match_l = index_d['num_d'].get(val, list())
+    elif test == 'exact':
+        match_l = index_d['lower_d' if ignore_case else 'str_d'].get(val.lower() if ignore_case else val, list())
+    else:
+        prefix = val[:len(val)-1].lower() if ignore_case else val[:len(val)-1]
+        val_d, val_l = (index_d['lower_d'], index_d['lower_l']) if ignore_case else (index_d['str_d'], index_d['str_l'])
+        for i in range(bisect.bisect_left(val_l, prefix), len(val_l)):
+            if not val_l[i].startswith(prefix):
+                break
+            match_l.extend(val_d[val_l[i]])
+    match_id_d = {id(obj): True for obj in match_l}
+
+    return [obj for obj in obj_l if id(obj) in match_id_d]
+
+
 def _test_act(obj):
     global _working_obj_l
 
-    _working_obj_l = brcddb_search.match_test(_working_obj_l, obj)
+    match_l = _index_test(_working_obj_l, obj)
+    _working_obj_l = brcddb_search.match_test(_working_obj_l, obj) if match_l is None else match_l
 
 
 def _print_act(obj):
@@ -511,19 +625,24 @@ def _read_file(file):
     return obj
 
 
-def psuedo_main(action_l):
+def psuedo_main(action_l, xref=True):
     """Basically the main().
 
     :param action_l: Dictionaries describing actions
     :type action_l: list
+    :param xref: If True, build the cross-references and add the custom search terms. False if already done.
+    :type xref: bool
     :return ec: Status code.
     :rtype ec: int
 """
-    global _proj_obj, _wb, _report_name, _working_obj_l
+    global _proj_obj, _wb, _report_name, _working_obj_l, _report_display, _sheet_index
 
-    brcddb_project.build_xref(_proj_obj)
-    brcddb_project.add_custom_search_terms(_proj_obj)
-    _working_obj_l.append(_proj_obj)
+    if xref:
+        brcddb_project.build_xref(_proj_obj)
+        brcddb_project.add_custom_search_terms(_proj_obj)
+
+    # Start each filter with a clean slate. _index_d is for the project so it is retained.
+    _wb, _report_name, _working_obj_l, _report_display, _sheet_index = None, None, [_proj_obj], dict(), 0
 
     for action_d in action_l:
         for k, v in action_d.items():
@@ -539,6 +658,60 @@ def psuedo_main(action_l):
     return brcddb_common.EXIT_STATUS_OK
 
 
+def _filter_files(f):
+    """Returns the list of filter files to process
+
+    :param f: Value of -f. A filter file, comma separated list of filter files, or a folder. "-" is not supported.
+    :type f: str
+    :return: List of filter file names. The ".txt" extension is added if the extension is not ".json"
+    :rtype: list
+    """
+    if os.path.isdir(f):
+        file_l = [f + '/' + file for file in sorted(brcdapi_file.read_directory(f))
+                  if file.lower().endswith('.txt') or file.lower().endswith('.json')]
+    else:
+        file_l = [file.strip() for file in f.split(',') if len(file.strip()) > 0]
+
+    return [file if file.lower().endswith('.json') else brcdapi_file.full_file_name(file, '.txt') for file in file_l]
+
+
+def _read_filter(filter_file):
+    """Reads and parses a filter file
+
+    :param filter_file: Name of the filter file
+    :type filter_file: str
+    :return filter_obj: Parsed filter file. None if there was an error.
+    :rtype filter_obj: dict, list, None
+    :return msg: Error message. An empty string if no errors
+    :rtype msg: str
+    """
+    try:
+        return json.loads(''.join(brcdapi_file.read_file(filter_file, remove_blank=True, rc=True))), ''
+    except FileNotFoundError:
+        return None, ' not found.'
+    except FileExistsError:
+        return None, ' folder does not exist.'
+    except ValueError:
+        return None, ' not a valid JSON file.'
+
+
+def _run_filter(filter_file):
+    """Reads a filter file and processes it against _proj_obj
+
+    :param filter_file: Name of the filter file
+    :type filter_file: str
+    :return ec: Status code.
+    :rtype ec: int
+    """
+    brcdapi_log.log(['', 'Processing filter file: ' + filter_file], echo=True)
+    filter_obj, msg = _read_filter(filter_file)
+    if filter_obj is None:
+        brcdapi_log.log('Filter file ' + filter_file + msg, echo=True)
+        return brcddb_common.EXIT_STATUS_INPUT_ERROR
+
+    return psuedo_main(gen_util.convert_to_list(filter_obj), xref=False)
+
+
 def _get_input():
     """Parses the module load command line
 
@@ -547,7 +720,7 @@ def _get_input():
     """
     global __version__, _input_d, _proj_obj
 
-    filter_obj, ml, ec = None, list(), brcddb_common.EXIT_STATUS_OK
+    filter_l, ml, ec = list(), list(), brcddb_common.EXIT_STATUS_OK
 
     # Get command line input
     buf = 'Searches a project file for terms defined with the -f parameter.'
@@ -575,27 +748,34 @@ def _get_input():
     if len(ml) > 0:
         brcdapi_log.log(ml, echo=True)
         return brcddb_common.EXIT_STATUS_INPUT_ERROR
-    x, args_i_help = len('.json'), ''
 
-    # Read in the filter file
-    args_f_help = filter_file = args_d['f']
-    if len(filter_file) <= x or filter_file[len(filter_file)-x:].lower() != '.json':
-        filter_file = brcdapi_file.full_file_name(filter_file, '.txt')
-    try:
-        filter_obj = json.loads(''.join(brcdapi_file.read_file(filter_file, remove_blank=True, rc=True)))
-    except FileNotFoundError:
-        args_f_help = ' not found.'
-        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
-    except FileExistsError:
-        args_f_help = ' folder does not exist.'
-    except ValueError:
-        args_f_help = ' not a valid JSON file.'
-        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    # Get the filter files. Only a single filter file is read up front so that errors are reported before reading the
+    # project. Each filter file in a list or folder is read just before it is processed.
+    args_f_help = args_d['f']
+    if args_d['f'] != '-':
+        try:
+            filter_l = _filter_files(args_d['f'])
+            if len(filter_l) == 0:
+                args_f_help += ' ERROR: No filter files found.'
+                ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+            elif len(filter_l) == 1:
+                filter_obj, msg = _read_filter(filter_l[0])
+                if filter_obj is None:
+                    args_f_help = filter_l[0] + msg
+                    ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+            else:
+                args_f_help += ', ' + str(len(filter_l)) + ' filter files'
+        except (FileExistsError, FileNotFoundError):
+            args_f_help += ' ERROR: Folder does not exist.'
+            ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+        except PermissionError:
+            args_f_help += ' ERROR: Permission error.'
+            ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
 
     # Read in the project file
     args_i_help = proj_file = brcdapi_file.full_file_name(args_d['i'], '.json')
     try:
-        _proj_obj = brcddb_project.read_from(proj_file)
+        _proj_obj = xref_cache.read_project(proj_file, args_d['xref_cache'], cs=True)
     except FileNotFoundError:
         args_i_help += ' ERROR: Not found.'
         ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
@@ -608,18 +788,29 @@ def _get_input():
 
     # Command line feedback
     ml = [os.path.basename(__file__) + ', ' + __version__,
-          'Project, -i:     ' + args_i_help,
-          'filter file, -f: ' + args_f_help,
-          'Log, -log:       ' + str(args_d['log']),
-          'No log, -nl:     ' + str(args_d['nl']),
-          'Suppress, -sup:  ' + str(args_d['sup']),
+          'Project, -i:             ' + args_i_help,
+          'filter file, -f:         ' + args_f_help,
+          'Xref cache, -xref_cache: ' + str(args_d['xref_cache']),
+          'Log, -log:               ' + str(args_d['log']),
+          'No log, -nl:             ' + str(args_d['nl']),
+          'Suppress, -sup:          ' + str(args_d['sup']),
           '',]
     brcdapi_log.log(ml, echo=True)
 
     if ec != brcddb_common.EXIT_STATUS_OK:
         return ec
 
-    return psuedo_main(gen_util.convert_to_list(filter_obj))
+    # Process each filter file against the project read above
+    if args_d['f'] == '-':
+        brcdapi_log.log('Enter filter file names, one per line. End of file (Ctrl-D, or Ctrl-Z on Windows) to exit.',
+                        echo=True)
+        filter_l = (file for buf in sys.stdin for file in _filter_files(buf.strip()))
+    for filter_file in filter_l:
+        r_ec = _run_filter(filter_file)
+        if ec == brcddb_common.EXIT_STATUS_OK:
+            ec = r_ec
+
+    return ec
 
 
 ##################################################################
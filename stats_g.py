@@ -22,6 +22,10 @@ Add statistics to Excel Workbook
 
 Reads in the output of stats_c (which collects port statistics) and creates an Excel Workbook for each port.
 
+The first time a stats_c output file is read, a summary of each statistic for each port (min, max, mean, p50, p95, p99,
+and total) is written to a file with the same name with "_summary" appended. Subsequent runs read the summary rather
+than recalculating it. The summary is rebuilt automatically if the stats_c output file changes.
+
 **Version Control**
 
 +-----------+---------------+---------------------------------------------------------------------------------------+
@@ -45,22 +49,41 @@ Reads in the output of stats_c (which collects port statistics) and creates an E
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.8     | 21 Feb 2026   | Cleaned up debug code.                                                                |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 19 Oct 2026   | Added -points and -raw to downsample the plotted data using min/max bucketing.        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.10    | 19 Oct 2026   | Added a per-port summary file, built once and reused, to select ports for -max. Added |
+|           |               | -graphed.                                                                             |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.11    | 19 Oct 2026   | Added -dist, -buckets, and -burst for percentile, histogram, and burst reporting.     |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.12    | 19 Oct 2026   | Added -split and -workers to create a workbook for each group in parallel with an     |
+|           |               | index workbook.                                                                       |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.13    | 19 Oct 2026   | -i accepts a CSV list of files or a folder. Samples from multiple stats_c runs are    |
+|           |               | merged. Counter resets are handled.                                                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '21 Feb 2026'
+__date__ = '19 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.8'
+__version__ = '4.0.13'
 
 import sys
 import os
 import datetime
 import time
 import collections
+import math
+import re
+import concurrent.futures
 import copy
+import bisect
+import heapq
+import openpyxl.utils.cell as xl_util
 import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
@@ -71,6 +94,7 @@ import brcddb.brcddb_project as brcddb_project
 import brcddb.util.util as brcddb_util
 import brcddb.brcddb_common as brcddb_common
 import brcddb.brcddb_switch as brcddb_switch
+import brcddb.brcddb_port as brcddb_port
 import brcddb.report.utils as report_utils
 import brcddb.report.zone as report_zone
 import brcddb.report.port as report_port
@@ -94,6 +118,7 @@ _do_not_modify = {  # Used to determine which statistics are a rate or time stam
 }
 
 _unknown_stat_d = dict()  # Used to track unknown statistics
+_SUMMARY_VERSION = 3  # Increment whenever the content of the summary file, see _add_summary(), changes
 
 _skip_groups_d = {  # These are the auto-generated groups. Only user defined groups are being graphed.
     report_zone.UNGROUPED_TARGET: True,
@@ -115,6 +140,24 @@ _align_wrap_c = excel_fonts.align_type('wrap_center')
 #################################################
 
 
+def _summary_val(port_obj, stat, key):
+    """Returns a value from the port summary added to each port object by _add_summary()
+
+    :param port_obj: Port object
+    :type port_obj: brcddb.classes.port.PortObj
+    :param stat: The statistic
+    :type stat: str
+    :param key: Summary key. See _port_summary()
+    :type key: str
+    :return: Summary value. None if the statistic was not found.
+    :rtype: int, float, None
+    """
+    try:
+        return port_obj.r_get('stats_c/summary_d')[stat][key]
+    except (KeyError, TypeError):
+        return None
+
+
 def _all_x(port_obj_l, max_ports, stat):
     """Filters the port list when the -max parameter is all_x
 
@@ -139,9 +182,8 @@ def _high_x(port_obj_l, max_ports, stat):
     # Find all the maximum values for the stat
     sort_d = dict()  # Key is the maximum value. Value is a list of port_objects with this value
     for port_obj in port_obj_l:
-        stat_val_l = [d[stat] for d in port_obj.r_get('stats_c/samples') if d.get(stat) is not None]
-        if len(stat_val_l) > 0:
-            max_val = max(stat_val_l)
+        max_val = _summary_val(port_obj, stat, 'max')
+        if max_val is not None:
             max_port_l = sort_d.get(max_val)
             if max_port_l is None:
                 max_port_l = list()
@@ -163,9 +205,8 @@ def _low_x(port_obj_l, max_ports, stat):
     # Find all the minimum values for the stat
     sort_d = dict()  # Key is the maximum value. Value is a list of port_objects with this value
     for port_obj in port_obj_l:
-        stat_val_l = [d[stat] for d in port_obj.r_get('stats_c/samples') if d.get(stat) is not None]
-        if len(stat_val_l) > 0:
-            min_val = min(stat_val_l)
+        min_val = _summary_val(port_obj, stat, 'min')
+        if min_val is not None:
             min_port_l = sort_d.get(min_val)
             if min_port_l is None:
                 min_port_l = list()
@@ -187,7 +228,8 @@ def _high_avg_x(port_obj_l, max_ports, stat):
     # Find all the maximum values for the stat
     sort_d = dict()  # Key is the total value. Value is a list of port_objects with this value
     for port_obj in port_obj_l:
-        stat_sum = sum([d[stat] for d in port_obj.r_get('stats_c/samples') if d.get(stat) is not None])
+        stat_sum = _summary_val(port_obj, stat, 'total')
+        stat_sum = 0 if stat_sum is None else stat_sum
         sum_port_l = sort_d.get(stat_sum)
         if sum_port_l is None:
             sum_port_l = list()
@@ -209,7 +251,8 @@ def _low_avg_x(port_obj_l, max_ports, stat):
     # Find all the maximum values for the stat
     sort_d = dict()  # Key is the total value. Value is a list of port_objects with this value
     for port_obj in port_obj_l:
-        stat_sum = sum([d[stat] for d in port_obj.r_get('stats_c/samples') if d.get(stat) is not None])
+        stat_sum = _summary_val(port_obj, stat, 'total')
+        stat_sum = 0 if stat_sum is None else stat_sum
         sum_port_l = sort_d.get(stat_sum)
         if sum_port_l is None:
             sum_port_l = list()
@@ -224,7 +267,9 @@ def _low_avg_x(port_obj_l, max_ports, stat):
     return rl[0:max_ports]
 
 
+_MIN_POINTS = 10  # Minimum value for -points. Anything less isn't much of a graph.
 _max_default = 'all_20'
+_buckets_default = '0,10,100,1000,10000,100000,1000000,10000000'  # Default for -buckets
 _max_ports_d = {
     'all_x': _all_x,
     'high_x': _high_x,
@@ -253,7 +298,9 @@ _input_d.update(
     r=dict(h='Required. Report name. ".xlsx" is automatically appended.'),
     i=dict(
         h='Required. Name of data input file. This must be the output file, -o, from stats_c.py. ".json" is '
-          'automatically appended'
+          'automatically appended. To combine the samples from multiple runs of stats_c.py, typically because of '
+          'session limits, specify a CSV list of files or a folder. When a folder is specified, all .json files in the '
+          'folder are read in name order. Switch, port, and login information is taken from the first file.'
     ),
     stat=dict(
         r=False,
@@ -275,6 +322,65 @@ _input_d.update(
         h='Optional. When set, a group for each pair of switches ISLed together is created.'
     ),
     stat_graph=dict(r=False, d=False, t='bool', h='Create a graph for each statistic in -stat.'),
+    points=dict(
+        r=False,
+        d=0,
+        t='int',
+        h='Optional. Maximum number of samples, per port, to add to the port statistics worksheets used for graphing. '
+          'The samples are divided into buckets and the minimum and maximum of each statistic in each bucket is kept '
+          'so that spikes are not lost. The default, 0, adds all samples. The minimum is ' + str(_MIN_POINTS) + '.'
+    ),
+    raw=dict(
+        r=False,
+        d=False,
+        t='bool',
+        h='Optional. Only meaningful with -points. When set, an additional worksheet with all samples is added for '
+          'each port.'
+    ),
+    dist=dict(
+        r=False,
+        d=False,
+        t='bool',
+        h='Optional. Requires -stat. Instead of a worksheet with the samples for each port and graphs, worksheets with '
+          'the distribution of each statistic for each port and each group, -group, are added. The distributions '
+          'include the p50, p95, and p99 percentiles, a histogram, see -buckets, and bursts, see -burst.'
+    ),
+    buckets=dict(
+        r=False,
+        d=_buckets_default,
+        h='Optional. Only meaningful with -dist. CSV list of histogram bucket upper limits in ascending order. A '
+          'sample is counted in the first bucket it is less than or equal to. An additional bucket is added for '
+          'samples greater than the last bucket. The default is ' + _buckets_default + '.'
+    ),
+    burst=dict(
+        r=False,
+        t='int',
+        h='Optional. Only meaningful with -dist. Samples greater than this value are counted as bursts. When omitted, '
+          'bursts are not reported.'
+    ),
+    split=dict(
+        r=False,
+        d=False,
+        t='bool',
+        h='Optional. Requires -group. Creates a separate workbook for each group. The workbooks are created in '
+          'parallel. The group number and name are appended to the report name, -r, for each group workbook. The '
+          'report, -r, is an index with hyperlinks to each group workbook. Only ports that are graphed are included.'
+    ),
+    workers=dict(
+        r=False,
+        d=0,
+        t='int',
+        h='Optional. Only meaningful with -split. Maximum number of workbooks to create at the same time. The default, '
+          '0, uses one for each processor.'
+    ),
+    graphed=dict(
+        r=False,
+        d=False,
+        t='bool',
+        h='Optional. Requires -group. When set, port statistics worksheets are only added for ports that are graphed. '
+          'Ports are selected from the summary file so samples for ports not graphed are never processed. The '
+          'summary file is built the first time stats_g.py is run against a stats_c.py output file.'
+    ),
 )
 _input_d.update(gen_util.parseargs_log_d.copy())
 
@@ -285,6 +391,34 @@ _input_d.update(gen_util.parseargs_log_d.copy())
 #################################################
 
 
+def _groups(proj_obj, args_d):
+    """Reads the group file, -group, and filters out ports that do not have a collection of stats.
+
+    :param proj_obj: The project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param args_d: Conditioned input arguments.
+    :type args_d: dict
+    :return: Key is the group name. Value is the group dictionary returned from brcddb.report.utils.groups(). The
+             auto-generated groups in _skip_groups_d are not included.
+    :rtype: dict
+    """
+    global _skip_groups_d
+
+    rd, port_obj_l = dict(), proj_obj.r_get('stats_c/stats_g_d/port_obj_l')
+    if not isinstance(args_d['group'], str):
+        return rd
+
+    group_d, el = report_utils.groups(proj_obj, args_d['group'])
+    if len(el) > 0:
+        brcdapi_log.log(el, echo=True)
+    for group_name, ind_group_d in group_d.items():
+        if not _skip_groups_d.get(group_name, False):
+            ind_group_d['port_obj_l'] = list(set(ind_group_d['port_obj_l']) & set(port_obj_l))
+            rd[group_name] = ind_group_d
+
+    return rd
+
+
 def _graphs(proj_obj, args_d):
     """Determines what to graph.
 
@@ -298,27 +432,14 @@ def _graphs(proj_obj, args_d):
     """
     global _max_ports_d
 
-    graph_l, port_obj_l = list(), proj_obj.r_get('stats_c/stats_g_d/port_obj_l')
     temp_l = args_d['max'].split('_')  # Separate the value name and the value
     filter_type, max_ports = temp_l[0] + '_x', int(temp_l[1])
     return_d = dict()
 
-    if not isinstance(args_d['group'], str):
-        return graph_l  # There isn't anything to graph.
-
-    # Decipher the group file, -group, and filter out ports that do not have a collection of stats.
-    group_d, el = report_utils.groups(proj_obj, args_d['group'])
-    if len(el) > 0:
-        brcdapi_log.log(el, echo=True)
-    for d in group_d.values():
-        d['port_obj_l'] = list(set(d['port_obj_l']) & set(port_obj_l))
-
     # ports_for_stat_d is a sorted and filtered copy of group_d for each stat. The primary key is the group name. The
     # value is a dictionary whose key is the stat. The value is a list of port objects that met the filter criteria,
     # specified by -max, for the stat.
-    for group_name, ind_group_d in group_d.items():
-        if _skip_groups_d.get(group_name, False):
-            continue
+    for group_name, ind_group_d in _groups(proj_obj, args_d).items():
         group_d = return_d.get(group_name)
         if group_d is None:
             group_d = dict()
@@ -334,9 +455,43 @@ def _graphs(proj_obj, args_d):
     return return_d
 
 
+def _conditioned_values(port_obj, stat):
+    """Returns the value of a statistic in each sample as set by _condition_samples() without modifying the samples
+
+    :param port_obj: Port object
+    :type port_obj: brcddb.classes.port.PortObj
+    :param stat: The statistic
+    :type stat: str
+    :return: One value for each sample in stats_c/samples. None for samples without the statistic. Values that are not
+             an int, rates, and values for ports that are already conditioned are returned as is.
+    :rtype: list
+    """
+    global _do_not_modify
+
+    rl, last_value = list(), None
+    if not _do_not_modify.get(stat, False) and not port_obj.r_get('stats_c/conditioned'):
+        last_value = port_obj.r_get(brcdapi_util.stats_uri + '/' + stat)
+    for d in port_obj.r_get('stats_c/samples'):
+        val = d.get(stat)
+        if last_value is None or isinstance(val, bool) or not isinstance(val, int):
+            rl.append(val)  # At the time this was written, only "name" was not an int
+            continue
+        # When the counter was cleared or wrapped, the change since the last sample is not known. The raw value would
+        # be counted as activity in this sample so it is treated as a reset: 0 for this sample and the next sample is
+        # relative to this one.
+        rl.append(0 if val < last_value else val - last_value)
+        last_value = val
+
+    return rl
+
+
 def _condition_samples(port_obj_l):
     """Modifies the sample value specified by stats that are not rates to be the difference between samples
 
+    Ports that were already conditioned are skipped so that this method can be called more than once. Only the ports
+    that are written to the workbook need to be conditioned. The port summaries, see _port_summary(), are built with
+    _conditioned_values() so the samples of all other ports are left as is.
+
     :param port_obj_l: List of port objects
     :type port_obj_l: list
     :rtype: None
@@ -345,127 +500,513 @@ def _condition_samples(port_obj_l):
 
     ignored_stats_l = list()
     for port_obj in port_obj_l:
+        if port_obj.r_get('stats_c/conditioned'):
+            continue
+        samples_l = port_obj.r_get('stats_c/samples')
         for stat in [str(k) for k in port_obj.r_get(brcdapi_util.stats_uri) if not _do_not_modify.get(k, False)]:
-            last_value = port_obj.r_get(brcdapi_util.stats_uri + '/' + stat)
-            if last_value is None:
+            if port_obj.r_get(brcdapi_util.stats_uri + '/' + stat) is None:
                 ignored_stats_l.append(stat)
                 continue
-            for d in port_obj.r_get('stats_c/samples'):
-                next_last_value = d[stat]
-                if isinstance(d[stat], int):  # At the time this was written, only "name" was not an int
-                    d[stat] -= last_value
-                    last_value = next_last_value
+            for d, val in zip(samples_l, _conditioned_values(port_obj, stat)):
+                if stat in d:
+                    d[stat] = val
+        port_obj.r_get('stats_c')['conditioned'] = True
 
         if len(ignored_stats_l) > 0:
             buf = brcddb_switch.best_switch_name(port_obj.r_switch_obj()) + ', port ' + port_obj.r_key()
             brcdapi_log.log(buf + ' Statistic(s) not found: '.join(ignored_stats_l), echo=True)
 
 
-# Debug
-def _debug_add_data(proj_obj):
-    """Adds debug data to port objects
+def _downsample(samples_l, points):
+    """Reduces the number of samples using min/max bucketing so that peaks and valleys are preserved.
+
+    The samples are divided into points/2 buckets by sample number. Two samples are returned for each bucket. For each
+    statistic, one has the minimum value in the bucket and the other has the maximum value in the bucket, in the order
+    in which they occurred. The time stamp of the first returned sample is the time stamp of the first sample in the
+    bucket and the time stamp of the second is that of the last sample in the bucket.
+
+    Buckets are determined by sample number rather than time so that all ports polled together are reduced the same way.
+    This keeps the rows in each port worksheet aligned with the time stamps on the X axis of the graphs, which are taken
+    from the first port in the graph. Largest-triangle-three-buckets was considered but it picks a different sample
+    for each statistic in each port, so the time stamps would no longer line up.
+
+    :param samples_l: List of samples as stored in stats_c/samples. This list is not modified.
+    :type samples_l: list
+    :param points: Maximum number of samples to return. 0 means return all samples.
+    :type points: int
+    :return: List of samples
+    :rtype: list
+    """
+    global _MIN_POINTS
+
+    num_samples = len(samples_l)
+    if points < _MIN_POINTS or num_samples <= points:
+        return samples_l
+
+    rl, num_buckets = list(), points // 2
+    for bucket in range(0, num_buckets):
+        bucket_l = samples_l[bucket * num_samples // num_buckets:(bucket + 1) * num_samples // num_buckets]
+        first_d, last_d = bucket_l[0].copy(), bucket_l[len(bucket_l) - 1].copy()
+        for stat, val in bucket_l[0].items():
+            if stat == 'time-generated' or isinstance(val, bool) or not isinstance(val, (int, float)):
+                continue
+            try:
+                val_l = [d[stat] for d in bucket_l]
+                min_i = val_l.index(min(val_l))
+                max_i = val_l.index(max(val_l))
+            except (KeyError, TypeError):
+                continue  # A statistic missing from one of the samples or not a number. Just leave it as is.
+            if min_i <= max_i:
+                first_d[stat], last_d[stat] = val_l[min_i], val_l[max_i]
+            else:
+                first_d[stat], last_d[stat] = val_l[max_i], val_l[min_i]
+        rl.extend([first_d, last_d])
+
+    return rl
+
+
+def _percentile(sorted_l, pct):
+    """Returns the nearest rank percentile
+
+    :param sorted_l: Sorted list of values. Must not be empty.
+    :type sorted_l: list
+    :param pct: Percentile, 0-100
+    :type pct: int, float
+    :return: Value at the requested percentile
+    :rtype: int, float
+    """
+    return sorted_l[max(0, math.ceil(pct * len(sorted_l) / 100) - 1)]
+
+
+def _port_summary(port_obj):
+    """Summarizes the samples for a port. The samples do not need to be conditioned. See _conditioned_values()
+
+    :param port_obj: Port object
+    :type port_obj: brcddb.classes.port.PortObj
+    :return: Key is the statistic. Value is a dictionary with the keys min, max, mean, p50, p95, p99, and total. Since
+             the samples are conditioned, total is the change over the collection period for cumulative counters.
+    :rtype: dict
+    """
+    rd, samples_l = dict(), port_obj.r_get('stats_c/samples')
+    if not isinstance(samples_l, list) or len(samples_l) == 0:
+        return rd
+
+    for stat, val in samples_l[0].items():
+        if stat == 'time-generated' or isinstance(val, bool) or not isinstance(val, (int, float)):
+            continue
+        val_l = sorted([val for val in _conditioned_values(port_obj, stat) if isinstance(val, (int, float))])
+        total = sum(val_l)
+        rd[stat] = dict(
+            min=val_l[0],
+            max=val_l[len(val_l)-1],
+            mean=total/len(val_l),
+            p50=_percentile(val_l, 50),
+            p95=_percentile(val_l, 95),
+            p99=_percentile(val_l, 99),
+            total=total,
+        )
+
+    return rd
+
+
+def _summary_file_name(input_file):
+    """Returns the name of the summary file associated with a stats_c.py output file
+
+    :param input_file: Name of the stats_c.py output file
+    :type input_file: str
+    :return: Summary file name
+    :rtype: str
+    """
+    base_name = input_file[0:len(input_file)-len('.json')] if input_file.lower().endswith('.json') else input_file
+    return base_name + '_summary.json'
+
+
+def _add_summary(proj_obj, input_file):
+    """Adds the port summary, stats_c/summary_d, to each port with statistics. See _port_summary()
+
+    The summary is read from the summary file next to the input file if it is current. Otherwise, it is built from the
+    samples and written to the summary file so that subsequent runs with different options don't have to rebuild it.
+    When the samples were merged from multiple files, there is no single input file so the summary is always built and
+    never written.
 
     :param proj_obj: The project object
     :type proj_obj: brcddb.classes.project.ProjectObj
+    :param input_file: Name of the stats_c.py output file the project was read from. None if merged from multiple files.
+    :type input_file: str, None
+    :rtype: None
     """
-    proj_obj.rs_key('stats_c', dict())
-    time_inc = 10
+    global _SUMMARY_VERSION
 
-    port_l = ['3/23', '3/22', '3/1', '3/0', '3/47', '3/46', '3/25']
-    port_l.extend(['4/23', '4/22', '4/2', '4/1', '4/0', '4/47', '4/25'])
-    port_l.extend(['5/23', '5/22', '5/1', '5/0', '5/33', '5/26'])
-    port_l.extend(['6/23', '6/22', '6/21', '6/8'])
-    port_l.extend(['9/23', '9/22', '9/21', '9/2', '9/25'])
-    port_l.extend(['10/21', '10/0', '10/45', '10/43', '10/26', '10/25'])
-    port_l.extend(['11/23', '11/22', '11/5', '11/47', '11/28'])
-    port_l.extend(['12/8', '12/47', '12/46'])
+    port_obj_l, summary_file, file_stat, obj = proj_obj.r_get('stats_c/stats_g_d/port_obj_l'), None, None, None
 
-    switch_poll_d = dict()
-    proj_obj.s_new_key('stats_c', switch_poll_d)
-    switch_wwn = '10:00:88:94:71:37:dd:28'
-    switch_obj = proj_obj.r_switch_obj(switch_wwn)
-    if switch_obj is None:
-        brcdapi_log.log('**Debug ERROR** Switch ' + switch_wwn + ' not found.', echo=True)
+    # Use the existing summary file if it was built from this input file
+    if input_file is not None:
+        summary_file, file_stat = _summary_file_name(input_file), os.stat(input_file)
+        try:
+            obj = brcdapi_file.read_dump(summary_file)
+        except FileNotFoundError:
+            pass
+        except (FileExistsError, PermissionError, ValueError) as e:
+            brcdapi_log.log('Ignoring summary file ' + summary_file + '. Error: ' + str(e), echo=True)
+    if isinstance(obj, dict) and obj.get('version') == _SUMMARY_VERSION and obj.get('size') == file_stat.st_size \
+            and obj.get('mtime') == file_stat.st_mtime:
+        try:
+            for port_obj in port_obj_l:
+                summary_d = obj['switch_d'][port_obj.r_switch_obj().r_obj_key()][port_obj.r_obj_key()]
+                port_obj.r_get('stats_c')['summary_d'] = summary_d
+            brcdapi_log.log('Read port summaries from ' + summary_file, echo=True)
+            return
+        except (KeyError, TypeError):
+            pass  # The summary doesn't match the data. Just rebuild it.
+
+    # Build the summary. The samples are not conditioned here so that only the ports written to the workbook are.
+    brcdapi_log.log('Building port summaries', echo=True)
+    switch_d = dict()
+    for port_obj in port_obj_l:
+        summary_d = _port_summary(port_obj)
+        port_obj.r_get('stats_c')['summary_d'] = summary_d
+        port_d = switch_d.get(port_obj.r_switch_obj().r_obj_key())
+        if port_d is None:
+            port_d = dict()
+            switch_d[port_obj.r_switch_obj().r_obj_key()] = port_d
+        port_d[port_obj.r_obj_key()] = summary_d
+
+    # Save it for next time. Failing to write it isn't fatal.
+    if summary_file is None:
+        return
+    brcdapi_log.log('Writing ' + summary_file, echo=True)
+    try:
+        brcdapi_file.write_dump(
+            dict(version=_SUMMARY_VERSION, size=file_stat.st_size, mtime=file_stat.st_mtime, switch_d=switch_d),
+            summary_file
+        )
+    except (FileExistsError, PermissionError) as e:
+        brcdapi_log.log('Could not write ' + summary_file + '. Error: ' + str(e), echo=True)
 
-    for port in port_l:
-        port_obj = switch_obj.r_port_obj(port)
-        if port_obj is None:
-            brcdapi_log.log('**Debug ERROR** Port ' + port + ' not found.', echo=True)
+
+def _dist_port(port_obj, stat, bucket_l, burst):
+    """Single pass over the samples of a port to determine the distribution of a statistic.
+
+    :param port_obj: Port object. The samples must already be conditioned by _condition_samples()
+    :type port_obj: brcddb.classes.port.PortObj
+    :param stat: The statistic
+    :type stat: str
+    :param bucket_l: Upper limits of the histogram buckets in ascending order. See -buckets
+    :type bucket_l: list
+    :param burst: Samples above this value are counted as bursts. None to skip burst detection. See -burst
+    :type burst: int, None
+    :return: Distribution dictionary. count: number of samples. total: sum of all samples. min: smallest sample. max:
+             largest sample. hist_l: histogram. hist_l[i] is the number of samples <= bucket_l[i] and > bucket_l[i-1].
+             The last entry is the number of samples > the last bucket. bursts: number of times the samples went above
+             burst. burst_samples: number of samples above burst. longest_burst: most consecutive samples above burst.
+    :rtype: dict
+    """
+    rd = dict(count=0, total=0, min=None, max=None, hist_l=[0] * (len(bucket_l) + 1), bursts=0, burst_samples=0,
+              longest_burst=0)
+    run = 0
+    for sample_d in port_obj.r_get('stats_c/samples'):
+        val = sample_d.get(stat)
+        if isinstance(val, bool) or not isinstance(val, (int, float)):
             continue
-        # Insert fake data
-        port_data_l = list()
-        port_obj.rs_key('stats_c/samples', port_data_l)
-        port_stats_d = port_obj.r_get(brcdapi_util.stats_uri)
-        if port_stats_d.get('time-generated') is None:
-            port_stats_d['time-generated'] = int(time.time())
-        port_stats_d = port_stats_d.copy()
-        for i in range(0, 20):
-            port_stats_d['in-frames'] += random.randint(0, 1000)
-            port_stats_d['out-frames'] += random.randint(0, 5000)
-            port_stats_d['time-generated'] += time_inc
-            port_data_l.append(port_stats_d)
-            port_stats_d = copy.deepcopy(port_stats_d)
+        rd['count'] += 1
+        rd['total'] += val
+        rd['min'] = val if rd['min'] is None else min(rd['min'], val)
+        rd['max'] = val if rd['max'] is None else max(rd['max'], val)
+        rd['hist_l'][bisect.bisect_left(bucket_l, val)] += 1
+        if burst is not None:
+            if val > burst:
+                run += 1
+                rd['burst_samples'] += 1
+                if run == 1:
+                    rd['bursts'] += 1
+                rd['longest_burst'] = max(rd['longest_burst'], run)
+            else:
+                run = 0
+
+    return rd
+
+
+def _dist_merge(to_d, from_d):
+    """Adds a port distribution to a group distribution. See _dist_port()
+
+    :param to_d: Group distribution. Modified by this method.
+    :type to_d: dict
+    :param from_d: Port distribution to add
+    :type from_d: dict
+    :rtype: None
+    """
+    for key in ('count', 'total', 'bursts', 'burst_samples'):
+        to_d[key] += from_d[key]
+    if from_d['min'] is not None:
+        to_d['min'] = from_d['min'] if to_d['min'] is None else min(to_d['min'], from_d['min'])
+    if from_d['max'] is not None:
+        to_d['max'] = from_d['max'] if to_d['max'] is None else max(to_d['max'], from_d['max'])
+    to_d['longest_burst'] = max(to_d['longest_burst'], from_d['longest_burst'])
+    to_d['hist_l'] = [to_d['hist_l'][i] + from_d['hist_l'][i] for i in range(0, len(to_d['hist_l']))]
+
+
+def _hist_percentile(dist_d, bucket_l, pct):
+    """Estimates a percentile from a histogram by interpolating within the bucket the percentile falls in.
+
+    The bucket limits are narrowed to the smallest and largest sample so that the first bucket is interpolated from the
+    smallest sample rather than returning the upper limit of the bucket below it.
+
+    :param dist_d: Distribution. See _dist_port()
+    :type dist_d: dict
+    :param bucket_l: Upper limits of the histogram buckets. See -buckets
+    :type bucket_l: list
+    :param pct: Percentile, 0-100
+    :type pct: int, float
+    :return: Estimated value at the requested percentile. None if there are no samples.
+    :rtype: float, None
+    """
+    if dist_d['count'] == 0:
+        return None
 
-    return
+    target, cum = max(1, math.ceil(pct * dist_d['count'] / 100)), 0
+    for i, num in enumerate(dist_d['hist_l']):
+        if num > 0 and cum + num >= target:
+            lower = dist_d['min'] if i == 0 else max(bucket_l[i-1], dist_d['min'])
+            upper = dist_d['max'] if i == len(bucket_l) else min(bucket_l[i], dist_d['max'])
+            return lower + (upper - lower) * (target - cum) / num
+        cum += num
 
+    return dist_d['max']
 
-def pseudo_main(proj_obj, args_d):
-    """Basically the main(). Did it this way, so it can easily be used as a standalone module or called from another.
 
+def _add_dist_sheets(wb, proj_obj, port_obj_l, args_d):
+    """Adds the port and group distribution worksheets. Only summaries are added, never individual samples.
+
+    :param wb: Workbook object
+    :type wb: openpyxl.workbook.workbook.Workbook
     :param proj_obj: The project object
     :type proj_obj: brcddb.classes.project.ProjectObj
+    :param port_obj_l: Ports to include
+    :type port_obj_l: list
     :param args_d: Conditioned input arguments.
     :type args_d: dict
-    :return: Exit code. See exit codes in brcddb.brcddb_common
-    :rtype: int
+    :return: Key is the worksheet title for the table of contents. Value is the worksheet name.
+    :rtype: dict
     """
-    global _hdr1_font, _align_wrap_c, _std_font, _bold_font, _link_font, _unknown_stat_d
+    global _unknown_stat_d
 
-    ec = brcddb_common.EXIT_STATUS_OK
-    stats_map_d, graph_map_d, stats_g_d = dict(), dict(), proj_obj.r_get('stats_c/stats_g_d')
-    chart_msg = 'WARNING: The FOS statistics poll cycle, 2 sec, is not synchronized between different switches. Network'
-    chart_msg += ' delays that occurred during data capture with stats_c.py may add additional time base discrepancies.'
+    rd, bucket_l, burst = dict(), args_d['buckets'], args_d['burst']
+    hist_hdr_l = ['<= ' + str(i) for i in bucket_l] + ['> ' + str(bucket_l[len(bucket_l)-1])]
+    burst_hdr_l = list() if burst is None else ['Bursts', 'Samples > ' + str(burst), 'Longest Burst (samples)']
 
-    # Modify the samples so that they are differences instead of running counts
-    _condition_samples(proj_obj.r_get('stats_c/stats_g_d/port_obj_l'))
+    # Determine the distribution for each port and statistic. This is the only pass over the samples.
+    port_dist_d = dict()  # Key is the port object. Value is a dictionary whose key is the stat.
+    for port_obj in port_obj_l:
+        port_dist_d[port_obj] = {stat: _dist_port(port_obj, stat, bucket_l, burst) for stat in args_d['stat']}
+
+    # The groups are built from the port distributions
+    group_dist_l = list()
+    for group_name, group_d in _groups(proj_obj, args_d).items():
+        group_port_obj_l = [port_obj for port_obj in group_d['port_obj_l'] if port_obj in port_dist_d]
+        for stat in args_d['stat']:
+            dist_d = dict(count=0, total=0, min=None, max=None, hist_l=[0] * (len(bucket_l) + 1), bursts=0,
+                          burst_samples=0, longest_burst=0)
+            for port_obj in group_port_obj_l:
+                _dist_merge(dist_d, port_dist_d[port_obj][stat])
+            group_dist_l.append([group_name, stat, len(group_port_obj_l), dist_d])
+
+    # Port distribution worksheet
+    row_l = list()
+    for port_obj in port_obj_l:
+        switch_name = brcddb_switch.best_switch_name(port_obj.r_switch_obj(), did=True)
+        for stat, dist_d in port_dist_d[port_obj].items():
+            if dist_d['count'] == 0:
+                _unknown_stat_d[stat] = True
+                continue
+            row_l.append(
+                [switch_name, port_obj.r_obj_key(), brcddb_port.port_best_desc(port_obj), stat, dist_d['count'],
+                 dist_d['total'] / dist_d['count']] +
+                [_summary_val(port_obj, stat, k) for k in ('p50', 'p95', 'p99')] +
+                [dist_d['max']] +
+                ([] if burst is None else [dist_d['bursts'], dist_d['burst_samples'], dist_d['longest_burst']]) +
+                dist_d['hist_l']
+            )
+    hdr_l = ['Switch', 'Port', 'Attached', 'Statistic', 'Samples', 'Mean', 'p50', 'p95', 'p99', 'Max']
+    _add_dist_sheet(wb, 'Port_Dist', 'Port Statistic Distribution', hdr_l + burst_hdr_l + hist_hdr_l, row_l)
+    rd['Port Statistic Distribution'] = 'Port_Dist'
+
+    # Group distribution worksheet
+    if len(group_dist_l) > 0:
+        row_l = list()
+        for group_name, stat, num_ports, dist_d in [dist_l for dist_l in group_dist_l if dist_l[3]['count'] > 0]:
+            row_l.append(
+                [group_name, stat, num_ports, dist_d['count'], dist_d['total'] / dist_d['count']] +
+                [_hist_percentile(dist_d, bucket_l, pct) for pct in (50, 95, 99)] +
+                [dist_d['max']] +
+                ([] if burst is None else [dist_d['bursts'], dist_d['burst_samples'], dist_d['longest_burst']]) +
+                dist_d['hist_l']
+            )
+        hdr_l = ['Group', 'Statistic', 'Ports', 'Samples', 'Mean', 'p50 (est.)', 'p95 (est.)', 'p99 (est.)', 'Max']
+        _add_dist_sheet(wb, 'Group_Dist', 'Group Statistic Distribution', hdr_l + burst_hdr_l + hist_hdr_l, row_l)
+        rd['Group Statistic Distribution'] = 'Group_Dist'
+
+    return rd
+
+
+def _add_dist_sheet(wb, sname, title, hdr_l, row_l):
+    """Adds a distribution worksheet. Used by _add_dist_sheets()
+
+    :param wb: Workbook object
+    :type wb: openpyxl.workbook.workbook.Workbook
+    :param sname: Worksheet name
+    :type sname: str
+    :param title: Title to put at the top of the worksheet
+    :type title: str
+    :param hdr_l: Column headers
+    :type hdr_l: list
+    :param row_l: List of rows. Each row is a list of cell values in the same order as hdr_l.
+    :type row_l: list
+    :rtype: None
+    """
+    global _hdr1_font, _bold_font, _std_font, _link_font, _align_wrap, _align_wrap_c
+
+    sheet = wb.create_sheet(index=0, title=sname)
+    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    for col in range(1, len(hdr_l)+1):
+        sheet.column_dimensions[xl_util.get_column_letter(col)].width = 12
+    sheet.column_dimensions['A'].width = 30
+    sheet.column_dimensions['C'].width = 30
+
+    row, col = 1, 1
+    excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, link='#Contents!A1')
+    row += 1
+    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(hdr_l))
+    excel_util.cell_update(sheet, row, col, title, font=_hdr1_font, align=_align_wrap_c)
+    row += 2
+    for buf in hdr_l:
+        excel_util.cell_update(sheet, row, col, buf, font=_bold_font, align=_align_wrap)
+        col += 1
+    sheet.freeze_panes = sheet['A' + str(row+1)]
+    for val_l in row_l:
+        row, col = row+1, 1
+        for val in val_l:
+            excel_util.cell_update(sheet, row, col, val, font=_std_font, align=_align_wrap)
+            col += 1
+
+
+def _port_key(port_obj):
+    """Returns a key that is unique for each port in the project
+
+    :param port_obj: Port object
+    :type port_obj: brcddb.classes.port.PortObj
+    :return: Switch WWN and port number separated by a space
+    :rtype: str
+    """
+    return port_obj.r_switch_obj().r_obj_key() + ' ' + port_obj.r_obj_key()
+
+
+def _port_sheet_d(port_obj):
+    """Returns the plain Python data needed to add a port statistics worksheet and graph the port.
+
+    Only standard Python data structures are used so that the dictionary can be passed to another process. See
+    _split_workbooks()
+
+    :param port_obj: Port object. The samples should already be conditioned by _condition_samples()
+    :type port_obj: brcddb.classes.port.PortObj
+    :return: Dictionary with the keys key, port, title, sub_hdr, time_generated, and samples_l
+    :rtype: dict
+    """
+    switch_obj = port_obj.r_switch_obj()
+    return dict(
+        key=_port_key(port_obj),
+        port=port_obj.r_obj_key(),
+        title=brcddb_switch.best_switch_name(switch_obj, did=True) + ' Port ' + port_obj.r_obj_key(),
+        sub_hdr=brcddb_switch.best_switch_name(switch_obj)[0:27] + ' ' + port_obj.r_obj_key(),
+        time_generated=port_obj.r_get(brcdapi_util.stats_time),
+        samples_l=port_obj.r_get('stats_c/samples'),
+    )
+
+
+def _add_port_sheets(wb, port_d_l, args_d):
+    """Adds a worksheet with the statistics for each port.
+
+    :param wb: Workbook object
+    :type wb: openpyxl.workbook.workbook.Workbook
+    :param port_d_l: Ports to add. List of dictionaries returned from _port_sheet_d(). The key cell_map_d, returned from
+                     brcddb.report.port.port_stats(), is added to each dictionary.
+    :type port_d_l: list
+    :param args_d: Conditioned input arguments. Only points and raw are used.
+    :type args_d: dict
+    :return stats_map_d: Key is the worksheet title for the table of contents. Value is the worksheet name.
+    :rtype stats_map_d: dict
+    :return raw_map_d: Same as stats_map_d but for the worksheets with all samples. See -raw
+    :rtype raw_map_d: dict
+    """
+    stats_map_d, raw_map_d = dict(), dict()
 
-    # Build the cross-reference tables.
-    brcddb_util.build_login_port_map(proj_obj)  # Correlates name server logins with ports
-    
-    # Create the workbook and add the worksheets with the port statistics
-    wb = excel_util.new_report()
-    brcdapi_log.log('Creating individual port statistics pages', echo=True)
     unique_sheet_num = 0
-    for port_obj in stats_g_d['port_obj_l']:
-        time_generated = port_obj.r_get(brcdapi_util.stats_time)
-        sname = str(unique_sheet_num) + '_Port_' + port_obj.r_obj_key().replace('/', '_')
-        title = brcddb_switch.best_switch_name(port_obj.r_switch_obj(), did=True) + ' Port ' + port_obj.r_obj_key()
-        stats_map_d[title] = sname
-        title += ' Beginning ' + datetime.datetime.fromtimestamp(time_generated).strftime('%d %b %Y')
-        cell_map_d = report_port.port_stats(
+    for port_d in port_d_l:
+        samples_l = port_d['samples_l']
+        graph_samples_l = _downsample(samples_l, args_d['points'])
+        sname = str(unique_sheet_num) + '_Port_' + port_d['port'].replace('/', '_')
+        stats_map_d[port_d['title']] = sname
+        title_date = ' Beginning ' + datetime.datetime.fromtimestamp(port_d['time_generated']).strftime('%d %b %Y')
+        port_d['cell_map_d'] = report_port.port_stats(
             wb,
             '#Contents!A1',
             sname,
-            title,
+            port_d['title'] + title_date,
             0,  # Sheet index
-            port_obj.r_get('stats_c/samples'),
+            graph_samples_l,
             time_format='HH:MM:SS;@',
-            sub_hdr=brcddb_switch.best_switch_name(port_obj.r_switch_obj())[0:27] + ' ' + port_obj.r_obj_key(),
-            time_hdr=port_obj.r_get(brcdapi_util.stats_time)
+            sub_hdr=port_d['sub_hdr'],
+            time_hdr=port_d['time_generated']
         )
-        port_obj.r_get('stats_c').update(dict(sheet=cell_map_d['sheet'], sheet_name=sname, cell_map_d=cell_map_d))
+
+        # Add the full resolution data if it was reduced and -raw was specified
+        if args_d['raw'] and len(graph_samples_l) < len(samples_l):
+            raw_sname = str(unique_sheet_num) + '_Raw_' + port_d['port'].replace('/', '_')
+            raw_map_d[port_d['title']] = raw_sname
+            report_port.port_stats(
+                wb,
+                '#Contents!A1',
+                raw_sname,
+                port_d['title'] + ' (all samples)' + title_date,
+                0,  # Sheet index
+                samples_l,
+                time_format='HH:MM:SS;@',
+                sub_hdr=port_d['sub_hdr'],
+                time_hdr=port_d['time_generated']
+            )
         unique_sheet_num += 1
 
-    # Add the graph worksheets
-    brcdapi_log.log('Adding graphs.', echo=True)
-    unique_sheet_num = 0
-    for group_name, stats_d in _graphs(proj_obj, args_d).items():
-        for stat, port_obj_l in stats_d.items():
-            if len(port_obj_l) > 0:
-                
+    return stats_map_d, raw_map_d
+
+
+def _add_graphs(wb, graph_d, port_d, args_d):
+    """Adds the graph worksheets. The port statistics worksheets must already be added by _add_port_sheets()
+
+    :param wb: Workbook object
+    :type wb: openpyxl.workbook.workbook.Workbook
+    :param graph_d: Key is the group name. Value is a dictionary whose key is the stat and the value is a list of port
+                    keys, see _port_sheet_d(), to graph.
+    :type graph_d: dict
+    :param port_d: Key is the port key. Value is the port dictionary passed to _add_port_sheets()
+    :type port_d: dict
+    :param args_d: Conditioned input arguments. Only type is used.
+    :type args_d: dict
+    :return: Key is the graph title for the table of contents. Value is the worksheet name.
+    :rtype: dict
+    """
+    global _unknown_stat_d
+
+    graph_map_d, unique_sheet_num = dict(), 0
+    chart_msg = 'WARNING: The FOS statistics poll cycle, 2 sec, is not synchronized between different switches. Network'
+    chart_msg += ' delays that occurred during data capture with stats_c.py may add additional time base discrepancies.'
+
+    for group_name, stats_d in graph_d.items():
+        for stat, key_l in stats_d.items():
+            if len(key_l) > 0:
+
                 # Add the Y axis data
                 y_data_l = list()
-                for cell_map_d in [obj.r_get('stats_c')['cell_map_d'] for obj in port_obj_l]:
+                for cell_map_d in [port_d[key]['cell_map_d'] for key in key_l]:
                     try:
                         stat_col = cell_map_d['col'][stat]
                         y_data_l.append(
@@ -481,7 +1022,7 @@ def pseudo_main(proj_obj, args_d):
                         _unknown_stat_d[stat] = True
 
                 # Add the basic chart infor, the X axis (time), and the Y axis data from above
-                cell_map_d = port_obj_l[0].r_get('stats_c')['cell_map_d']
+                cell_map_d = port_d[key_l[0]]['cell_map_d']
                 data_ref_d = dict(
                     title=group_name + ': ' + str(stat),
                     type=args_d['type'],
@@ -493,14 +1034,35 @@ def pseudo_main(proj_obj, args_d):
                     y_title=stat,
                     y_data_l=y_data_l,
                 )
-                
+
                 # Create the graph
                 sname = 'graph_' + str(unique_sheet_num)
                 unique_sheet_num += 1
                 report_graph.graph(wb, '#Contents!A1', sname, 0, data_ref_d, msg=chart_msg, title_in_data=True)
                 graph_map_d[data_ref_d['title']] = sname
 
-    # Create a table of contents worksheet
+    return graph_map_d
+
+
+def _add_contents(wb, title, start, end, section_l):
+    """Adds the table of contents worksheet.
+
+    :param wb: Workbook object
+    :type wb: openpyxl.workbook.workbook.Workbook
+    :param title: Title for the table of contents
+    :type title: str
+    :param start: Date and time of the first sample
+    :type start: str
+    :param end: Date and time of the last sample
+    :type end: str
+    :param section_l: List of sections. Each section is a list: section heading, dictionary whose key is the text to
+                      display and value is the hyperlink, and a flag. When the flag is False, the section is skipped if
+                      the dictionary is empty.
+    :type section_l: list
+    :rtype: None
+    """
+    global _hdr1_font, _align_wrap_c, _std_font, _bold_font, _link_font
+
     sheet = wb.create_sheet(index=0, title='Contents')
     sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
     sheet.page_setup.orientation = sheet.ORIENTATION_PORTRAIT
@@ -511,86 +1073,331 @@ def pseudo_main(proj_obj, args_d):
     # Add the title to the table of contents
     row, col = 1, 1
     sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col+1)
-    excel_util.cell_update(sheet, row, col, 'Port Statistics Project', font=_hdr1_font, align=_align_wrap_c)
+    excel_util.cell_update(sheet, row, col, title, font=_hdr1_font, align=_align_wrap_c)
     row += 2
 
     # Add the Summary to the table of contents
     sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col+1)
     excel_util.cell_update(sheet, row, col, 'Summary', font=_bold_font, align=_align_wrap)
     row += 1
-    port_obj = stats_g_d['port_obj_l'][0]  # They should all start and end at the same time, so just pick one
-    buf = datetime.datetime.fromtimestamp(port_obj.r_get(brcdapi_util.stats_time)).strftime('%d %b %Y %H:%M:%S')
     excel_util.cell_update(sheet, row, col, 'Start', font=_std_font, align=_align_wrap)
-    excel_util.cell_update(sheet, row, col+1, buf, font=_std_font, align=_align_wrap)
+    excel_util.cell_update(sheet, row, col+1, start, font=_std_font, align=_align_wrap)
     row += 1
-    samples_l = port_obj.r_get('stats_c/samples')
-    buf = datetime.datetime.fromtimestamp(samples_l[len(samples_l)-1]['time-generated']).strftime('%d %b %Y %H:%M:%S')
     excel_util.cell_update(sheet, row, col, 'End', font=_std_font, align=_align_wrap)
-    excel_util.cell_update(sheet, row, col+1, buf, font=_std_font, align=_align_wrap)
+    excel_util.cell_update(sheet, row, col+1, end, font=_std_font, align=_align_wrap)
 
-    # Add the Graphs to the table of contents
-    row += 2
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col+1)
-    excel_util.cell_update(sheet, row, col, 'Graphs', font=_bold_font, align=_align_wrap)
-    for buf, sname in graph_map_d.items():
-        row += 1
-        sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col + 1)
-        excel_util.cell_update(sheet, row, col, buf, font=_link_font, align=_align_wrap, link='#' + sname + '!A1')
+    # Add each section
+    for heading, link_d, always in section_l:
+        if len(link_d) == 0 and not always:
+            continue
+        row += 2
+        sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col+1)
+        excel_util.cell_update(sheet, row, col, heading, font=_bold_font, align=_align_wrap)
+        for buf, link in link_d.items():
+            row += 1
+            sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col + 1)
+            excel_util.cell_update(sheet, row, col, buf, font=_link_font, align=_align_wrap, link=link)
 
-    # Add the port statistics detail to the table of contents
-    row += 2
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col+1)
-    excel_util.cell_update(sheet, row, col, 'Port Statistics Detail', font=_bold_font, align=_align_wrap)
-    for buf, sname in stats_map_d.items():
-        row += 1
-        sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col + 1)
-        excel_util.cell_update(sheet, row, col, buf, font=_link_font, align=_align_wrap, link='#' + sname + '!A1')
 
-    stat_l = ['  ' + str(k) for k in _unknown_stat_d.keys()]
-    if len(stat_l) > 0:
-        stat_l.insert(0, 'The following statistics are unknown and therefore skipped:')
-        brcdapi_log.log(stat_l, echo=True)
+def _sheet_links(map_d):
+    """Converts a dictionary of worksheet names to hyperlinks for _add_contents()
 
-    brcdapi_log.log('Writing ' + args_d['r'])
+    :param map_d: Key is the text to display. Value is the worksheet name.
+    :type map_d: dict
+    :return: Key is the text to display. Value is the hyperlink.
+    :rtype: dict
+    """
+    return {buf: '#' + sname + '!A1' for buf, sname in map_d.items()}
+
+
+def _save_report(wb, file_name):
+    """Saves a workbook
+
+    :param wb: Workbook object
+    :type wb: openpyxl.workbook.workbook.Workbook
+    :param file_name: Name of the file to write
+    :type file_name: str
+    :return ec: Exit code. See exit codes in brcddb.brcddb_common
+    :rtype ec: int
+    :return msg: Error message. Empty if no errors.
+    :rtype msg: str
+    """
     try:
-        excel_util.save_report(wb, args_d['r'])
+        excel_util.save_report(wb, file_name)
     except FileExistsError:
-        brcdapi_log.log('Folder in ' + args_d['r'] + ' does not exist', echo=True)
-        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+        return brcddb_common.EXIT_STATUS_INPUT_ERROR, 'Folder in ' + file_name + ' does not exist'
     except PermissionError:
-        buf = 'Permission error writing ' + args_d['r'] + '. This typically occurs when the file is open in Excel.'
-        brcdapi_log.log(buf, echo=True)
-        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+        buf = 'Permission error writing ' + file_name + '. This typically occurs when the file is open in Excel.'
+        return brcddb_common.EXIT_STATUS_INPUT_ERROR, buf
+
+    return brcddb_common.EXIT_STATUS_OK, ''
+
+
+def _group_workbook(task_d):
+    """Creates and saves the workbook for a single group. Called from a process pool by _split_workbooks()
+
+    Nothing is logged from here because logging is not set up in the worker processes. Messages are returned instead.
+
+    :param task_d: Dictionary with the keys file, group, start, end, port_d_l, graph_d, and args_d. port_d_l and
+                   graph_d are as described in _add_port_sheets() and _add_graphs().
+    :type task_d: dict
+    :return ec: Exit code. See exit codes in brcddb.brcddb_common
+    :rtype ec: int
+    :return msg: Error message. Empty if no errors.
+    :rtype msg: str
+    :return unknown_stat_l: Statistics that could not be graphed in this workbook.
+    :rtype unknown_stat_l: list
+    """
+    global _unknown_stat_d
+
+    _unknown_stat_d.clear()  # Worker processes are reused so clear what was left over from the previous task
+
+    wb = excel_util.new_report()
+    stats_map_d, raw_map_d = _add_port_sheets(wb, task_d['port_d_l'], task_d['args_d'])
+    graph_map_d = _add_graphs(wb, task_d['graph_d'], {d['key']: d for d in task_d['port_d_l']}, task_d['args_d'])
+    section_l = [
+        ['Graphs', _sheet_links(graph_map_d), True],
+        ['Port Statistics Detail', _sheet_links(stats_map_d), True],
+        ['Port Statistics Detail, All Samples', _sheet_links(raw_map_d), False],
+    ]
+    _add_contents(wb, 'Port Statistics: ' + task_d['group'], task_d['start'], task_d['end'], section_l)
+    ec, msg = _save_report(wb, task_d['file'])
+
+    return ec, msg, list(_unknown_stat_d.keys())
+
+
+def _split_workbooks(graph_d, start, end, args_d):
+    """Creates a workbook for each group in parallel and an index workbook, -r, with hyperlinks to each.
+
+    :param graph_d: Return from _graphs()
+    :type graph_d: dict
+    :param start: Date and time of the first sample
+    :type start: str
+    :param end: Date and time of the last sample
+    :type end: str
+    :param args_d: Conditioned input arguments.
+    :type args_d: dict
+    :return: Exit code. See exit codes in brcddb.brcddb_common
+    :rtype: int
+    """
+    global _unknown_stat_d
+
+    ec, task_l, file_map_d = brcddb_common.EXIT_STATUS_OK, list(), dict()
+    base_name = args_d['r'][0:len(args_d['r'])-len('.xlsx')]
+    worker_args_d = dict(points=args_d['points'], raw=args_d['raw'], type=args_d['type'])
+
+    # Build a task for each group. Only plain Python data is passed to the worker processes.
+    for group_num, (group_name, stats_d) in enumerate(graph_d.items()):
+        port_d, group_graph_d = dict(), dict()
+        for stat, port_obj_l in stats_d.items():
+            key_l = [_port_key(port_obj) for port_obj in port_obj_l]
+            port_d.update({key_l[i]: _port_sheet_d(port_obj_l[i]) for i in range(0, len(key_l))
+                           if key_l[i] not in port_d})
+            group_graph_d[stat] = key_l
+        if len(port_d) == 0:
+            continue
+        file_name = base_name + '_' + str(group_num) + '_' + re.sub(r'[^\w\-]', '_', group_name) + '.xlsx'
+        task_l.append(
+            dict(
+                file=file_name,
+                group=group_name,
+                start=start,
+                end=end,
+                port_d_l=list(port_d.values()),
+                graph_d={group_name: group_graph_d},
+                args_d=worker_args_d,
+            )
+        )
+
+    # Create the group workbooks
+    brcdapi_log.log('Creating ' + str(len(task_l)) + ' group workbooks', echo=True)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args_d['workers']) as executor:
+        for task_d, (task_ec, msg, unknown_stat_l) in zip(task_l, executor.map(_group_workbook, task_l)):
+            _unknown_stat_d.update({stat: True for stat in unknown_stat_l})
+            if task_ec == brcddb_common.EXIT_STATUS_OK:
+                brcdapi_log.log('Wrote ' + task_d['file'])
+                file_map_d[task_d['group']] = os.path.basename(task_d['file'])
+            else:
+                brcdapi_log.log(msg, echo=True)
+                ec = task_ec
+
+    # Create the index workbook
+    wb = excel_util.new_report()
+    _add_contents(wb, 'Port Statistics Project', start, end, [['Group Workbooks', file_map_d, True]])
+    brcdapi_log.log('Writing ' + args_d['r'])
+    index_ec, msg = _save_report(wb, args_d['r'])
+    if index_ec != brcddb_common.EXIT_STATUS_OK:
+        brcdapi_log.log(msg, echo=True)
+        ec = index_ec
 
     return ec
 
-def _get_input():
-    """Parses the module load command line
 
+# Debug
+def _debug_add_data(proj_obj):
+    """Adds debug data to port objects
+
+    :param proj_obj: The project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    """
+    proj_obj.rs_key('stats_c', dict())
+    time_inc = 10
+
+    port_l = ['3/23', '3/22', '3/1', '3/0', '3/47', '3/46', '3/25']
+    port_l.extend(['4/23', '4/22', '4/2', '4/1', '4/0', '4/47', '4/25'])
+    port_l.extend(['5/23', '5/22', '5/1', '5/0', '5/33', '5/26'])
+    port_l.extend(['6/23', '6/22', '6/21', '6/8'])
+    port_l.extend(['9/23', '9/22', '9/21', '9/2', '9/25'])
+    port_l.extend(['10/21', '10/0', '10/45', '10/43', '10/26', '10/25'])
+    port_l.extend(['11/23', '11/22', '11/5', '11/47', '11/28'])
+    port_l.extend(['12/8', '12/47', '12/46'])
+
+    switch_poll_d = dict()
+    proj_obj.s_new_key('stats_c', switch_poll_d)
+    switch_wwn = '10:00:88:94:71:37:dd:28'
+    switch_obj = proj_obj.r_switch_obj(switch_wwn)
+    if switch_obj is None:
+        brcdapi_log.log('**Debug ERROR** Switch ' + switch_wwn + ' not found.', echo=True)
+
+    for port in port_l:
+        port_obj = switch_obj.r_port_obj(port)
+        if port_obj is None:
+            brcdapi_log.log('**Debug ERROR** Port ' + port + ' not found.', echo=True)
+            continue
+        # Insert fake data
+        port_data_l = list()
+        port_obj.rs_key('stats_c/samples', port_data_l)
+        port_stats_d = port_obj.r_get(brcdapi_util.stats_uri)
+        if port_stats_d.get('time-generated') is None:
+            port_stats_d['time-generated'] = int(time.time())
+        port_stats_d = port_stats_d.copy()
+        for i in range(0, 20):
+            port_stats_d['in-frames'] += random.randint(0, 1000)
+            port_stats_d['out-frames'] += random.randint(0, 5000)
+            port_stats_d['time-generated'] += time_inc
+            port_data_l.append(port_stats_d)
+            port_stats_d = copy.deepcopy(port_stats_d)
+
+    return
+
+
+def pseudo_main(proj_obj, args_d):
+    """Basically the main(). Did it this way, so it can easily be used as a standalone module or called from another.
+
+    :param proj_obj: The project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param args_d: Conditioned input arguments.
+    :type args_d: dict
     :return: Exit code. See exit codes in brcddb.brcddb_common
     :rtype: int
     """
-    global __version__, _input_d, _max_ports_d
+    global _unknown_stat_d
 
-    # Get command line input
-    buf = 'Create Excel Workbook from statistics gathered with stats_c.py. If a group is defined, using -group or '\
-          '-isl, worksheets with graphs for each group are also created.'
-    args_d = gen_util.get_input(buf, _input_d)
-    ec = brcddb_common.EXIT_STATUS_OK
+    stats_g_d = proj_obj.r_get('stats_c/stats_g_d')
 
-    # Set up logging
-    brcdapi_log.open_log(
-        folder=args_d['log'],
-        suppress=args_d['sup'],
-        no_log=args_d['nl'],
-        version_d=brcdapi_util.get_import_modules()
-    )
+    # Build the cross-reference tables.
+    brcddb_util.build_login_port_map(proj_obj)  # Correlates name server logins with ports
 
-    # Validate the input
+    # Determine what to graph. This is done from the port summaries so the samples are not needed yet.
+    graph_d = dict() if args_d['dist'] else _graphs(proj_obj, args_d)
+    port_obj_l = stats_g_d['port_obj_l']
+    if args_d['graphed'] or args_d['split']:
+        graphed_port_d = dict()
+        for stats_d in graph_d.values():
+            for graphed_port_obj_l in stats_d.values():
+                graphed_port_d.update({obj: True for obj in graphed_port_obj_l})
+        port_obj_l = [obj for obj in port_obj_l if graphed_port_d.get(obj, False)]
+        if len(port_obj_l) == 0:
+            brcdapi_log.log('No ports matched the group definitions in ' + str(args_d['group']), echo=True)
+            return brcddb_common.EXIT_STATUS_INPUT_ERROR
+
+    # Modify the samples so that they are differences instead of running counts
+    _condition_samples(port_obj_l)
+
+    # They should all start and end at the same time, so just pick one
+    port_obj = port_obj_l[0]
+    start = datetime.datetime.fromtimestamp(port_obj.r_get(brcdapi_util.stats_time)).strftime('%d %b %Y %H:%M:%S')
+    samples_l = port_obj.r_get('stats_c/samples')
+    end = datetime.datetime.fromtimestamp(samples_l[len(samples_l)-1]['time-generated']).strftime('%d %b %Y %H:%M:%S')
+
+    if args_d['split']:
+        ec = _split_workbooks(graph_d, start, end, args_d)
+
+    else:
+        # Create the workbook and add the worksheets with the port statistics or distributions
+        wb = excel_util.new_report()
+        stats_map_d, raw_map_d, dist_map_d, graph_map_d = dict(), dict(), dict(), dict()
+        if args_d['dist']:
+            dist_map_d = _add_dist_sheets(wb, proj_obj, port_obj_l, args_d)
+        else:
+            brcdapi_log.log('Creating individual port statistics pages', echo=True)
+            port_d_l = [_port_sheet_d(obj) for obj in port_obj_l]
+            stats_map_d, raw_map_d = _add_port_sheets(wb, port_d_l, args_d)
+
+            # Add the graph worksheets
+            brcdapi_log.log('Adding graphs.', echo=True)
+            key_graph_d = dict()
+            for group_name, stats_d in graph_d.items():
+                key_graph_d[group_name] = {stat: [_port_key(obj) for obj in graphed_port_obj_l]
+                                           for stat, graphed_port_obj_l in stats_d.items()}
+            graph_map_d = _add_graphs(wb, key_graph_d, {d['key']: d for d in port_d_l}, args_d)
+
+        # Create a table of contents worksheet
+        section_l = [
+            ['Graphs', _sheet_links(graph_map_d), True],
+            ['Port Statistics Detail', _sheet_links(stats_map_d), True],
+            ['Distributions', _sheet_links(dist_map_d), False],
+            ['Port Statistics Detail, All Samples', _sheet_links(raw_map_d), False],
+        ]
+        _add_contents(wb, 'Port Statistics Project', start, end, section_l)
+
+        brcdapi_log.log('Writing ' + args_d['r'])
+        ec, msg = _save_report(wb, args_d['r'])
+        if ec != brcddb_common.EXIT_STATUS_OK:
+            brcdapi_log.log(msg, echo=True)
+
+    stat_l = ['  ' + str(k) for k in _unknown_stat_d.keys()]
+    if len(stat_l) > 0:
+        stat_l.insert(0, 'The following statistics are unknown and therefore skipped:')
+        brcdapi_log.log(stat_l, echo=True)
+
+    return ec
+
+
+def _input_files(in_buf):
+    """Returns the list of stats_c.py output files specified with -i
+
+    :param in_buf: The -i parameter. A file, a CSV list of files, or a folder.
+    :type in_buf: str
+    :return: List of file names. When a folder is specified, all .json files in the folder, except summary files, see
+             _summary_file_name(), sorted by name.
+    :rtype: list
+    """
+    if os.path.isdir(in_buf):
+        x = len('.json')
+        try:
+            return [in_buf + '/' + f for f in sorted(brcdapi_file.read_directory(in_buf))
+                    if len(f) > x and f.lower()[len(f)-x:] == '.json' and not f.lower().endswith('_summary.json')]
+        except PermissionError:
+            return list()
+
+    return [brcdapi_file.full_file_name(buf.strip(), '.json') for buf in in_buf.split(',') if len(buf.strip()) > 0]
+
+
+def _read_project(input_file):
+    """Reads a stats_c.py output file into a project object
+
+    :param input_file: Name of the file to read
+    :type input_file: str
+    :return proj_obj: The project object. None if an error was encountered.
+    :rtype proj_obj: brcddb.classes.project.ProjectObj, None
+    :return ec: Exit code. See exit codes in brcddb.brcddb_common
+    :rtype ec: int
+    :return i_help: Error message for the command line feedback. Empty if no errors.
+    :rtype i_help: str
+    """
+    proj_obj, obj, ec, i_help = None, None, brcddb_common.EXIT_STATUS_OK, ''
 
-    # -i, and get proj_obj
-    proj_obj, obj, i_help = None, None, ''
-    input_file = brcdapi_file.full_file_name(args_d['i'], '.json')
     try:
         obj = brcdapi_file.read_dump(input_file)
     except FileNotFoundError:
@@ -616,6 +1423,115 @@ def _get_input():
         proj_obj.s_description(obj.get('_description'))
         brcddb_copy.plain_copy_to_brcddb(obj, proj_obj)
 
+    return proj_obj, ec, i_help if len(i_help) == 0 else ' ' + input_file + i_help
+
+
+def _merge_samples(samples_l, add_samples_l):
+    """Merges two lists of samples in time stamp order. Samples with a time stamp already in the list are dropped.
+
+    :param samples_l: Samples already merged. Must be in time stamp order with no duplicates.
+    :type samples_l: list
+    :param add_samples_l: Samples to add
+    :type add_samples_l: list
+    :return: Merged samples
+    :rtype: list
+    """
+    rl, last_time = list(), None
+    add_samples_l = sorted(add_samples_l, key=lambda d: d.get('time-generated', 0))
+    for sample_d in heapq.merge(samples_l, add_samples_l, key=lambda d: d.get('time-generated', 0)):
+        if len(rl) == 0 or sample_d.get('time-generated') != last_time:
+            rl.append(sample_d)
+            last_time = sample_d.get('time-generated')
+
+    return rl
+
+
+def _merge_projects(proj_obj, input_l):
+    """Adds the samples from additional stats_c.py output files to the ports in the project
+
+    Switch and port configuration, logins, and zoning are taken from the project read from the first file. Only the
+    samples are taken from the additional files. The files are read and merged one at a time so that only one additional
+    project is in memory at any time.
+
+    Every port in every file, including the first, is conditioned, see _condition_samples(), before the samples are
+    merged. This way each run is conditioned against its own initial sample so clearing the statistics or rebooting a
+    switch between runs doesn't result in negative or inflated counts. The samples from each file are merged into the
+    samples for each port in time stamp order as the file is read. Duplicate time stamps, which occur when runs
+    overlap, are dropped.
+
+    :param proj_obj: The project object read from the first file in input_l
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param input_l: List of stats_c.py output files. The first one must be the file proj_obj was read from.
+    :type input_l: list
+    :return ec: Exit code. See exit codes in brcddb.brcddb_common
+    :rtype ec: int
+    :return i_help: Error message for the command line feedback. Empty if no errors.
+    :rtype i_help: str
+    """
+    port_obj_l = [port_obj for port_obj in proj_obj.r_port_objects() if port_obj.r_get('stats_c') is not None]
+    _condition_samples(port_obj_l)
+    for port_obj in port_obj_l:
+        port_obj.r_get('stats_c')['samples'] = _merge_samples(port_obj.r_get('stats_c/samples'), list())
+
+    for input_file in input_l[1:]:
+        brcdapi_log.log('Merging ' + input_file, echo=True)
+        add_proj_obj, ec, i_help = _read_project(input_file)
+        if ec != brcddb_common.EXIT_STATUS_OK:
+            return ec, i_help
+        add_port_obj_l = [obj for obj in add_proj_obj.r_port_objects() if obj.r_get('stats_c') is not None]
+        _condition_samples(add_port_obj_l)
+        missing_l = list()
+        for add_port_obj in add_port_obj_l:
+            switch_obj = proj_obj.r_switch_obj(add_port_obj.r_switch_obj().r_obj_key())
+            port_obj = None if switch_obj is None else switch_obj.r_port_obj(add_port_obj.r_obj_key())
+            if port_obj is None or port_obj.r_get('stats_c') is None:
+                missing_l.append(_port_key(add_port_obj))
+                continue
+            port_obj.r_get('stats_c')['samples'] = _merge_samples(port_obj.r_get('stats_c/samples'),
+                                                                  add_port_obj.r_get('stats_c/samples'))
+        add_proj_obj = add_port_obj_l = None  # Done with this file. Free it before reading the next one.
+        if len(missing_l) > 0:
+            buf = str(len(missing_l)) + ' port(s) in ' + input_file + ' not in ' + input_l[0] + '. Skipped: '
+            brcdapi_log.log(buf + ', '.join(missing_l), echo=True)
+
+    return brcddb_common.EXIT_STATUS_OK, ''
+
+
+def _get_input():
+    """Parses the module load command line
+
+    :return: Exit code. See exit codes in brcddb.brcddb_common
+    :rtype: int
+    """
+    global __version__, _input_d, _max_ports_d, _MIN_POINTS
+
+    # Get command line input
+    buf = 'Create Excel Workbook from statistics gathered with stats_c.py. If a group is defined, using -group or '\
+          '-isl, worksheets with graphs for each group are also created.'
+    args_d = gen_util.get_input(buf, _input_d)
+    ec = brcddb_common.EXIT_STATUS_OK
+
+    # Set up logging
+    brcdapi_log.open_log(
+        folder=args_d['log'],
+        suppress=args_d['sup'],
+        no_log=args_d['nl'],
+        version_d=brcdapi_util.get_import_modules()
+    )
+
+    # Validate the input
+
+    # -i, and get proj_obj
+    proj_obj, i_help, input_l = None, '', _input_files(args_d['i'])
+    if len(input_l) == 0:
+        i_help = ' **ERROR** No .json files found.'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    else:
+        proj_obj, ec, i_help = _read_project(input_l[0])
+    if ec == brcddb_common.EXIT_STATUS_OK and len(input_l) > 1:
+        ec, i_help = _merge_projects(proj_obj, input_l)
+
+    if ec == brcddb_common.EXIT_STATUS_OK:
         # Debug
         # _debug_add_data(proj_obj)
 
@@ -626,6 +1542,7 @@ def _get_input():
         else:
             # The ports don't need to be sorted. Humans just like to see them added to the report this way.
             proj_obj.rs_key('stats_c/stats_g_d/port_obj_l', brcddb_util.sort_ports(port_obj_l))
+            _add_summary(proj_obj, input_l[0] if len(input_l) == 1 else None)
 
     # -stat
     stat_help = str(args_d['stat'])
@@ -649,16 +1566,67 @@ def _get_input():
             max_help = ' **ERROR** The value after "_" must be an integer.'
             ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
 
+    # -points
+    points_help = ''
+    if args_d['points'] != 0 and args_d['points'] < _MIN_POINTS:
+        points_help = ' **ERROR** Must be 0 or >= ' + str(_MIN_POINTS)
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+
+    # -graphed
+    graphed_help = ''
+    if args_d['graphed'] and args_d['group'] is None:
+        graphed_help = ' **ERROR** Requires -group.'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    elif args_d['graphed'] and args_d['dist']:
+        graphed_help = ' **ERROR** Not supported with -dist.'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+
+    # -split
+    split_help = ''
+    if args_d['split'] and args_d['group'] is None:
+        split_help = ' **ERROR** Requires -group.'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    elif args_d['split'] and args_d['dist']:
+        split_help = ' **ERROR** Not supported with -dist.'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    workers_help = ''
+    if args_d['workers'] < 0:
+        workers_help = ' **ERROR** Must be >= 0'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+
+    # -dist and -buckets
+    dist_help, buckets_help, bucket_l = '', '', list()
+    if args_d['dist'] and args_d['stat'] is None:
+        dist_help = ' **ERROR** Requires -stat.'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    try:
+        bucket_l = [int(buf) for buf in args_d['buckets'].replace(' ', '').split(',')]
+        if len(bucket_l) == 0 or bucket_l != sorted(set(bucket_l)):
+            buckets_help = ' **ERROR** Must be in ascending order with no duplicates.'
+            ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    except ValueError:
+        buckets_help = ' **ERROR** Must be a CSV list of integers.'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+
     # Command line feedback
     ml = [
         os.path.basename(__file__) + ' version: ' + __version__,
         'Report, -r:                ' + args_d['r'],
         'Input file, -i:            ' + args_d['i'] + i_help,
+        'Input files read:          ' + str(len(input_l)),
         'Statistics, -stat:         ' + stat_help,
         'Max ports per graph, -max: ' + args_d['max'] + max_help,
         'Graph type, -type:         ' + args_d['type'],
         'Group file, -group:        ' + str(args_d['group']),
         'ISL groups, -isl:          ' + str(args_d['isl']),
+        'Points per port, -points:  ' + str(args_d['points']) + points_help,
+        'All samples, -raw:         ' + str(args_d['raw']),
+        'Graphed only, -graphed:    ' + str(args_d['graphed']) + graphed_help,
+        'Split by group, -split:    ' + str(args_d['split']) + split_help,
+        'Workers, -workers:         ' + str(args_d['workers']) + workers_help,
+        'Distributions, -dist:      ' + str(args_d['dist']) + dist_help,
+        'Histogram, -buckets:       ' + args_d['buckets'] + buckets_help,
+        'Burst threshold, -burst:   ' + str(args_d['burst']),
         'Log, -log:                 ' + str(args_d['log']),
         'No log, -nl:               ' + str(args_d['nl']),
         'Suppress, -sup:            ' + str(args_d['sup']),
@@ -668,10 +1636,12 @@ def _get_input():
 
     # Condition the input
     args_d['r'] = brcdapi_file.full_file_name(args_d['r'], '.xlsx')
-    args_d['i'] = input_file
+    args_d['i'] = input_l
     if isinstance(args_d['group'], str):
         args_d['group'] = brcdapi_file.full_file_name(args_d['group'], '.xlsx')
     args_d['stat'] = args_d['stat'].replace(' ', '').split(',') if isinstance(args_d['stat'], str) else list()
+    args_d['buckets'] = bucket_l
+    args_d['workers'] = None if args_d['workers'] == 0 else args_d['workers']
 
     return pseudo_main(proj_obj, args_d) if ec == brcddb_common.EXIT_STATUS_OK else ec
 
@@ -685,7 +1655,8 @@ if _DOC_STRING:
     print('_DOC_STRING is True. No processing')
     exit(0)
 
-if _STAND_ALONE:
+# The __name__ test keeps the worker processes started by _split_workbooks() from processing the command line.
+if _STAND_ALONE and __name__ == '__main__':
     _ec = _get_input()
     brcdapi_log.close_log(['', 'Processing Complete. Exit code: ' + str(_ec)], echo=True)
     exit(_ec)
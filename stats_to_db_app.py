@@ -30,6 +30,34 @@ For any database to work, the keys must be unique. Since multiple switches can h
 with multiple fabrics, it's possible to have the same fibre channel address. In this example, a unique key is a hash
 of the switch WWN and port number. Note that the switch WWN will always be unique.
 
+When a database file, -db, is specified, the data is added to a local SQLite database. The database uses WAL journaling
+so the data can be read while statistics are being collected. The tables are:
+
++-----------+----------------------------------------------------------------------------------------------------------+
+| Table     | Description                                                                                              |
++===========+==========================================================================================================+
+| switch    | switch_id, switch_wwn                                                                                    |
++-----------+----------------------------------------------------------------------------------------------------------+
+| port      | port_id, switch_id, port, description. description is what is attached to the port.                     |
++-----------+----------------------------------------------------------------------------------------------------------+
+| counter   | counter_id, counter. counter is the KPI leaf, for example: fibrechannel-statistics/in-frames             |
++-----------+----------------------------------------------------------------------------------------------------------+
+| sample    | port_id, counter_id, ts, value. ts is the epoch time from time-generated in the port statistics.         |
++-----------+----------------------------------------------------------------------------------------------------------+
+
+The view sample_v joins the tables above into switch_wwn, port, counter, ts, value. For example, to get the received
+frame counts for a port over a period of time:
+
+SELECT ts, value FROM sample_v WHERE switch_wwn='10:00:88:94:71:37:dd:28' AND port='3/23'
+  AND counter='fibrechannel-statistics/in-frames' AND ts BETWEEN 1760000000 AND 1760086400 ORDER BY ts
+
+All the samples from a poll are added with a single batch insert. Use -p to poll continuously.
+
+Data is captured from up to -workers switches at the same time so the time to poll all switches is about the same as
+the time to poll the slowest switch. Each switch is polled into its own project object which is then merged into the
+project object for the poll. Login sessions are kept open between polls. A session is re-established on the next poll if
+an error is encountered.
+
 **Version Control**
 
 +-----------+---------------+---------------------------------------------------------------------------------------+
@@ -47,18 +75,29 @@ of the switch WWN and port number. Note that the switch WWN will always be uniqu
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.5     | xx xxx 2026   | Use brcddb.util.util.get_import_modules to dynamically determined imported libraries. |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.6     | 19 Oct 2026   | Added -db, -p, and -m. Batched SQLite database with WAL journaling. Fixed -fid        |
+|           |               | feedback when not specified. Added -d.                                                |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 19 Oct 2026   | Added -workers. Capture data from multiple switches at the same time. Login sessions  |
+|           |               | are re-used between polls.                                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2023, 2024, 2025, 2026 Jack Consoli'
-__date__ = 'xx xxx 2025'
+__date__ = '19 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Development'
-__version__ = '4.0.5'
+__version__ = '4.0.7'
 
 import os
 import datetime
+import time
+import signal
+import sqlite3
+import threading
+import concurrent.futures
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
 import brcdapi.brcdapi_rest as brcdapi_rest
@@ -69,6 +108,7 @@ import brcddb.brcddb_project as brcddb_project
 import brcddb.brcddb_common as brcddb_common
 import brcddb.api.interface as api_int
 import brcddb.brcddb_port as brcddb_port
+import brcddb.util.copy as brcddb_copy
 
 _DOC_STRING = False  # Should always be False. Prohibits any actual I/O. Only useful for building documentation
 # _STAND_ALONE: True: Executes as a standalone module taking input from the command line. False: Does not automatically
@@ -82,9 +122,21 @@ _input_d = dict(
              'file extension is not assumed.'),
     fid=dict(r=False,
              h='(Optional) CSV list of FIDs to capture logical switch specific data. The default is to automatically '
-               'determine all logical switch FIDs defined in the chassis.')
+               'determine all logical switch FIDs defined in the chassis.'),
+    db=dict(r=False,
+            h='(Optional) Name of SQLite database file. The database and tables are created if they do not exist. '
+              'When omitted, the data is only written to the log.'),
+    p=dict(r=False, t='float', d=0.0,
+           h='(Optional) Poll interval in seconds. The default, 0, captures the data once. Otherwise, the data is '
+             'captured and added to the database every -p seconds until -m polls are complete or Control-C.'),
+    m=dict(r=False, t='int', d=0,
+           h='(Optional) Only meaningful with -p. Maximum number of polls. The default, 0, is no limit.'),
+    workers=dict(r=False, t='int', d=8,
+                 h='(Optional) Maximum number of switches to capture data from at the same time. The default is 8. '
+                   '0 uses one for each switch.'),
 )
 _input_d.update(gen_util.parseargs_log_d.copy())
+_input_d.update(gen_util.parseargs_debug_d.copy())
 
 _kpi_l = (
     # 'running/brocade-fabric/fabric-switch',  Done automatically in brcddb.api.interface._get_chassis()
@@ -96,6 +148,20 @@ _kpi_l = (
     'running/brocade-name-server/fibrechannel-name-server',  # Login data. Used for port description
     # 'running/brocade-ficon/rnid',  # To capture RNID data for FICON (mainframe) environments
 )
+_db_kpi_l = ('fibrechannel', 'fibrechannel-statistics', 'media-rdp')  # Port KPIs added to the database
+
+_db_schema_l = (
+    'CREATE TABLE IF NOT EXISTS switch (switch_id INTEGER PRIMARY KEY, switch_wwn TEXT NOT NULL UNIQUE)',
+    'CREATE TABLE IF NOT EXISTS port (port_id INTEGER PRIMARY KEY, '
+    'switch_id INTEGER NOT NULL REFERENCES switch(switch_id), port TEXT NOT NULL, description TEXT, '
+    'UNIQUE (switch_id, port))',
+    'CREATE TABLE IF NOT EXISTS counter (counter_id INTEGER PRIMARY KEY, counter TEXT NOT NULL UNIQUE)',
+    'CREATE TABLE IF NOT EXISTS sample (port_id INTEGER NOT NULL, counter_id INTEGER NOT NULL, ts INTEGER NOT NULL, '
+    'value NUMERIC, PRIMARY KEY (port_id, counter_id, ts)) WITHOUT ROWID',
+    'CREATE INDEX IF NOT EXISTS sample_ts ON sample (ts)',
+    'CREATE VIEW IF NOT EXISTS sample_v AS SELECT switch.switch_wwn, port.port, counter.counter, sample.ts, '
+    'sample.value FROM sample JOIN port USING (port_id) JOIN switch USING (switch_id) JOIN counter USING (counter_id)',
+)
 
 
 def _db_add(key_0, key_1, key_2, val):
@@ -129,12 +195,134 @@ def _db_add(key_0, key_1, key_2, val):
     brcdapi_log.log('Adding key: ' + '/'.join(key_list) + ', Value: ' + str(val), True)
 
 
-def _add_data_to_db(proj_obj):
-    """Captures data from switch and adds it to the project object
+def _db_open(db_file):
+    """Opens, and creates if necessary, the SQLite database
+
+    :param db_file: Name of the SQLite database file
+    :type db_file: str
+    :return: Database dictionary passed to the other _db_ methods. conn: The database connection. switch_d: Key is the
+             switch WWN. Value is the switch_id. port_d: Key is the switch WWN and port separated by a space. Value is a
+             list, port_id and description. counter_d: Key is the counter. Value is the counter_id.
+    :rtype: dict
+    """
+    global _db_schema_l
+
+    conn = sqlite3.connect(db_file)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    with conn:
+        for sql in _db_schema_l:
+            conn.execute(sql)
+    return dict(conn=conn, switch_d=dict(), port_d=dict(), counter_d=dict())
+
+
+def _db_id(db_d, cache_key, insert_sql, select_sql, param_l):
+    """Returns the ID for a row in the switch, port, or counter table. The row is added if it doesn't exist.
+
+    :param db_d: Database dictionary returned from _db_open()
+    :type db_d: dict
+    :param cache_key: The dictionary in db_d where IDs are cached. switch_d or counter_d
+    :type cache_key: str
+    :param insert_sql: SQL to insert the row. The insert is ignored if the row already exists.
+    :type insert_sql: str
+    :param select_sql: SQL to read the ID
+    :type select_sql: str
+    :param param_l: Parameters for insert_sql and select_sql. The first parameter is used as the key in cache_key.
+    :type param_l: list, tuple
+    :return: The row ID
+    :rtype: int
+    """
+    row_id = db_d[cache_key].get(param_l[0])
+    if row_id is None:
+        db_d['conn'].execute(insert_sql, param_l)
+        row_id = db_d['conn'].execute(select_sql, param_l).fetchone()[0]
+        db_d[cache_key][param_l[0]] = row_id
+    return row_id
+
+
+def _db_port_id(db_d, switch_wwn, port_num, port_desc):
+    """Returns the port_id for a port. The port is added, or the description updated, if necessary.
+
+    :param db_d: Database dictionary returned from _db_open()
+    :type db_d: dict
+    :param switch_wwn: Switch WWN
+    :type switch_wwn: str
+    :param port_num: Port number in s/p notation
+    :type port_num: str
+    :param port_desc: Description of what is attached to the port
+    :type port_desc: str
+    :return: The port_id
+    :rtype: int
+    """
+    conn, key = db_d['conn'], switch_wwn + ' ' + port_num
+    port_l = db_d['port_d'].get(key)
+    if port_l is None:
+        switch_id = _db_id(db_d,
+                           'switch_d',
+                           'INSERT OR IGNORE INTO switch (switch_wwn) VALUES (?)',
+                           'SELECT switch_id FROM switch WHERE switch_wwn=?',
+                           (switch_wwn,))
+        conn.execute('INSERT OR IGNORE INTO port (switch_id, port) VALUES (?, ?)', (switch_id, port_num))
+        port_l = list(conn.execute('SELECT port_id, description FROM port WHERE switch_id=? AND port=?',
+                                   (switch_id, port_num)).fetchone())
+        db_d['port_d'][key] = port_l
+    if port_l[1] != port_desc:  # Only update the description when what's attached changes.
+        conn.execute('UPDATE port SET description=? WHERE port_id=?', (port_desc, port_l[0]))
+        port_l[1] = port_desc
+    return port_l[0]
+
+
+def _db_add_batch(proj_obj, db_d):
+    """Adds the port data for all switches in the project to the SQLite database in a single batch
+
+    :param proj_obj: The project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param db_d: Database dictionary returned from _db_open()
+    :type db_d: dict
+    :return: Number of samples added
+    :rtype: int
+    """
+    global _db_kpi_l
+
+    conn, row_l, poll_time = db_d['conn'], list(), int(time.time())
+    with conn:  # A single transaction for all the data in the poll
+        for switch_obj in proj_obj.r_switch_objects():
+            switch_wwn = switch_obj.r_obj_key()
+            for port_obj in switch_obj.r_port_objects():
+                port_desc = brcddb_port.port_best_desc(port_obj)
+                port_id = _db_port_id(db_d, switch_wwn, port_obj.r_obj_key(), port_desc)
+                ts = port_obj.r_get('fibrechannel-statistics/time-generated')
+                ts = poll_time if ts is None else ts
+                for kpi in _db_kpi_l:
+                    d = port_obj.r_get(kpi)
+                    if isinstance(d, dict):  # It could be None if no ports or no SFPs in the logical switch
+                        for k, v in d.items():
+                            if k != 'time-generated' and isinstance(v, (int, float)):  # bool is a subtype of int
+                                counter_id = _db_id(db_d,
+                                                    'counter_d',
+                                                    'INSERT OR IGNORE INTO counter (counter) VALUES (?)',
+                                                    'SELECT counter_id FROM counter WHERE counter=?',
+                                                    (kpi + '/' + k,))
+                                row_l.append((port_id, counter_id, ts, v))
+        conn.executemany('INSERT OR REPLACE INTO sample (port_id, counter_id, ts, value) VALUES (?, ?, ?, ?)', row_l)
+
+    return len(row_l)
+
+
+def _add_data_to_db(proj_obj, db_d=None):
+    """Adds the captured data in the project object to the database
 
     :param proj_obj: The project object
     :type proj_obj: brcddb.classes.project.ProjectObj
+    :param db_d: Database dictionary returned from _db_open(). If None, _db_add() is called for each leaf.
+    :type db_d: dict, None
     """
+    global _db_kpi_l
+
+    if db_d is not None:
+        brcdapi_log.log('Added ' + str(_db_add_batch(proj_obj, db_d)) + ' samples', echo=True)
+        return
+
     for switch_obj in proj_obj.r_switch_objects():
         switch_wwn = switch_obj.r_obj_key()
         for port_obj in switch_obj.r_port_objects():
@@ -145,7 +333,7 @@ def _add_data_to_db(proj_obj):
             port_desc = port_obj.r_obj_key() + ' ' + port_desc
             _db_add(switch_wwn, port_num, '_description', port_desc)
             # Now add all the individual port configuration parameters, statistics, and SFP info.
-            for kpi in ('fibrechannel', 'fibrechannel-statistics', 'media-rdp'):
+            for kpi in _db_kpi_l:
                 d = port_obj.r_get(kpi)
                 if isinstance(d, dict):  # It could be None if no ports or no SFPs in the logical switch
                     for k, v in d.items():
@@ -154,8 +342,29 @@ def _add_data_to_db(proj_obj):
                             _db_add(switch_wwn, port_num, k, v)
 
 
-def _capture_data(proj_obj, kpi_l, fid_l, user_id, pw, ip_addr, sec):
-    """Captures data from switch and adds it to the project object
+def _logout(switch_d):
+    """Logs out of a switch if there is an active session
+
+    :param switch_d: Switch dictionary as returned from _parse_login_credentials()
+    :type switch_d: dict
+    :return: Status code
+    :rtype: int
+    """
+    session, switch_d['session'] = switch_d.get('session'), None
+    if session is not None:
+        obj = brcdapi_rest.logout(session)
+        if fos_auth.is_error(obj):
+            brcdapi_log.log(fos_auth.formatted_error_msg(obj), True)
+            return brcddb_common.EXIT_STATUS_API_ERROR
+
+    return brcddb_common.EXIT_STATUS_OK
+
+
+def _capture_data(proj_obj, kpi_l, fid_l, switch_d, lock):
+    """Captures data from switch and adds it to the project object. Intended to be called from a worker thread.
+
+    The data is captured into a project object used only by this thread. The captured data is then copied into proj_obj
+    while holding lock so that the switch requests, which is where all the time is spent, are done in parallel.
 
     :param proj_obj: The project object
     :type proj_obj: brcddb.classes.project.ProjectObj
@@ -163,34 +372,35 @@ def _capture_data(proj_obj, kpi_l, fid_l, user_id, pw, ip_addr, sec):
     :type kpi_l: list, tuple
     :param fid_l: FID, or list of FIDs for logical switch level requests. If None, execute requests for all FIDs.
     :type fid_l: int, list, tuple, None
-    :param user_id: User ID
-    :type user_id: str
-    :param pw: Password
-    :type pw: str
-    :param ip_addr: IP address
-    :type ip_addr: str
-    :param sec: If 'CA' or 'self', uses https to login. Otherwise, http.
-    :type sec: None, str
+    :param switch_d: Switch dictionary as returned from _parse_login_credentials(). The session is added to the key
+                     'session' and is re-used on the next poll.
+    :type switch_d: dict
+    :param lock: Lock for proj_obj
+    :type lock: threading.Lock
     :return: Status code
     :type: int
     """
-    # Login
-    session = api_int.login(user_id, pw, ip_addr, sec, proj_obj)
-    if fos_auth.is_error(session):
-        return brcddb_common.EXIT_STATUS_API_ERROR  # api_int.login() prints the error message detail.
-
     ec = brcddb_common.EXIT_STATUS_OK
+    switch_proj_obj = brcddb_project.new(switch_d['ip'], datetime.datetime.now().strftime('%d %b %Y %H:%M:%S'))
+
+    # Login, if not already logged in from a previous poll
+    if switch_d.get('session') is None:
+        session = api_int.login(switch_d['id'], switch_d['pw'], switch_d['ip'], switch_d['sec'], switch_proj_obj)
+        if fos_auth.is_error(session):
+            return brcddb_common.EXIT_STATUS_API_ERROR  # api_int.login() prints the error message detail.
+        switch_d['session'] = session
 
     # Capture the data
-    api_int.get_batch(session, proj_obj, kpi_l, fid_l)
-    if proj_obj.r_is_any_error():
-        brcdapi_log.log('Errors encountered. Search the log for "ERROR:".', True)
+    api_int.get_batch(switch_d['session'], switch_proj_obj, kpi_l, fid_l)
+    if switch_proj_obj.r_is_any_error():
+        brcdapi_log.log('Errors encountered polling ' + switch_d['ip'] + '. Search the log for "ERROR:".', True)
+        ec = _logout(switch_d)  # The session may have timed out. Login again on the next poll.
 
-    # Logout
-    obj = brcdapi_rest.logout(session)
-    if fos_auth.is_error(obj):
-        brcdapi_log.log(fos_auth.formatted_error_msg(obj), True)
-        ec = brcddb_common.EXIT_STATUS_API_ERROR
+    # Add the captured data to the project
+    plain_copy = dict()
+    brcddb_copy.brcddb_to_plain_copy(switch_proj_obj, plain_copy)
+    with lock:
+        brcddb_copy.plain_copy_to_brcddb(plain_copy, proj_obj)
 
     return ec
 
@@ -218,37 +428,79 @@ def _parse_login_credentials(in_file):
     return rl
 
 
-def pseudo_main(in_file, fid_l):
+def pseudo_main(in_file, fid_l, db_file=None, poll=0.0, max_polls=0, workers=None):
     """Basically the main(). Did it this way so that it can easily be used as a standalone module or called externally.
 
     :param in_file: Name of login credentials file
     :type in_file: str
     :param fid_l: FIDs to collect statistics from
     :type fid_l: list, None
+    :param db_file: Name of the SQLite database file. If None, the data is logged. See _db_add()
+    :type db_file: str, None
+    :param poll: Poll interval in seconds. If 0, the data is captured once.
+    :type poll: float
+    :param max_polls: Maximum number of polls. 0 means poll until Control-C. Ignored if poll is 0.
+    :type max_polls: int
+    :param workers: Maximum number of switches to capture data from at the same time. None is one for each switch.
+    :type workers: int, None
     :return: Exit code
     :rtype: int
     """
     global _kpi_l
-    
+
     # Read the file with the login credentials
     switch_list = _parse_login_credentials(in_file)
 
-    # Create a project object
-    proj_obj = brcddb_project.new("Captured_data", datetime.datetime.now().strftime('%d %b %Y %H:%M:%S'))
-
-    # Poll all the switches
-    ec_l = list()
-    for switch in switch_list:  # Collect the data for each switch
-        ec_l.append(_capture_data(proj_obj, _kpi_l, fid_l, switch['id'], switch['pw'], switch['ip'], switch['sec']))
-
-    # Build cross-references. This associates name server logins with a physical port. It is necessary in this example
-    # because what is attached to the port is used as the port description added to the database.
-    brcdapi_log.log('Building cross references', True)
-    brcddb_project.build_xref(proj_obj)
-
-    # Add the data to your database
-    brcdapi_log.log('Adding data to database', True)
-    _add_data_to_db(proj_obj)
+    # Open the database
+    db_d = None
+    if db_file is not None:
+        try:
+            db_d = _db_open(db_file)
+        except sqlite3.Error as e:
+            brcdapi_log.log('Error opening ' + db_file + ': ' + str(e), echo=True)
+            return brcddb_common.EXIT_STATUS_ERROR
+
+    signal.signal(signal.SIGINT, brcdapi_rest.control_c)
+    ec_l, poll_count, lock = list(), 0, threading.Lock()
+    workers = max(1, len(switch_list)) if workers is None else workers
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    try:
+        while True:
+            last_poll_time = time.time()
+
+            # Create a project object. A new one is created for each poll so data doesn't accumulate.
+            proj_obj = brcddb_project.new("Captured_data", datetime.datetime.now().strftime('%d %b %Y %H:%M:%S'))
+
+            # Poll all the switches
+            future_l = [executor.submit(_capture_data, proj_obj, _kpi_l, fid_l, switch_d, lock)
+                        for switch_d in switch_list]
+            ec_l.extend([future.result() for future in future_l])
+
+            # Build cross-references. This associates name server logins with a physical port. It is necessary in
+            # this example because what is attached to the port is used as the port description added to the database.
+            brcdapi_log.log('Building cross references', True)
+            brcddb_project.build_xref(proj_obj)
+
+            # Add the data to your database
+            brcdapi_log.log('Adding data to database', True)
+            _add_data_to_db(proj_obj, db_d)
+
+            # Are we done?
+            poll_count += 1
+            if poll <= 0 or (0 < max_polls <= poll_count):
+                break
+            time.sleep(max(0.0, poll - (time.time() - last_poll_time)))
+
+    except KeyboardInterrupt:
+        brcdapi_log.log('Control-C. Terminating data collection.', echo=True)
+    except sqlite3.Error as e:
+        brcdapi_log.log('Database error: ' + str(e), echo=True)
+        ec_l.append(brcddb_common.EXIT_STATUS_ERROR)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        ec_l.extend([_logout(switch_d) for switch_d in switch_list])
+        if db_d is not None:
+            db_d['conn'].close()
 
     # Return the first error status encountered
     for ec in ec_l:
@@ -275,6 +527,7 @@ def _get_input():
     args_d = gen_util.get_input(buf, _input_d)
 
     # Set up logging
+    brcdapi_rest.verbose_debug(args_d['d'])
     brcdapi_log.open_log(
         folder=args_d['log'],
         suppress=args_d['sup'],
@@ -288,11 +541,27 @@ def _get_input():
     if len(args_fid_help) > 0:
         ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
 
+    # Are the poll interval and number of polls valid?
+    args_p_help, args_m_help, args_workers_help = '', '', ''
+    if args_d['p'] < 0:
+        args_p_help = ' **ERROR**: Must be >= 0'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    if args_d['m'] < 0:
+        args_m_help = ' **ERROR**: Must be >= 0'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+    if args_d['workers'] < 0:
+        args_workers_help = ' **ERROR**: Must be >= 0'
+        ec = brcddb_common.EXIT_STATUS_INPUT_ERROR
+
     # Command line feedback
     ml = [
         os.path.basename(__file__) + ', ' + __version__,
         'Login credentials file, -i: ' + args_d['i'],
-        'Fabric ID, -fid:            ' + args_d['fid'],
+        'Fabric ID, -fid:            ' + str(args_d['fid']) + args_fid_help,
+        'Database, -db:              ' + str(args_d['db']),
+        'Poll interval, -p:          ' + str(args_d['p']) + args_p_help,
+        'Maximum polls, -m:          ' + str(args_d['m']) + args_m_help,
+        'Workers, -workers:          ' + str(args_d['workers']) + args_workers_help,
         'Log, -log:                  ' + str(args_d['log']),
         'No log, -nl:                ' + str(args_d['nl']),
         'Debug, -d:                  ' + str(args_d['d']),
@@ -302,7 +571,12 @@ def _get_input():
     brcdapi_log.log(ml, echo=True)
 
     return ec if ec != brcddb_common.EXIT_STATUS_OK else \
-        pseudo_main(brcdapi_file.full_file_name(args_d['i'], '.json'), args_fid_l)
+        pseudo_main(brcdapi_file.full_file_name(args_d['i'], '.json'),
+                    args_fid_l,
+                    args_d['db'],
+                    args_d['p'],
+                    args_d['m'],
+                    None if args_d['workers'] == 0 else args_d['workers'])
 
 
 ###################################################################
@@ -0,0 +1,293 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Copyright 2026 Jack Consoli.  All rights reserved.
+
+**License**
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+the License. You may also obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
+language governing permissions and limitations under the License.
+
+The license is free for single customer use (internal applications). Use of this module in the production,
+redistribution, or service delivery for commerce requires an additional license. Contact jack_consoli@yahoo.com for
+details.
+
+**Description**
+
+Reads a project and builds the cross-references. Used by the applications that support -xref_cache. This module is not
+intended to be run from the command line.
+
+Building the cross-references for a large project can take longer than the rest of the processing. When a cache folder
+is specified, the project object, after building the cross-references, is pickled to a cache file in that folder. The
+next time the same project file is read, the cached project is used instead.
+
+Loading a pickle can execute code so a cache file is authenticated before anything in it is unpickled. The first line of
+a cache file is a JSON header with the SHA-256 of the project file, the cache file format version, the Python version,
+the brcddb version, and an HMAC-SHA256 of the header and the pickled project. The HMAC key is generated the first time a
+cache folder is used and is stored in the cache folder, readable only by the user who created it. A cache file is only
+unpickled when the header matches the project file and the HMAC is valid. Otherwise, the project is read and the cache
+file is written again.
+
+**Public Methods**
+
++-----------------------+-------------------------------------------------------------------------------------------+
+| Method                | Description                                                                               |
++=======================+===========================================================================================+
+| file_hash             | Returns the SHA-256 digest of a file                                                      |
++-----------------------+-------------------------------------------------------------------------------------------+
+| parseargs_d           | Input parameter definition for -xref_cache. Add to _input_d.                              |
++-----------------------+-------------------------------------------------------------------------------------------+
+| read_project          | Reads a project and builds the cross-references. Uses the cache when specified.           |
++-----------------------+-------------------------------------------------------------------------------------------+
+
+**Version Control**
+
++-----------+---------------+---------------------------------------------------------------------------------------+
+| Version   | Last Edit     | Description                                                                           |
++===========+===============+=======================================================================================+
+| 1.0.0     | 19 Oct 2026   | Initial launch.                                                                       |
++-----------+---------------+---------------------------------------------------------------------------------------+
+"""
+__author__ = 'Jack Consoli'
+__copyright__ = 'Copyright 2026 Jack Consoli'
+__date__ = '19 Oct 2026'
+__license__ = 'Apache License, Version 2.0'
+__email__ = 'jack_consoli@yahoo.com'
+__maintainer__ = 'Jack Consoli'
+__status__ = 'Released'
+__version__ = '1.0.0'
+
+import os
+import sys
+import json
+import hmac
+import hashlib
+import pickle
+import secrets
+import brcdapi.log as brcdapi_log
+import brcddb.brcddb_project as brcddb_project
+
+_CACHE_VERSION = 2  # Increment when the content of the cache files changes
+_KEY_FILE = 'xref_cache.key'  # Name of the file in the cache folder with the HMAC key
+_MAX_HEADER = 4096  # The header is well under this. Just a sanity check so a bad file isn't read into memory as a line
+
+parseargs_d = dict(
+    xref_cache=dict(r=False,
+                    h='Optional. Name of a folder for cached projects. When specified, the project, after building the '
+                      'cross-references, is saved in this folder and used the next time the same project file is '
+                      'read. The folder is created if it does not exist. By default, nothing is cached.'),
+)
+
+
+def file_hash(file):
+    """Returns the SHA-256 digest of a file. The file is read in 1 MB chunks.
+
+    :param file: Name of file to hash
+    :type file: str
+    :return: Hex digest
+    :rtype: str
+    """
+    h = hashlib.sha256()
+    with open(file, 'rb') as f:
+        for buf in iter(lambda: f.read(1048576), b''):
+            h.update(buf)
+    return h.hexdigest()
+
+
+def _cache_file(file, cache_folder, cs):
+    """Returns the name of the cache file for a project file.
+
+    A hash of the full path of the project file is included in the name so that project files with the same name in
+    different folders don't overwrite each other.
+
+    :param file: Name of the project file
+    :type file: str
+    :param cache_folder: Name of the cache folder
+    :type cache_folder: str
+    :param cs: If True, custom search terms are included in the cached project
+    :type cs: bool
+    :return: Cache file name
+    :rtype: str
+    """
+    base = os.path.basename(file)
+    base = base[:len(base) - len('.json')] if base.lower().endswith('.json') else base
+    path_hash = hashlib.sha256(os.path.abspath(file).encode()).hexdigest()[0:16]
+    return cache_folder + '/' + base + '_' + path_hash + ('_xref_cs.pkl' if cs else '_xref.pkl')
+
+
+def _key(cache_folder):
+    """Returns the HMAC key for a cache folder. The cache folder and key are created if they don't exist.
+
+    :param cache_folder: Name of the cache folder
+    :type cache_folder: str
+    :return: HMAC key
+    :rtype: bytes
+    """
+    global _KEY_FILE
+
+    key_file = cache_folder + '/' + _KEY_FILE
+    os.makedirs(cache_folder, exist_ok=True)
+    try:
+        fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(secrets.token_bytes(32))
+    except FileExistsError:
+        pass
+    with open(key_file, 'rb') as f:
+        key = f.read()
+    if len(key) < 32:
+        raise ValueError('Invalid key in ' + key_file)
+
+    return key
+
+
+def _mac(key, header_d, payload):
+    """Returns the HMAC-SHA256 of a cache file header and the pickled project
+
+    :param key: HMAC key. See _key()
+    :type key: bytes
+    :param header_d: Cache file header without the HMAC
+    :type header_d: dict
+    :param payload: Pickled project
+    :type payload: bytes
+    :return: Hex digest
+    :rtype: str
+    """
+    h = hmac.new(key, json.dumps(header_d, sort_keys=True).encode(), hashlib.sha256)
+    h.update(payload)
+    return h.hexdigest()
+
+
+def _read_cache(cache_file, header_d, key):
+    """Reads a project from a cache file. The header is checked, and the HMAC verified, before anything is unpickled.
+
+    :param cache_file: Name of the cache file
+    :type cache_file: str
+    :param header_d: Expected cache file header without the HMAC
+    :type header_d: dict
+    :param key: HMAC key. See _key()
+    :type key: bytes
+    :return: Project object. None if the cache file does not exist, is stale, or is not valid.
+    :rtype: brcddb.classes.project.ProjectObj, None
+    """
+    global _MAX_HEADER
+
+    try:
+        with open(cache_file, 'rb') as f:
+            file_header_d = json.loads(f.readline(_MAX_HEADER).decode())
+            mac = file_header_d.pop('mac', None) if isinstance(file_header_d, dict) else None
+            if file_header_d == header_d and isinstance(mac, str):
+                payload = f.read()
+                if hmac.compare_digest(mac, _mac(key, header_d, payload)):
+                    brcdapi_log.log('Reading cross-referenced project from ' + cache_file, echo=True)
+                    return pickle.loads(payload)
+                brcdapi_log.log('Ignoring ' + cache_file + '. Authentication failed.', echo=True)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, EOFError, AttributeError, ImportError, IndexError, TypeError,
+            pickle.UnpicklingError) as e:
+        brcdapi_log.log(['Ignoring ' + cache_file + '. Exception is:', str(type(e)) + ': ' + str(e)], echo=True)
+
+    return None
+
+
+def _write_cache(proj_obj, cache_file, header_d, key):
+    """Writes a project to a cache file. Not being able to write it is not an error. It just gets built next time.
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param cache_file: Name of the cache file
+    :type cache_file: str
+    :param header_d: Cache file header without the HMAC
+    :type header_d: dict
+    :param key: HMAC key. See _key()
+    :type key: bytes
+    :rtype: None
+    """
+    temp_file = cache_file + '.' + str(os.getpid()) + '.tmp'
+    try:
+        payload = pickle.dumps(proj_obj, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(temp_file, 'wb') as f:
+            f.write((json.dumps(dict(mac=_mac(key, header_d, payload), **header_d)) + '\n').encode())
+            f.write(payload)
+        os.replace(temp_file, cache_file)
+    except (OSError, AttributeError, TypeError, RecursionError, pickle.PicklingError) as e:
+        brcdapi_log.log(['Could not write ' + cache_file + '. Exception is:', str(type(e)) + ': ' + str(e)], echo=True)
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
+
+def _run_stage(stage_f, stage, func, *args):
+    """Runs a stage of read_project()
+
+    :param stage_f: See stage_f in read_project()
+    :type stage_f: collections.abc.Callable, None
+    :param stage: Name of the stage
+    :type stage: str
+    :param func: Method to call
+    :type func: method
+    :param args: Arguments passed to func
+    :type args: any
+    :return: The return value from func
+    :rtype: any
+    """
+    return func(*args) if stage_f is None else stage_f(stage, func, *args)
+
+
+def read_project(file, cache_folder=None, cs=False, stage_f=None):
+    """Reads a project and builds the cross-references. Uses the cached project when it matches the project file.
+
+    :param file: Name of the project file
+    :type file: str
+    :param cache_folder: Name of the folder for cache files. None to always read the project and build the cross-
+                         references without caching.
+    :type cache_folder: str, None
+    :param cs: If True, custom search terms are added after building the cross-references
+    :type cs: bool
+    :param stage_f: Called as stage_f(stage, func, *args) to run each stage, typically to profile each stage. The
+                    stages are read_xref_cache, read, build_xref, custom_search_terms, and write_xref_cache. It must
+                    return the return value of func. None to call each stage directly.
+    :type stage_f: collections.abc.Callable, None
+    :return: Project object. None if there was an error reading the project. See the log for details.
+    :rtype: brcddb.classes.project.ProjectObj, None
+    """
+    global _CACHE_VERSION
+
+    cache_file, header_d, key = None, None, None
+    if cache_folder is not None:
+        cache_file = _cache_file(file, cache_folder, cs)
+        header_d = dict(version=_CACHE_VERSION,
+                        hash=file_hash(file),
+                        cs=bool(cs),
+                        python=list(sys.version_info[0:2]),
+                        brcddb=getattr(brcddb_project, '__version__', None))
+        try:
+            key = _key(cache_folder)
+        except (OSError, ValueError) as e:
+            buf = 'Not using the cache in ' + cache_folder + '. Exception is:'
+            brcdapi_log.log([buf, str(type(e)) + ': ' + str(e)], echo=True)
+
+    # Use the cached project if the header matches and the HMAC is valid
+    if key is not None:
+        proj_obj = _run_stage(stage_f, 'read_xref_cache', _read_cache, cache_file, header_d, key)
+        if proj_obj is not None:
+            return proj_obj
+
+    # Read the project and build the cross-references
+    proj_obj = _run_stage(stage_f, 'read', brcddb_project.read_from, file)
+    if proj_obj is None:  # Error messages are sent to the log in brcddb_project.read_from() if proj_obj is None
+        return None
+    brcdapi_log.log('Building cross-references', echo=True)
+    _run_stage(stage_f, 'build_xref', brcddb_project.build_xref, proj_obj)
+    if cs:
+        _run_stage(stage_f, 'custom_search_terms', brcddb_project.add_custom_search_terms, proj_obj)
+    if key is not None:
+        _run_stage(stage_f, 'write_xref_cache', _write_cache, proj_obj, cache_file, header_d, key)
+
+    return proj_obj
@@ -137,15 +137,17 @@ _tracking_d: Used for error reporting as follows:
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.1.2     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 19 Oct 2026   | Added -xref_cache to cache cross-referenced projects. See xref_cache.py               |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '19 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.1.2'
+__version__ = '4.1.3'
 
 import collections
 import sys
@@ -169,6 +171,7 @@ import brcddb.brcddb_login as brcddb_login
 import brcddb.api.interface as api_int
 import brcddb.api.zone as api_zone
 import brcddb.util.obj_convert as obj_convert
+import xref_cache
 
 _DOC_STRING = False  # Should always be False. Prohibits any actual I/O. Only useful for building documentation
 # _STAND_ALONE: True: Executes as a standalone module taking input from the command line. False: Does not automatically
@@ -207,6 +210,7 @@ _input_d['strict'] = dict(
       'zone that doesn\'t exist. The determination of a warning vs. an error is done on a row-by-row basis. Not all '
       'errors that are inconsequential will be treated as warnings. For example, when creating a zone that already '
       'exists, other rows are not examined to see if has the same members, so it will always be an error.')
+_input_d.update(xref_cache.parseargs_d.copy())
 _input_d.update(gen_util.parseargs_scan_d.copy())
 _input_d.update(gen_util.parseargs_eh_d.copy())
 _input_d.update(gen_util.parseargs_log_d.copy())
@@ -1726,7 +1730,7 @@ def _summary_report(fab_obj, args_d, saved, cli_el):
     brcdapi_log.log(summary_l, echo=True)
 
 
-def pseudo_main(args_d, fab_obj, zone_wb_l):
+def pseudo_main(args_d, fab_obj, zone_wb_l, xref=True):
     """Basically the main().
 
     :param args_d: Input arguments. See _input_d for details.
@@ -1735,6 +1739,8 @@ def pseudo_main(args_d, fab_obj, zone_wb_l):
     :type fab_obj: None, brcddb.classes.fabric.FabricObj
     :param zone_wb_l: Output of _parse_zone_workbook() - List of actions to take
     :type zone_wb_l: list
+    :param xref: If True, build the cross-references and add the custom search terms. Always done if fab_obj is None
+    :type xref: bool
     :return: Exit code
     :rtype: int
     """
@@ -1747,11 +1753,13 @@ def pseudo_main(args_d, fab_obj, zone_wb_l):
     # Get the project object
     if fab_obj is None:
         session, fab_obj = _get_fabric(args_d)
+        xref = True
     if fab_obj is not None:
         proj_obj = fab_obj.r_project_obj()
         # Perform all pre-processing (build cross-references, add search terms, and build effective zone tables)
-        brcddb_project.build_xref(proj_obj)
-        brcddb_project.add_custom_search_terms(proj_obj)
+        if xref:
+            brcddb_project.build_xref(proj_obj)
+            brcddb_project.add_custom_search_terms(proj_obj)
         for zone_obj in fab_obj.r_eff_zone_objects():
             _eff_zone_l.append(zone_obj.r_obj_key())
             _eff_mem_l.extend(zone_obj.r_members() + zone_obj.r_pmembers())
@@ -1909,7 +1917,7 @@ def _get_input():
     # If a file name was specified, read the project object from the file.
     if isinstance(args_d['i'], str):
         try:
-            proj_obj = brcddb_project.read_from(args_d['i'])
+            proj_obj = xref_cache.read_project(args_d['i'], args_d['xref_cache'], cs=True)
             if proj_obj is None:
                 args_help_d['i'] += ' **ERROR** ' if len(args_help_d['i']) == 0 else ', '
                 args_help_d['i'] += 'Unknown error. Typical of a non-JSON formatted project file.'
@@ -1995,6 +2003,7 @@ def _get_input():
         'Fabric ID (FID), -fid:    ' + str(args_d['fid']) + args_help_d['fid'],
         'Input file, -i:           ' + str(args_d['i']) + args_help_d['i'],
         'Fabric WWN, -wwn:         ' + str(args_d['wwn']) + args_help_d['wwn'],
+        'Xref cache, -xref_cache:  ' + str(args_d['xref_cache']),
         'Zone workbook, -z:        ' + str(args_d['z']) + args_help_d['z'],
         'Zone worksheet, -sheet:   ' + str(args_d['sheet']) + args_help_d['sheet'],
         'Activate, -a:             ' + str(args_d['a']),
@@ -2016,7 +2025,7 @@ def _get_input():
     
     if isinstance(args_d['i'], str):
         args_d['a'] = False  # We're not connected to a real switch so force the zone configuration activation to False
-    return ec if ec != brcddb_common.EXIT_STATUS_OK else pseudo_main(args_d, fab_obj, zone_wb_l)
+    return ec if ec != brcddb_common.EXIT_STATUS_OK else pseudo_main(args_d, fab_obj, zone_wb_l, xref=False)
 
 
 ###################################################################